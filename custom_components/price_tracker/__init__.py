@@ -3,17 +3,45 @@ from __future__ import annotations
 import asyncio
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers import (
+    config_validation as cv,
     device_registry as dr,
     entity_registry as er,
 )
 
+from custom_components.price_tracker.components.coordinator import (
+    async_remove_coordinator,
+)
+from custom_components.price_tracker.components.history_store import (
+    async_close_history_store,
+    async_open_history_store,
+    get_history_store,
+)
 from custom_components.price_tracker.components.id import IdGenerator
+from custom_components.price_tracker.components.scheduler import (
+    DEFAULT_WARM_START_WINDOW,
+    async_stop_refresh_scheduler,
+    refresh_scheduler,
+)
 from custom_components.price_tracker.consts.confs import (
     CONF_ITEM_DEVICE_ID,
     CONF_ITEM_UNIQUE_ID,
+    CONF_REQUEST_RATE_LIMIT,
+    CONF_REQUEST_RATE_BURST,
+    CONF_REQUEST_CONCURRENCY,
+    CONF_MAX_CONCURRENCY,
+    CONF_WARM_START_WINDOW,
+    CONF_HTML_BACKEND,
 )
 from custom_components.price_tracker.consts.defaults import DOMAIN, PLATFORMS
 from custom_components.price_tracker.services.factory import (
@@ -22,16 +50,117 @@ from custom_components.price_tracker.services.factory import (
     create_service_device_parser_and_parse,
     has_service_item_target_parser,
 )
+from custom_components.price_tracker.services.smartstore.session import (
+    smartstore_warm_states,
+)
+from custom_components.price_tracker.utilities.concurrency import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_SERVICE_CONCURRENCY,
+    load_limiter,
+)
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.parser import (
+    HTML_BACKEND_AUTO,
+    HTML_BACKENDS,
+    set_html_backend,
+)
+from custom_components.price_tracker.utilities.proxy import remove_proxy_manager
+from custom_components.price_tracker.utilities.rate_limit import (
+    DEFAULT_RATE,
+    DEFAULT_BURST,
+    rate_limiter,
+)
+from custom_components.price_tracker.utilities.response_cache import response_cache
+from custom_components.price_tracker.utilities.session_pool import (
+    async_close_session_pool,
+)
+from custom_components.price_tracker.utilities.token_cache import token_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_CONCURRENCY, default=DEFAULT_CONCURRENCY
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_WARM_START_WINDOW, default=DEFAULT_WARM_START_WINDOW
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Optional(CONF_HTML_BACKEND, default=HTML_BACKEND_AUTO): vol.In(
+                    [HTML_BACKEND_AUTO] + HTML_BACKENDS
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+SERVICE_GET_PRICE_HISTORY = "get_price_history"
+SERVICE_GET_PRICE_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("limit"): cv.positive_int,
+        vol.Optional("aggregate", default=False): cv.boolean,
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the price tracker component."""
     _LOGGER.debug("Setting up price tracker component {}".format(config))
     hass.data.setdefault(DOMAIN, {})
 
+    # Global cap on concurrent engine loads (configuration.yaml)
+    load_limiter().configure(
+        Lu.get_or_default(
+            config.get(DOMAIN, {}), CONF_MAX_CONCURRENCY, DEFAULT_CONCURRENCY
+        )
+    )
+
+    async def get_price_history(call: ServiceCall) -> ServiceResponse:
+        store = get_history_store()
+        entity = er.async_get(hass).async_get(call.data[ATTR_ENTITY_ID])
+
+        if store is None or entity is None or entity.platform != DOMAIN:
+            return {"samples": []}
+
+        start = call.data.get("start")
+        end = call.data.get("end")
+        args = {
+            "item_id": entity.unique_id,
+            "start": start.timestamp() if start is not None else None,
+            "end": end.timestamp() if end is not None else None,
+        }
+
+        if call.data["aggregate"]:
+            return await store.async_aggregate(**args)
+
+        return {
+            "samples": await store.async_range(**args, limit=call.data.get("limit"))
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PRICE_HISTORY,
+        get_price_history,
+        schema=SERVICE_GET_PRICE_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    # Overdue refreshes of restored items are spread over this window (seconds)
+    refresh_scheduler().warm_start_window = Lu.get_or_default(
+        config.get(DOMAIN, {}), CONF_WARM_START_WINDOW, DEFAULT_WARM_START_WINDOW
+    )
+
+    # BeautifulSoup tree builder for HTML parsers; pin one to compare backends
+    set_html_backend(
+        Lu.get_or_default(config.get(DOMAIN, {}), CONF_HTML_BACKEND, HTML_BACKEND_AUTO)
+    )
+
     return True
 
 
@@ -114,6 +243,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     entry.async_on_unload(listeners)
 
+    # Every sensor of this entry shares one token bucket (keyed by engine code)
+    rate_limiter().configure(
+        key=entry.data["type"],
+        rate=float(Lu.get_or_default(data, CONF_REQUEST_RATE_LIMIT, DEFAULT_RATE)),
+        burst=int(Lu.get_or_default(data, CONF_REQUEST_RATE_BURST, DEFAULT_BURST)),
+    )
+    load_limiter().configure_service(
+        key=entry.data["type"],
+        limit=int(
+            Lu.get_or_default(
+                data, CONF_REQUEST_CONCURRENCY, DEFAULT_SERVICE_CONCURRENCY
+            )
+        ),
+    )
+
+    # Price samples go to an integration-owned SQLite store, not the recorder
+    try:
+        await async_open_history_store(hass.config.path(f"{DOMAIN}_history.db"))
+    except Exception as e:
+        _LOGGER.warning("Price history is not recorded, failed to open it %s", e)
+
     entity_registry = er.async_get(hass)
     entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
     for e in entities:
@@ -142,6 +292,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        remove_proxy_manager(entry.entry_id)
+        await async_remove_coordinator(entry.entry_id)
+
+        # The session pool is shared by every entry; release it with the last one
+        if not hass.data[DOMAIN]:
+            await async_stop_refresh_scheduler()
+            await async_close_history_store()
+            await async_close_session_pool()
+            response_cache().clear()
+            token_cache().clear()
+            smartstore_warm_states().clear()
 
     return unload_ok
 
@@ -0,0 +1,25 @@
+from homeassistant import config_entries, core
+
+from .components.binary_sensor import PriceTrackerCircuitBreakerSensor
+from .consts.confs import CONF_TYPE
+from .consts.defaults import DOMAIN
+from .services.factory import create_service_engine
+from .utilities.circuit_breaker import circuit_breaker
+
+
+async def async_setup_entry(
+    hass: core.HomeAssistant,
+    config_entry: config_entries.ConfigEntry,
+    async_add_entities,
+):
+    type = hass.data[DOMAIN][config_entry.entry_id][CONF_TYPE]
+
+    async_add_entities(
+        [
+            PriceTrackerCircuitBreakerSensor(
+                breaker=circuit_breaker(type),
+                service_type=type,
+                service_name=create_service_engine(type).engine_name(),
+            )
+        ]
+    )
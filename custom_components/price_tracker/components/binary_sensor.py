@@ -0,0 +1,41 @@
+import logging
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.const import EntityCategory
+
+from custom_components.price_tracker.components.id import IdGenerator
+from custom_components.price_tracker.utilities.circuit_breaker import CircuitBreaker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PriceTrackerCircuitBreakerSensor(BinarySensorEntity):
+    """On while polling of the service is paused by its circuit breaker."""
+
+    _attr_icon = "mdi:electric-switch"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(self, breaker: CircuitBreaker, service_type: str, service_name: str):
+        self._breaker = breaker
+        self._attr_unique_id = IdGenerator.generate_circuit_breaker_id(service_type)
+        self._attr_name = "{} circuit breaker".format(service_name)
+
+    @property
+    def is_on(self) -> bool:
+        return self._breaker.is_open
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        return {
+            "provider": self._breaker.name,
+            **self._breaker.stats,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._breaker.add_listener(self.async_write_ha_state))
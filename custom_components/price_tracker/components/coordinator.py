@@ -0,0 +1,441 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE
+
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.components.error import DataFetchError
+from custom_components.price_tracker.components.history_store import get_history_store
+from custom_components.price_tracker.components.scheduler import refresh_scheduler
+from custom_components.price_tracker.datas.history import ItemPriceHistory
+from custom_components.price_tracker.datas.item import ItemData, ItemStatus
+from custom_components.price_tracker.datas.price import (
+    ItemPriceChangeData,
+    ItemPriceChangeStatus,
+    create_item_price_change,
+)
+from custom_components.price_tracker.utilities.circuit_breaker import circuit_breaker
+from custom_components.price_tracker.utilities.single_flight import single_flight
+
+_LOGGER = logging.getLogger(__name__)
+
+_RETRY_INTERVAL = 60  # seconds, after a failed load
+DEFAULT_MAX_STALENESS = 6  # hours
+_BATCH_WINDOW = 0.25  # seconds to collect due items into one load_many call
+
+
+class PriceTrackerItem:
+    """Fetch state of one tracked item."""
+
+    def __init__(
+        self,
+        key: str,
+        engine: PriceEngine,
+        refresh_period: int,
+        max_staleness: int = DEFAULT_MAX_STALENESS,
+        adaptive: bool = False,
+        min_refresh_period: int | None = None,
+        max_refresh_period: int | None = None,
+    ):
+        self.key = key
+        self.engine = engine
+        self.refresh_period = refresh_period  # minutes
+        self.max_staleness = max_staleness  # hours
+        # Adaptive mode moves the interval between the bounds as prices move
+        self.adaptive = adaptive
+        self.min_refresh_period = min(
+            refresh_period, min_refresh_period or refresh_period
+        )
+        self.max_refresh_period = max(
+            refresh_period, max_refresh_period or refresh_period
+        )
+        self.interval: float = refresh_period  # minutes, current
+        self.history = ItemPriceHistory()
+        self.item_data: ItemData | None = None
+        self.price_change: ItemPriceChangeData = create_item_price_change(
+            updated_at=datetime.now(),
+            period_hour=refresh_period,
+        )
+        self.updated_at: datetime | None = None
+        # Last successful load; the served data is this old
+        self.fetched_at: datetime | None = None
+        self.available = True
+        self.engine_status = True
+        # Bumped on every successful load so views know when to re-render
+        self.revision = 0
+
+    @property
+    def age_seconds(self) -> int | None:
+        if self.fetched_at is None:
+            return None
+
+        return int((datetime.now() - self.fetched_at).total_seconds())
+
+    @property
+    def stale(self) -> bool:
+        """Served data is older than one refresh period, or its last refresh failed"""
+        return (
+            not self.engine_status
+            or self.age_seconds is None
+            or self.age_seconds > self.interval * 60
+        )
+
+    def adapt(self, changed: bool):
+        """Halve the interval after a change, double it while nothing changes"""
+        if not self.adaptive:
+            return
+
+        if changed:
+            self.interval = max(
+                self.min_refresh_period, min(self.interval, self.refresh_period) / 2
+            )
+        else:
+            self.interval = min(self.max_refresh_period, self.interval * 2)
+
+    @property
+    def dict(self) -> dict:
+        return {
+            "key": self.key,
+            "available": self.available,
+            "engine_status": self.engine_status,
+            "updated_at": self.updated_at.isoformat()
+            if self.updated_at is not None
+            else None,
+            "stale": self.stale,
+            "age_seconds": self.age_seconds,
+            "interval": self.interval,
+            "revision": self.revision,
+        }
+
+
+class PriceTrackerCoordinator:
+    """Owns the engines of one config entry and pushes results to its entities."""
+
+    def __init__(self, entry_id: str, service_type: str, debug: bool = False):
+        self.entry_id = entry_id
+        self.service_type = service_type
+        self._debug = debug
+        self._items: dict[str, PriceTrackerItem] = {}
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._pending: list[tuple[PriceEngine, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: set[asyncio.Task] = set()
+        # Futures handed out by _load and not resolved yet
+        self._loading: set[asyncio.Future] = set()
+        self._batched = 0
+        self._closed = False
+
+    def add(
+        self,
+        key: str,
+        engine: PriceEngine,
+        refresh_period: int,
+        max_staleness: int = DEFAULT_MAX_STALENESS,
+        adaptive: bool = False,
+        min_refresh_period: int | None = None,
+        max_refresh_period: int | None = None,
+    ) -> PriceTrackerItem:
+        if key not in self._items:
+            self._items[key] = PriceTrackerItem(
+                key=key,
+                engine=engine,
+                refresh_period=refresh_period,
+                max_staleness=max_staleness,
+                adaptive=adaptive,
+                min_refresh_period=min_refresh_period,
+                max_refresh_period=max_refresh_period,
+            )
+
+        return self._items[key]
+
+    def item(self, key: str) -> Optional[PriceTrackerItem]:
+        return self._items.get(key)
+
+    def async_add_listener(self, key: str, listener: CALLBACK_TYPE) -> Callable:
+        self._listeners.setdefault(key, []).append(listener)
+
+        def remove():
+            if listener in self._listeners.get(key, []):
+                self._listeners[key].remove(listener)
+
+        return remove
+
+    def _notify(self, key: str):
+        for listener in list(self._listeners.get(key, [])):
+            listener()
+
+    def start(self, key: str) -> Callable:
+        """Schedule periodic refreshes of an item; returns a function that stops them"""
+        item = self._items[key]
+        scheduler = refresh_scheduler()
+        last_run_ago = (
+            (datetime.now() - item.fetched_at).total_seconds()
+            if item.fetched_at is not None and item.engine_status
+            else None
+        )
+        remove = scheduler.schedule(
+            key=key,
+            period=item.refresh_period * 60,
+            callback=lambda: self._async_scheduled_refresh(key),
+            last_run_ago=last_run_ago,
+            # Items with restored data are spread out; empty ones load right away
+            jitter=scheduler.warm_start_window if item.item_data is not None else 0,
+        )
+
+        def stop():
+            remove()
+            self._items.pop(key, None)
+            self._listeners.pop(key, None)
+
+        return stop
+
+    def request_refresh(self, key: str) -> bool:
+        """Refresh an item in the background, through the scheduler's workers"""
+        return refresh_scheduler().trigger(key)
+
+    async def _async_scheduled_refresh(self, key: str) -> float | None:
+        await self.async_refresh(key, force=True)
+        item = self._items.get(key)
+
+        if item is None:
+            return None
+
+        # Failed loads are retried sooner than a whole refresh period
+        if not item.engine_status:
+            return _RETRY_INTERVAL
+
+        return item.interval * 60 if item.adaptive else None
+
+    async def async_refresh(self, key: str, force: bool = False):
+        item = self._items.get(key)
+
+        if item is None:
+            return
+
+        await self._async_refresh(item, force)
+        self._notify(key)
+
+    async def _async_refresh(self, item: PriceTrackerItem, force: bool):
+        # Check last updated at
+        if (
+            not force
+            and item.engine_status
+            and item.updated_at is not None
+            and item.available is True
+            and (item.updated_at + timedelta(minutes=item.interval)) > datetime.now()
+        ):
+            _LOGGER.debug(
+                "Skip update cause refresh period. {} -({} / {}).".format(
+                    item.key, item.updated_at, item.interval
+                )
+            )
+            return
+
+        _LOGGER.debug(
+            "Update item: %s (%s) - %s", item.key, item.updated_at, item.available
+        )
+
+        # Ignore deleted item
+        if item.item_data is not None and item.item_data.status == ItemStatus.DELETED:
+            item.available = True
+            item.updated_at = datetime.now()
+            item.fetched_at = item.updated_at
+            return
+
+        # Keep the last known state while the service is failing everywhere
+        breaker = circuit_breaker(item.engine.engine_code())
+        if not breaker.allow():
+            _LOGGER.debug(
+                "Skip update cause circuit breaker is open. {} ({}).".format(
+                    item.key, breaker.stats
+                )
+            )
+            return
+
+        try:
+            # Identical items (other devices, entries or option URLs) share one load
+            data = await single_flight().do(
+                ("engine", item.engine.engine_code(), item.engine.id_str()),
+                lambda: self._load(item.engine),
+            )
+
+            if data is None:
+                breaker.record_failure()
+                self._failed(item)
+                return
+
+            item.price_change = create_item_price_change(
+                updated_at=datetime.now(),
+                period_hour=item.refresh_period,
+                after_price=data.price.price,
+                before_price=item.item_data.price.price
+                if item.item_data is not None
+                else None,
+            )
+            if item.item_data is not None:
+                item.adapt(
+                    item.price_change.status != ItemPriceChangeStatus.NO_CHANGE
+                    or item.item_data.inventory != data.inventory
+                )
+            item.item_data = data
+            item.fetched_at = datetime.now()
+            item.history.append(data.price.price, data.inventory.rank)
+            self._record(item.key, data)
+            item.available = True
+            item.engine_status = True
+            item.revision += 1
+            breaker.record_success()
+        except Exception as e:
+            if self._closed:
+                # Aborted by shutdown; not the service's fault
+                return
+
+            _LOGGER.debug("Failed to load %s %s", item.key, e)
+            breaker.record_failure()
+            self._failed(item)
+        finally:
+            item.updated_at = datetime.now()
+
+    @staticmethod
+    def _record(key: str, data: ItemData):
+        store = get_history_store()
+
+        if store is not None:
+            store.add(
+                item_id=key,
+                price=data.price.price,
+                original_price=data.price.original_price,
+                inventory_rank=data.inventory.rank,
+            )
+
+    def _failed(self, item: PriceTrackerItem):
+        # Keep serving the last good data (marked stale) up to its max staleness
+        item.engine_status = False
+        item.available = not (
+            item.fetched_at is None
+            or item.fetched_at + timedelta(hours=item.max_staleness) < datetime.now()
+            or self._debug
+        )
+
+    async def _load(self, engine: PriceEngine) -> ItemData | None:
+        """Queue a load; items that come due together share one load_many call"""
+        if self._closed:
+            raise DataFetchError("Coordinator {} is shut down".format(self.entry_id))
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((engine, future))
+        self._loading.add(future)
+        future.add_done_callback(self._loading.discard)
+
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                _BATCH_WINDOW, self._flush
+            )
+
+        return await future
+
+    def _flush(self):
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        groups: dict[type, list[tuple[PriceEngine, asyncio.Future]]] = {}
+
+        for engine, future in pending:
+            if not future.done():
+                groups.setdefault(type(engine), []).append((engine, future))
+
+        for engine_type, batch in groups.items():
+            task = asyncio.get_running_loop().create_task(
+                self._load_batch(engine_type, batch)
+            )
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(
+        self,
+        engine_type: type[PriceEngine],
+        batch: list[tuple[PriceEngine, asyncio.Future]],
+    ):
+        self._batched += 1
+
+        try:
+            results = await engine_type.load_many([engine for engine, _ in batch])
+        except Exception as e:
+            results = [e for _ in batch]
+        except BaseException:
+            # Cancelled (shutdown); callers must not wait for these forever
+            self._abort([future for _, future in batch])
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _abort(self, futures: list[asyncio.Future]):
+        for future in futures:
+            if not future.done():
+                future.set_exception(
+                    DataFetchError("Coordinator {} is shut down".format(self.entry_id))
+                )
+
+    async def async_shutdown(self):
+        self._closed = True
+
+        for key in list(self._items.keys()):
+            refresh_scheduler().unschedule(key)
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        self._pending.clear()
+
+        for task in list(self._batches):
+            task.cancel()
+
+        # Fail every load still waited on (queued or in a batch) so the refreshes
+        # awaiting them finish and release their single-flight keys
+        self._abort(list(self._loading))
+
+        self._items.clear()
+        self._listeners.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "items": len(self._items),
+            "available": sum(1 for i in self._items.values() if i.available),
+            "failing": sum(1 for i in self._items.values() if not i.engine_status),
+            "stale": sum(1 for i in self._items.values() if i.stale),
+            "batches": self._batched,
+        }
+
+
+_COORDINATORS: dict[str, PriceTrackerCoordinator] = {}
+
+
+def create_coordinator(
+    entry_id: str, service_type: str, debug: bool = False
+) -> PriceTrackerCoordinator:
+    _COORDINATORS[entry_id] = PriceTrackerCoordinator(
+        entry_id=entry_id, service_type=service_type, debug=debug
+    )
+
+    return _COORDINATORS[entry_id]
+
+
+def get_coordinator(entry_id: str) -> Optional[PriceTrackerCoordinator]:
+    return _COORDINATORS.get(entry_id)
+
+
+async def async_remove_coordinator(entry_id: str):
+    coordinator = _COORDINATORS.pop(entry_id, None)
+
+    if coordinator is not None:
+        await coordinator.async_shutdown()
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 from abc import abstractmethod
+from typing import Awaitable, Callable
 
 from custom_components.price_tracker.datas.item import ItemData
+from custom_components.price_tracker.utilities.concurrency import load_limiter
 from custom_components.price_tracker.utilities.list import Lu
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,6 +19,29 @@ class PriceEngine:
         """Load"""
         pass
 
+    @classmethod
+    async def load_many(
+        cls, engines: list["PriceEngine"]
+    ) -> list[ItemData | None | BaseException]:
+        """Load several items of this service at once; results keep the order of `engines`.
+        Services that can share work across items (auth, cookies, store context) override this."""
+        return await cls.gather(engines, lambda engine: engine.load())
+
+    @staticmethod
+    async def gather(
+        engines: list["PriceEngine"],
+        fn: Callable[["PriceEngine"], Awaitable[ItemData | None]],
+    ) -> list[ItemData | None | BaseException]:
+        """Run fn for every engine, bounded by the shared load limiter"""
+
+        async def run(engine: "PriceEngine"):
+            async with load_limiter().slot(engine.engine_code()):
+                return await fn(engine)
+
+        return await asyncio.gather(
+            *[run(engine) for engine in engines], return_exceptions=True
+        )
+
     @abstractmethod
     def id_str(self) -> str:
         pass
@@ -0,0 +1,246 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from custom_components.price_tracker.utilities.single_flight import single_flight
+
+_LOGGER = logging.getLogger(__name__)
+
+_BATCH_SIZE = 200
+_FLUSH_INTERVAL = 60.0  # seconds
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS price_history (
+        item_id TEXT NOT NULL,
+        ts REAL NOT NULL,
+        price REAL,
+        original_price REAL,
+        inventory_rank INTEGER
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_price_history_item_ts ON price_history (item_id, ts)",
+]
+
+
+class PriceHistoryStore:
+    """Append-only SQLite (WAL) store of price samples, written in batches."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = _BATCH_SIZE,
+        flush_interval: float = _FLUSH_INTERVAL,
+    ):
+        self._path = path
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending: list[tuple] = []
+        self._flushing: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+        self._written = 0
+        self._flushes = 0
+
+    def _open(self):
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+
+        self._connection = connection
+
+    async def async_open(self):
+        await self._run(self._open)
+        self._task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    def add(
+        self,
+        item_id: str,
+        price: float,
+        original_price: Optional[float] = None,
+        inventory_rank: Optional[int] = None,
+        ts: Optional[float] = None,
+    ):
+        self._pending.append(
+            (
+                item_id,
+                ts if ts is not None else time.time(),
+                price,
+                original_price,
+                inventory_rank,
+            )
+        )
+
+        if len(self._pending) >= self._batch_size and (
+            self._flushing is None or self._flushing.done()
+        ):
+            self._flushing = asyncio.get_running_loop().create_task(self.async_flush())
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self._flush_interval)
+
+            try:
+                await self.async_flush()
+            except Exception as e:
+                _LOGGER.warning("Failed to write price history %s", e)
+
+    def _write(self, rows: list[tuple]):
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO price_history VALUES (?, ?, ?, ?, ?)", rows
+                )
+
+    async def async_flush(self):
+        if len(self._pending) == 0 or self._connection is None:
+            return
+
+        rows, self._pending = self._pending, []
+
+        try:
+            await self._run(self._write, rows)
+        except Exception:
+            # Keep the rows for the next flush
+            self._pending = rows + self._pending
+            raise
+
+        self._written += len(rows)
+        self._flushes += 1
+
+    def _query(self, sql: str, args: tuple) -> list[dict]:
+        with self._lock:
+            cursor = self._connection.execute(sql, args)
+            columns = [c[0] for c in cursor.description]
+
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _range(item_id: str, start: Optional[float], end: Optional[float]):
+        return (
+            "item_id = ? AND ts >= ? AND ts <= ?",
+            (
+                item_id,
+                start if start is not None else 0,
+                end if end is not None else time.time(),
+            ),
+        )
+
+    async def async_range(
+        self,
+        item_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict]:
+        """Samples of an item between start and end (unix time), oldest first"""
+        await self.async_flush()
+        where, args = self._range(item_id, start, end)
+
+        return await self._run(
+            self._query,
+            "SELECT ts, price, original_price, inventory_rank FROM price_history "
+            f"WHERE {where} ORDER BY ts LIMIT ?",
+            (*args, limit if limit is not None else -1),
+        )
+
+    async def async_aggregate(
+        self,
+        item_id: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> dict:
+        """min/max/avg/count of an item's price between start and end (unix time)"""
+        await self.async_flush()
+        where, args = self._range(item_id, start, end)
+        rows = await self._run(
+            self._query,
+            "SELECT MIN(price) AS min_price, MAX(price) AS max_price, "
+            "AVG(price) AS average_price, COUNT(*) AS count, "
+            "MIN(ts) AS first_ts, MAX(ts) AS last_ts "
+            f"FROM price_history WHERE {where}",
+            args,
+        )
+
+        return rows[0]
+
+    def _close(self):
+        with self._lock:
+            self._connection.close()
+            self._connection = None
+
+    async def async_close(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._flushing is not None:
+            await asyncio.gather(self._flushing, return_exceptions=True)
+
+        if self._connection is not None:
+            try:
+                await self.async_flush()
+            finally:
+                await self._run(self._close)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "written": self._written,
+            "flushes": self._flushes,
+        }
+
+
+_HISTORY_STORE: Optional[PriceHistoryStore] = None
+
+
+async def async_open_history_store(path: str) -> PriceHistoryStore:
+    global _HISTORY_STORE
+
+    if _HISTORY_STORE is None:
+        # Entries set up concurrently share one open; a failed open publishes nothing
+        store = await single_flight().do(
+            ("history_store", path), lambda: _async_open(path), copier=lambda x: x
+        )
+
+        if _HISTORY_STORE is None:
+            _HISTORY_STORE = store
+
+    return _HISTORY_STORE
+
+
+async def _async_open(path: str) -> PriceHistoryStore:
+    store = PriceHistoryStore(path)
+    await store.async_open()
+
+    return store
+
+
+def get_history_store() -> Optional[PriceHistoryStore]:
+    return _HISTORY_STORE
+
+
+async def async_close_history_store():
+    global _HISTORY_STORE
+
+    if _HISTORY_STORE is not None:
+        store = _HISTORY_STORE
+        _HISTORY_STORE = None
+        await store.async_close()
@@ -13,6 +13,10 @@ class IdGenerator:
             service_type, device_id, entity_target
         )
 
+    @staticmethod
+    def generate_circuit_breaker_id(service_type: str) -> str:
+        return DOMAIN + ".circuit-breaker_{}".format(service_type)
+
     @staticmethod
     def generate_device_id(device_target: str) -> str:
         return DOMAIN + ".price-device_{}".format(device_target)
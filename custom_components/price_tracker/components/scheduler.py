@@ -0,0 +1,224 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+import zlib
+from typing import Awaitable, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_WORKERS = 8
+DEFAULT_WARM_START_WINDOW = 300  # seconds
+
+RefreshCallback = Callable[[], Awaitable[Optional[float]]]
+
+
+class RefreshJob:
+    def __init__(self, key: str, period: float, callback: RefreshCallback):
+        self.key = key
+        self.period = max(1.0, period)
+        self.callback = callback
+        # Stable offset inside the period, so items sharing a period do not align
+        self.phase = (zlib.crc32(key.encode("utf-8")) % 10000) / 10000 * self.period
+        self.due = 0.0
+        self.cancelled = False
+        self.running = False
+
+    def next_slot(self, after: float) -> float:
+        """First time strictly after `after` that falls on this job's phase"""
+        offset = (self.phase - after) % self.period
+
+        return after + (offset if offset > 0 else self.period)
+
+
+class RefreshScheduler:
+    """Min-heap of next-due refreshes dispatched through a small worker pool."""
+
+    def __init__(
+        self,
+        workers: int = _DEFAULT_WORKERS,
+        warm_start_window: float = DEFAULT_WARM_START_WINDOW,
+    ):
+        self._workers_size = workers
+        self.warm_start_window = warm_start_window
+        self._heap: list[tuple[float, int, RefreshJob]] = []
+        self._jobs: dict[str, RefreshJob] = {}
+        self._counter = itertools.count()
+        self._queue: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: list[asyncio.Task] = []
+        self._running = 0
+        self._dispatched = 0
+        self._max_lateness = 0.0
+
+    def schedule(
+        self,
+        key: str,
+        period: float,
+        callback: RefreshCallback,
+        last_run_ago: Optional[float] = None,
+        jitter: float = 0.0,
+    ) -> Callable[[], None]:
+        """Refresh `key` every `period` seconds; returns a function that unschedules it.
+        An overdue first run is delayed by up to `jitter` seconds."""
+        self.unschedule(key)
+        self._start()
+
+        now = time.time()
+        job = RefreshJob(key=key, period=period, callback=callback)
+        due = (
+            job.next_slot(now - last_run_ago)
+            if last_run_ago is not None and last_run_ago < job.period
+            else now
+        )
+        # Slots that passed while Home Assistant was down are spread like any overdue run
+        job.due = due if due > now else now + random.uniform(0, jitter)
+        self._jobs[key] = job
+        self._push(job)
+
+        def remove():
+            if self._jobs.get(key) is job:
+                self.unschedule(key)
+
+        return remove
+
+    def trigger(self, key: str) -> bool:
+        """Make a scheduled refresh due now; no-op while it is already queued or running"""
+        job = self._jobs.get(key)
+
+        if job is None or job.running:
+            return False
+
+        now = time.time()
+
+        # Already due: its heap entry dispatches it, a second one would run it twice
+        if job.due > now:
+            job.due = now
+            self._push(job)
+
+        return True
+
+    def unschedule(self, key: str):
+        job = self._jobs.pop(key, None)
+
+        if job is not None:
+            job.cancelled = True
+
+    def _push(self, job: RefreshJob):
+        heapq.heappush(self._heap, (job.due, next(self._counter), job))
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _start(self):
+        if len(self._tasks) > 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks = [loop.create_task(self._dispatch())] + [
+            loop.create_task(self._work()) for _ in range(self._workers_size)
+        ]
+
+    async def _dispatch(self):
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+
+            while len(self._heap) > 0 and self._heap[0][0] <= now:
+                due, _, job = heapq.heappop(self._heap)
+
+                # Entries left behind by trigger() no longer match the job's due
+                if job.cancelled or due != job.due:
+                    continue
+
+                self._max_lateness = max(self._max_lateness, now - due)
+                job.running = True
+                self._queue.put_nowait(job)
+
+            # Drop cancelled jobs at the top so they do not cause early wakeups
+            while len(self._heap) > 0 and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+
+            timeout = self._heap[0][0] - now if len(self._heap) > 0 else None
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _work(self):
+        while True:
+            job: RefreshJob = await self._queue.get()
+
+            if job.cancelled:
+                continue
+
+            self._running += 1
+            self._dispatched += 1
+            retry_in = None
+
+            try:
+                retry_in = await job.callback()
+            except Exception as e:
+                _LOGGER.warning("Scheduled refresh of %s failed %s", job.key, e)
+            finally:
+                job.running = False
+                self._running -= 1
+
+            if job.cancelled:
+                continue
+
+            now = time.time()
+            job.due = now + retry_in if retry_in is not None else job.next_slot(now)
+            self._push(job)
+
+    async def async_stop(self):
+        tasks, self._tasks = self._tasks, []
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for job in self._jobs.values():
+            job.cancelled = True
+
+        self._jobs.clear()
+        self._heap.clear()
+
+    @property
+    def stats(self) -> dict:
+        now = time.time()
+
+        return {
+            "jobs": len(self._jobs),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+            "dispatched": self._dispatched,
+            "next_due_in": round(
+                min((j.due for j in self._jobs.values()), default=now) - now, 1
+            ),
+            "max_lateness": round(self._max_lateness, 3),
+        }
+
+
+_REFRESH_SCHEDULER: Optional[RefreshScheduler] = None
+
+
+def refresh_scheduler() -> RefreshScheduler:
+    global _REFRESH_SCHEDULER
+
+    if _REFRESH_SCHEDULER is None:
+        _REFRESH_SCHEDULER = RefreshScheduler()
+
+    return _REFRESH_SCHEDULER
+
+
+async def async_stop_refresh_scheduler():
+    # Keep the instance (and its configuration); it restarts on the next schedule
+    if _REFRESH_SCHEDULER is not None:
+        await _REFRESH_SCHEDULER.async_stop()
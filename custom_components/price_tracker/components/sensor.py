@@ -1,16 +1,21 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from homeassistant.const import STATE_UNKNOWN
 from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity
 
 from custom_components.price_tracker.components.device import PriceTrackerDevice
 from custom_components.price_tracker.components.engine import PriceEngine
 from custom_components.price_tracker.components.id import IdGenerator
+from custom_components.price_tracker.components.coordinator import (
+    DEFAULT_MAX_STALENESS,
+    PriceTrackerCoordinator,
+    PriceTrackerItem,
+)
 from custom_components.price_tracker.consts.defaults import DATA_UPDATED
-from custom_components.price_tracker.datas.item import ItemData, ItemStatus
+from custom_components.price_tracker.datas.item import ItemData
 from custom_components.price_tracker.datas.price import (
     ItemPriceChangeData,
     create_item_price_change,
@@ -18,6 +23,7 @@ from custom_components.price_tracker.datas.price import (
     ItemPriceData,
 )
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
+from custom_components.price_tracker.utilities.hash import md5
 from custom_components.price_tracker.utilities.list import Lu
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,7 +33,9 @@ class PriceTrackerSensor(RestoreEntity):
     # STATIC
     _attr_icon = "mdi:cart"
     _attr_device_class = "price"
-    _attr_should_poll = True
+    _attr_should_poll = False
+    # Change on every refresh; neither recorded nor a reason to write the state
+    _unrecorded_attributes = frozenset({"updated_at", "age_seconds"})
 
     # Require
     _engine: PriceEngine
@@ -43,9 +51,13 @@ class PriceTrackerSensor(RestoreEntity):
     _unit_type: ItemUnitType = ItemUnitType.PIECE
     _unit_value: int = 1
     _updated_at: datetime | None = None
+    _fetched_at: datetime | None = None
+    _fingerprint: str | None = None
+    _summary: dict | None = None
 
     def __init__(
         self,
+        coordinator: PriceTrackerCoordinator,
         engine: PriceEngine,
         device: PriceTrackerDevice | None = None,
         unit_type: ItemUnitType = ItemUnitType.PIECE,
@@ -53,10 +65,17 @@ class PriceTrackerSensor(RestoreEntity):
         refresh_period: int = 30,
         management_category: str = None,
         management_categories: str = None,
+        max_staleness: int = DEFAULT_MAX_STALENESS,
+        adaptive_refresh: bool = False,
+        min_refresh_period: int | None = None,
+        max_refresh_period: int | None = None,
         debug: bool = False,
     ):
         """Initialize the sensor."""
+        self._coordinator = coordinator
         self._engine = engine
+        self._item: PriceTrackerItem | None = None
+        self._revision = 0
         self._attr_unique_id = IdGenerator.generate_entity_id(
             self._engine.engine_code(),
             self._engine.entity_id,
@@ -84,6 +103,12 @@ class PriceTrackerSensor(RestoreEntity):
         self._unit_type = unit_type
         self._unit_value = unit_value
         self._refresh_period = refresh_period if refresh_period is not None else 30
+        self._max_staleness = (
+            max_staleness if max_staleness is not None else DEFAULT_MAX_STALENESS
+        )
+        self._adaptive_refresh = adaptive_refresh
+        self._min_refresh_period = min_refresh_period
+        self._max_refresh_period = max_refresh_period
         self._updated_at = datetime.now()
         self._management_category = management_category
         self._management_categories = management_categories
@@ -95,62 +120,65 @@ class PriceTrackerSensor(RestoreEntity):
         return self._engine.id_str()
 
     async def async_update(self):
-        # Check last updated at
-        if (
-            self._engine_status
-            and self._updated_at is not None
-            and self._attr_available is True
-        ):
-            if (
-                self._updated_at is not None
-                and (self._updated_at + timedelta(minutes=self._refresh_period))
-                > datetime.now()
-            ):
-                _LOGGER.debug(
-                    "Skip update cause refresh period. {} -({} / {}).".format(
-                        self._attr_unique_id, self._updated_at, self._refresh_period
-                    )
-                )
-                return True
+        # Never wait on the network here; the coordinator pushes the result
+        self._coordinator.request_refresh(self._attr_unique_id)
 
-        _LOGGER.debug(
-            "Update sensor: %s (%s) - %s",
-            self._attr_unique_id,
-            self._updated_at,
-            self._attr_available,
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData | None:
+        """Fetch times; the state is not rewritten while the price stays the same"""
+        if self._item is None:
+            return None
+
+        return RestoredExtraData(
+            {
+                "fetched_at": self._item.fetched_at.isoformat()
+                if self._item.fetched_at is not None
+                else None,
+                "updated_at": self._item.updated_at.isoformat()
+                if self._item.updated_at is not None
+                else None,
+            }
         )
 
-        # Ignore deleted item
-        if self._item_data is not None and self._item_data.status == ItemStatus.DELETED:
-            self._attr_available = True
-            self._update_updated_at()
-            return True
+    @callback
+    def _handle_coordinator_update(self):
+        self._render()
+        fingerprint = self._state_fingerprint()
 
-        try:
-            data = await self._engine.load()
-
-            if data is None:
-                if (
-                    self._updated_at is None
-                    or self._updated_at + timedelta(hours=6) < datetime.now()
-                    or self._debug
-                ):
-                    self._attr_available = False
-                    self._update_engine_status(False)
-                else:
-                    self._attr_available = True
-                    self._update_engine_status(False)
-                return True
-
-            self._price_change = create_item_price_change(
-                updated_at=datetime.now(),
-                period_hour=self._refresh_period,
-                after_price=data.price.price,
-                before_price=self._item_data.price.price
-                if self._item_data is not None
-                else None,
+        if self.hass is not None and fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self.async_write_ha_state()
+
+    def _state_fingerprint(self) -> str:
+        """Digest of everything worth a state write"""
+        attributes = [
+            (k, v)
+            for k, v in (self._attr_extra_state_attributes or {}).items()
+            if k not in self._unrecorded_attributes
+        ]
+
+        return md5(
+            repr(
+                (
+                    self._attr_state,
+                    self._attr_available,
+                    self._attr_name,
+                    self._attr_entity_picture,
+                    self._attr_unit_of_measurement,
+                    sorted(attributes, key=lambda x: x[0]),
+                )
             )
-            self._item_data = data
+        )
+
+    def _render(self):
+        item = self._item
+        self._attr_available = item.available
+        self._update_engine_status(item.engine_status)
+
+        if item.item_data is not None and item.revision != self._revision:
+            self._revision = item.revision
+            self._item_data = item.item_data
+            self._price_change = item.price_change
 
             # Calculate unit
             unit = (
@@ -162,9 +190,14 @@ class PriceTrackerSensor(RestoreEntity):
                 if self._item_data.unit.is_basic
                 else self._item_data.unit
             )
+            # The rolling window moves with every sample; publishing it only with
+            # a new price keeps a steady price from writing a state per refresh
+            if self._summary is None or self._item_data.price.price != self._attr_state:
+                self._summary = item.history.summary.dict
             self._attr_extra_state_attributes = {
                 **self._item_data.dict,
                 **unit.dict,
+                **self._summary,
                 "price_change_status": self._price_change.status.name,
                 "price_change_before_price": self._price_change.before_price,
                 "price_change_after_price": self._price_change.after_price,
@@ -176,24 +209,35 @@ class PriceTrackerSensor(RestoreEntity):
             self._attr_name = self._item_data.name
             self._attr_state = self._item_data.price.price
             self._attr_entity_picture = self._item_data.image
-            self._attr_available = True
             self._attr_unit_of_measurement = self._item_data.price.currency
-            self._update_engine_status(True)
-        except Exception as e:
-            if (
-                self._updated_at is None
-                or self._updated_at + timedelta(hours=6) < datetime.now()
-                or self._debug
-            ):
-                self._attr_available = False
-                self._update_engine_status(False)
-            else:
-                self._attr_available = True
-                self._update_engine_status(False)
-        finally:
-            self._update_updated_at()
+
+        if item.updated_at is not None:
+            self._updated_at = item.updated_at
+
+        self._attr_extra_state_attributes = {
+            **self._attr_extra_state_attributes,
+            "updated_at": self._updated_at,
+            "stale": item.stale,
+            "age_seconds": item.age_seconds,
+            "refresh_period": round(item.interval),
+        }
 
     async def async_added_to_hass(self) -> None:
+        self._item = self._coordinator.add(
+            self._attr_unique_id,
+            self._engine,
+            self._refresh_period,
+            self._max_staleness,
+            adaptive=self._adaptive_refresh,
+            min_refresh_period=self._min_refresh_period,
+            max_refresh_period=self._max_refresh_period,
+        )
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._attr_unique_id, self._handle_coordinator_update
+            )
+        )
+
         try:
             """Handle entity which will be added."""
             await super().async_added_to_hass()
@@ -204,7 +248,7 @@ class PriceTrackerSensor(RestoreEntity):
 
             if not state:
                 self._attr_available = False
-                await self.async_update()
+                self._restore_item()
                 return
 
             if "updated_at" in state.attributes:
@@ -215,6 +259,8 @@ class PriceTrackerSensor(RestoreEntity):
             else:
                 self._update_engine_status(False)
 
+            await self._restore_fetch_times()
+
             self._attr_name = Lu.get(state.attributes, "name")
             self._attr_state = Lu.get(state.attributes, "price")
             self._attr_entity_picture = Lu.get(state.attributes, "entity_picture")
@@ -274,24 +320,51 @@ class PriceTrackerSensor(RestoreEntity):
                     "price_change_after_price": self._price_change.after_price,
                 }
 
-            await self.async_update()
+            # Serve the restored data right away; the refresh runs in the background
+            self._restore_item()
+            self._render()
 
-            async_dispatcher_connect(
-                self.hass, DATA_UPDATED, self._schedule_immediate_update
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass, DATA_UPDATED, self._schedule_immediate_update
+                )
             )
         except Exception as e:
             _LOGGER.warning("Error while adding the sensor: %s", e)
+        finally:
+            # Home Assistant writes this state once the entity is added
+            self._fingerprint = self._state_fingerprint()
+            self.async_on_remove(self._coordinator.start(self._attr_unique_id))
+
+    async def _restore_fetch_times(self):
+        extra = await self.async_get_last_extra_data()
+        times = extra.as_dict() if extra is not None else {}
+
+        if Lu.get(times, "updated_at") is not None:
+            self._updated_at = datetime.fromisoformat(times["updated_at"])
+
+        if Lu.get(times, "fetched_at") is not None:
+            self._fetched_at = datetime.fromisoformat(times["fetched_at"])
+
+    def _restore_item(self):
+        """Seed the coordinator with the restored state"""
+        self._item.item_data = self._item_data
+        self._item.price_change = self._price_change
+        self._item.updated_at = self._updated_at
+        self._item.fetched_at = (
+            (self._fetched_at or self._updated_at)
+            if self._item_data is not None
+            else None
+        )
+        self._item.available = self._attr_available
+        self._item.engine_status = self._engine_status
+        self._item.history.restore_lowest(
+            Lu.get(self._attr_extra_state_attributes, "lowest_price")
+        )
 
     @callback
     def _schedule_immediate_update(self):
-        self.async_schedule_update_ha_state(True)
-
-    def _update_updated_at(self):
-        self._updated_at = datetime.now()
-        self._attr_extra_state_attributes = {
-            **self._attr_extra_state_attributes,
-            "updated_at": self._updated_at,
-        }
+        self._coordinator.request_refresh(self._attr_unique_id)
 
     def _update_engine_status(self, status: bool):
         if self._attr_extra_state_attributes is None:
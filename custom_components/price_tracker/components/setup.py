@@ -20,13 +20,24 @@ from custom_components.price_tracker.consts.confs import (
     CONF_TYPE,
     CONF_TARGET,
     CONF_ITEM_MANAGEMENT_CATEGORIES,
+    CONF_REQUEST_RATE_LIMIT,
+    CONF_REQUEST_RATE_BURST,
+    CONF_PROXY_DIRECT,
+    CONF_REQUEST_CONCURRENCY,
 )
 from custom_components.price_tracker.datas.unit import ItemUnitType
 from custom_components.price_tracker.services.factory import (
     create_service_item_url_parser,
     create_service_item_target_parser,
 )
+from custom_components.price_tracker.utilities.concurrency import (
+    DEFAULT_SERVICE_CONCURRENCY,
+)
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.rate_limit import (
+    DEFAULT_RATE,
+    DEFAULT_BURST,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +49,7 @@ class PriceTrackerSetup:
     const_option_setup_select: str = "option_setup_select"
     const_option_proxy_select: str = "option_proxy_select"
     const_option_selenium_select: str = "option_selenium_select"
+    const_option_performance_select: str = "option_performance_select"
     const_option_personal_select: str = "option_personal_select"
     const_option_modify_select: str = "option_modify_select"
     const_option_add_select: str = "option_add_select"
@@ -53,6 +65,10 @@ class PriceTrackerSetup:
     conf_selenium_proxy = "selenium_proxy"
     conf_proxy_opensource_use = "proxy_opensource"
     conf_proxy_list = "proxy_list"
+    conf_proxy_direct = CONF_PROXY_DIRECT
+    conf_request_rate_limit = CONF_REQUEST_RATE_LIMIT
+    conf_request_rate_burst = CONF_REQUEST_RATE_BURST
+    conf_request_concurrency = CONF_REQUEST_CONCURRENCY
     # (private) conf for select
     conf_item_unique_id: str = "item_unique_id"
     conf_item_device_id: str = "item_device_id"
@@ -61,6 +77,10 @@ class PriceTrackerSetup:
     conf_item_unit_type: str = "item_unit_type"
     conf_item_unit: str = "item_unit"
     conf_item_refresh_interval: str = "item_refresh_interval"
+    conf_item_max_staleness: str = "item_max_staleness"
+    conf_item_refresh_adaptive: str = "item_refresh_adaptive"
+    conf_item_refresh_interval_min: str = "item_refresh_interval_min"
+    conf_item_refresh_interval_max: str = "item_refresh_interval_max"
     conf_item_price_change_interval_hour: str = "item_price_change_interval_hour"
     conf_item_debug: str = "item_debug"
 
@@ -123,6 +143,7 @@ class PriceTrackerSetup:
                                 self.const_option_personal_select,
                                 self.const_option_proxy_select,
                                 self.const_option_selenium_select,
+                                self.const_option_performance_select,
                                 self.const_option_modify_select,
                                 self.const_option_add_select,
                             ],
@@ -141,6 +162,9 @@ class PriceTrackerSetup:
         if user_input is None or self.conf_proxy not in user_input:
             # Fetch original items
             proxies = dict(self._config_entry.data).get(self.conf_proxy, [])
+            proxy_direct = dict(self._config_entry.data).get(
+                self.conf_proxy_direct, True
+            )
 
             return self._option_flow.async_show_form(
                 step_id=self._step_setup,
@@ -177,6 +201,10 @@ class PriceTrackerSetup:
                             description={"suggested_value": ",".join(proxies)},
                             default="",
                         ): cv.string,
+                        vol.Optional(
+                            self.conf_proxy_direct,
+                            default=proxy_direct,
+                        ): cv.boolean,
                     }
                 ),
             )
@@ -195,6 +223,9 @@ class PriceTrackerSetup:
         config[self.conf_proxy] = list(
             filter(lambda x: x != "", config[self.conf_proxy])
         )
+        config[self.conf_proxy_direct] = bool(
+            Lu.get_or_default(user_input, self.conf_proxy_direct, True)
+        )
 
         _LOGGER.debug("Proxy configuration with %s (original: %s)", config, user_input)
 
@@ -310,6 +341,96 @@ class PriceTrackerSetup:
             reason="selenium_updated" if flag else "selenium_not_updated"
         )
 
+    async def option_performance(self, user_input: dict = None):
+        # Get items if the user_input is None
+        if user_input is None or self.conf_request_rate_limit not in user_input:
+            config = dict(self._config_entry.data)
+
+            return self._option_flow.async_show_form(
+                step_id=self._step_setup,
+                description_placeholders={
+                    **Lang(self._option_flow.hass).f(
+                        key="title",
+                        items={
+                            "en": "Request limits",
+                            "ja": "リクエスト制限",
+                            "ko": "요청 제한",
+                        },
+                    ),
+                    **Lang(self._option_flow.hass).f(
+                        key="description",
+                        items={
+                            "en": "Set how many requests per second (and the burst size) are sent to this site, and how many items are loaded at once. A rate of 0 disables the rate limit.",
+                            "ja": "このサイトへ送信する 1 秒あたりのリクエスト数とバースト数、同時に読み込む商品数を設定します。リクエスト数 0 は無制限です。",
+                            "ko": "이 사이트로 보내는 초당 요청 수와 버스트 크기, 동시에 불러올 상품 수를 설정합니다. 초당 요청 수 0은 제한 없음입니다.",
+                        },
+                    ),
+                },
+                data_schema=vol.Schema(
+                    {
+                        vol.Optional(
+                            self.const_option_setup_select,
+                            default=self.const_option_performance_select,
+                        ): vol.In(
+                            {
+                                self.const_option_performance_select: self.const_option_performance_select
+                            }
+                        ),
+                        vol.Optional(
+                            self.conf_request_rate_limit,
+                            default=config.get(
+                                self.conf_request_rate_limit, DEFAULT_RATE
+                            ),
+                        ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                        vol.Optional(
+                            self.conf_request_rate_burst,
+                            default=config.get(
+                                self.conf_request_rate_burst, DEFAULT_BURST
+                            ),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                        vol.Optional(
+                            self.conf_request_concurrency,
+                            default=config.get(
+                                self.conf_request_concurrency,
+                                DEFAULT_SERVICE_CONCURRENCY,
+                            ),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    }
+                ),
+            )
+
+        config = dict(self._config_entry.data)
+        options = dict(self._config_entry.options)
+        config[self.conf_request_rate_limit] = float(
+            user_input[self.conf_request_rate_limit]
+        )
+        config[self.conf_request_rate_burst] = int(
+            Lu.get_or_default(user_input, self.conf_request_rate_burst, DEFAULT_BURST)
+        )
+        config[self.conf_request_concurrency] = int(
+            Lu.get_or_default(
+                user_input,
+                self.conf_request_concurrency,
+                DEFAULT_SERVICE_CONCURRENCY,
+            )
+        )
+
+        _LOGGER.debug(
+            "Performance configuration with %s (original: %s)", config, user_input
+        )
+
+        flag = self._option_flow.hass.config_entries.async_update_entry(
+            entry=self._config_entry,
+            data={
+                **config,
+            },
+            options=options if options is not None else {},
+        )
+
+        return self._option_flow.async_abort(
+            reason="performance_updated" if flag else "performance_not_updated"
+        )
+
     async def option_modify(self, device, entity, user_input: dict = None):
         """Modify an existing entry."""
         _LOGGER.debug("Setup Modify(option): %s", user_input)
@@ -418,6 +539,14 @@ class PriceTrackerSetup:
             ),
             vol.Optional(self.conf_item_unit, default=0): cv.positive_int,
             vol.Required(self.conf_item_refresh_interval, default=30): cv.positive_int,
+            vol.Optional(self.conf_item_refresh_adaptive, default=False): cv.boolean,
+            vol.Optional(
+                self.conf_item_refresh_interval_min, default=10
+            ): cv.positive_int,
+            vol.Optional(
+                self.conf_item_refresh_interval_max, default=1440
+            ): cv.positive_int,
+            vol.Optional(self.conf_item_max_staleness, default=6): cv.positive_int,
             vol.Required(
                 self.conf_item_price_change_interval_hour, default=24
             ): cv.positive_int,
@@ -483,6 +612,30 @@ class PriceTrackerSetup:
                             item, self.conf_item_refresh_interval, 30
                         ),
                     ): cv.positive_int,
+                    vol.Optional(
+                        self.conf_item_refresh_adaptive,
+                        default=Lu.get_or_default(
+                            item, self.conf_item_refresh_adaptive, False
+                        ),
+                    ): cv.boolean,
+                    vol.Optional(
+                        self.conf_item_refresh_interval_min,
+                        default=Lu.get_or_default(
+                            item, self.conf_item_refresh_interval_min, 10
+                        ),
+                    ): cv.positive_int,
+                    vol.Optional(
+                        self.conf_item_refresh_interval_max,
+                        default=Lu.get_or_default(
+                            item, self.conf_item_refresh_interval_max, 1440
+                        ),
+                    ): cv.positive_int,
+                    vol.Optional(
+                        self.conf_item_max_staleness,
+                        default=Lu.get_or_default(
+                            item, self.conf_item_max_staleness, 6
+                        ),
+                    ): cv.positive_int,
                     vol.Required(
                         self.conf_item_price_change_interval_hour,
                         default=Lu.get_or_default(
@@ -41,6 +41,7 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def async_get_options_flow(config_entry):
         return PriceTrackerOptionsFlowHandler(config_entry)
 
+    async def async_step_user(self, user_input=None):
         errors: dict = {}
         if user_input is None:
             # Step 1: Select service and language
@@ -76,36 +77,49 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_product_details(self, user_input=None):
         import logging
+
         logger = logging.getLogger(__name__)
         errors: dict = {}
         import voluptuous as vol
 
         # Basic required field
-        schema = vol.Schema({
-            vol.Required("item_url"): str,
-            vol.Optional("show_advanced", default=False): bool,
-        })
+        schema = vol.Schema(
+            {
+                vol.Required("item_url"): str,
+                vol.Optional("show_advanced", default=False): bool,
+            }
+        )
 
         # Advanced fields schema
-        advanced_schema = vol.Schema({
-            vol.Optional("item_device_id", default=""): str,
-            vol.Optional("item_management_category", default=""): str,
-            vol.Optional("item_unit_type", default="auto"): str,
-            vol.Optional("item_unit", default=""): str,
-            vol.Optional("item_refresh_interval", default=30): int,
-            vol.Optional("item_price_change_interval_hour", default=24): int,
-            vol.Optional("item_debug", default=False): bool,
-            vol.Optional("proxy", default=""): str,
-            vol.Optional("selenium", default=""): str,
-            vol.Optional("selenium_proxy", default=""): str,
-        })
-
-        logger.info(f"[DIAG][config_flow] async_step_product_details called with user_input={user_input}")
+        advanced_schema = vol.Schema(
+            {
+                vol.Optional("item_device_id", default=""): str,
+                vol.Optional("item_management_category", default=""): str,
+                vol.Optional("item_unit_type", default="auto"): str,
+                vol.Optional("item_unit", default=""): str,
+                vol.Optional("item_refresh_interval", default=30): int,
+                vol.Optional("item_refresh_adaptive", default=False): bool,
+                vol.Optional("item_refresh_interval_min", default=10): int,
+                vol.Optional("item_refresh_interval_max", default=1440): int,
+                vol.Optional("item_max_staleness", default=6): int,
+                vol.Optional("item_price_change_interval_hour", default=24): int,
+                vol.Optional("item_debug", default=False): bool,
+                vol.Optional("proxy", default=""): str,
+                vol.Optional("selenium", default=""): str,
+                vol.Optional("selenium_proxy", default=""): str,
+            }
+        )
+
+        logger.info(
+            f"[DIAG][config_flow] async_step_product_details called with user_input={user_input}"
+        )
 
         try:
             # Step 1: Show basic form if no input or not advanced
             if user_input is None:
-                logger.info("[DIAG][config_flow] async_step_product_details: user_input is None, showing form")
+                logger.info(
+                    "[DIAG][config_flow] async_step_product_details: user_input is None, showing form"
+                )
                 return self.async_show_form(
                     step_id="product_details",
                     data_schema=schema,
@@ -115,20 +129,25 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             # Step 2: If advanced requested, show advanced form
             if user_input.get("show_advanced", False) and len(user_input) == 1:
-                logger.info("[DIAG][config_flow] async_step_product_details: show_advanced requested, showing advanced form")
+                logger.info(
+                    "[DIAG][config_flow] async_step_product_details: show_advanced requested, showing advanced form"
+                )
                 return self.async_show_form(
                     step_id="product_details",
-                    data_schema=vol.Schema({
-                        vol.Required("item_url"): str,
-                        vol.Optional("show_advanced", default=True): bool,
-                        **advanced_schema.schema,
-                    }),
+                    data_schema=vol.Schema(
+                        {
+                            vol.Required("item_url"): str,
+                            vol.Optional("show_advanced", default=True): bool,
+                            **advanced_schema.schema,
+                        }
+                    ),
                     errors=errors,
                 )
 
             # Step 3: Submission: must have item_url and (optionally) advanced fields
             item_url = user_input.get("item_url", "")
             import re
+
             match = re.search(r"id=(?P<product_id>\d+)", item_url)
             item_unique_id = match.group("product_id") if match else ""
 
@@ -142,27 +161,33 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Create a temporary dictionary with all default values from advanced_schema
             temp_user_input = {}
             for key, validator in advanced_schema.schema.items():
-                if hasattr(validator, 'default'):
+                if hasattr(validator, "default"):
                     temp_user_input[key] = validator.default
                 else:
                     # Handle required fields without default if necessary
-                    pass # This case should ideally not happen for optional fields
+                    pass  # This case should ideally not happen for optional fields
 
             # Update with actual user input
             temp_user_input.update(user_input)
 
             # Filter out non-advanced fields before validation
             advanced_keys = set(advanced_schema.schema.keys())
-            filtered_advanced_input = {k: v for k, v in temp_user_input.items() if k in advanced_keys}
+            filtered_advanced_input = {
+                k: v for k, v in temp_user_input.items() if k in advanced_keys
+            }
 
             # Now, pass this filtered dictionary to advanced_schema for validation and final default application
             final_advanced_data = advanced_schema(filtered_advanced_input)
 
             config_data.update(final_advanced_data)
 
-            logger.info(f"[DIAG][config_flow] async_step_product_details: config_data={config_data}")
+            logger.info(
+                f"[DIAG][config_flow] async_step_product_details: config_data={config_data}"
+            )
 
-            logger.info(f"[DIAG][config_flow] async_step_product_details: config_data BEFORE step.setup={config_data}")
+            logger.info(
+                f"[DIAG][config_flow] async_step_product_details: config_data BEFORE step.setup={config_data}"
+            )
 
             # Setup entry with all config data
             step = price_tracker_setup_service(
@@ -171,13 +196,19 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
             if step:
-                logger.info(f"[DIAG][config_flow] async_step_product_details: calling setup for service_type={config_data['service_type']} with config_data={config_data}")
+                logger.info(
+                    f"[DIAG][config_flow] async_step_product_details: calling setup for service_type={config_data['service_type']} with config_data={config_data}"
+                )
                 result = await step.setup(config_data)
-                logger.info(f"[DIAG][config_flow] async_step_product_details: setup result={result}")
+                logger.info(
+                    f"[DIAG][config_flow] async_step_product_details: setup result={result}"
+                )
                 return result
 
             errors["base"] = "unsupported"
-            logger.info("[DIAG][config_flow] async_step_product_details: unsupported service, showing form again")
+            logger.info(
+                "[DIAG][config_flow] async_step_product_details: unsupported service, showing form again"
+            )
             return self.async_show_form(
                 step_id="product_details",
                 data_schema=schema,
@@ -185,7 +216,10 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         except Exception as e:
-            logger.error(f"[DIAG][config_flow] async_step_product_details: Exception occurred: {e}", exc_info=True)
+            logger.error(
+                f"[DIAG][config_flow] async_step_product_details: Exception occurred: {e}",
+                exc_info=True,
+            )
             errors["base"] = "unknown"
             return self.async_show_form(
                 step_id="product_details",
@@ -204,10 +238,10 @@ class PriceTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
 
 class PriceTrackerOptionsFlowHandler(config_entries.OptionsFlow):
-
-        self.config_entry = config_entry
+    def __init__(self, config_entry: ConfigEntry):
+        # OptionsFlow.config_entry is only available after initialisation
         self.setup: PriceTrackerSetup = price_tracker_setup_option_service(
-            service_type=self.config_entry.data[CONF_TYPE],
+            service_type=config_entry.data[CONF_TYPE],
             option_flow=self,
             config_entry=config_entry,
         )
@@ -227,17 +261,27 @@ class PriceTrackerOptionsFlowHandler(config_entries.OptionsFlow):
         # Proxy configuration
         if (
             self.setup.const_option_setup_select in user_input
-            and user_input[self.setup.const_option_setup_select] == self.setup.const_option_proxy_select
+            and user_input[self.setup.const_option_setup_select]
+            == self.setup.const_option_proxy_select
         ):
             return await self.setup.option_proxy(user_input)
 
         # Selenium select
         if (
             self.setup.const_option_setup_select in user_input
-            and user_input[self.setup.const_option_setup_select] == self.setup.const_option_selenium_select
+            and user_input[self.setup.const_option_setup_select]
+            == self.setup.const_option_selenium_select
         ):
             return await self.setup.option_selenium(user_input)
 
+        # Performance (request rate limit)
+        if (
+            self.setup.const_option_setup_select in user_input
+            and user_input[self.setup.const_option_setup_select]
+            == self.setup.const_option_performance_select
+        ):
+            return await self.setup.option_performance(user_input)
+
         # 1
         if self.setup.const_option_setup_select in user_input:
             if self.setup.const_option_select_device not in user_input:
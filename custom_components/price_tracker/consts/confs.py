@@ -7,10 +7,21 @@ CONF_PROXY = "proxy"
 CONF_SELENIUM = "selenium"
 CONF_SELENIUM_PROXY = "selenium_proxy"
 CONF_PROXY_OPENSOURCE = "proxy_opensource"
+CONF_PROXY_DIRECT = "proxy_direct"
 CONF_ITEM_URL = "item_url"
 CONF_ITEM_UNIT_TYPE = "item_unit_type"
 CONF_ITEM_UNIT = "item_unit"
 CONF_ITEM_REFRESH_INTERVAL = "item_refresh_interval"
+CONF_ITEM_MAX_STALENESS = "item_max_staleness"
+CONF_ITEM_REFRESH_ADAPTIVE = "item_refresh_adaptive"
+CONF_ITEM_REFRESH_INTERVAL_MIN = "item_refresh_interval_min"
+CONF_ITEM_REFRESH_INTERVAL_MAX = "item_refresh_interval_max"
 CONF_ITEM_MANAGEMENT_CATEGORY = "item_management_category"
 CONF_ITEM_MANAGEMENT_CATEGORIES = "item_management_categories"
 CONF_DEBUG = "item_debug"
+CONF_REQUEST_RATE_LIMIT = "request_rate_limit"
+CONF_REQUEST_RATE_BURST = "request_rate_burst"
+CONF_REQUEST_CONCURRENCY = "request_concurrency"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_WARM_START_WINDOW = "warm_start_window"
+CONF_HTML_BACKEND = "html_backend"
@@ -2,5 +2,5 @@ DOMAIN = "price_tracker"
 NAME = "E-Commerce Price Tracker"
 DESCRIPTION = "Track the price of products on e-commerce websites"
 VERSION = "1.4.8"
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "binary_sensor"]
 DATA_UPDATED = f"{DOMAIN}_data_updated"
\ No newline at end of file
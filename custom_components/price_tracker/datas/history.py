@@ -0,0 +1,93 @@
+import time
+from array import array
+from collections import deque
+
+from custom_components.price_tracker.datas.price import ItemPriceSummaryData
+
+DEFAULT_HISTORY_SIZE = 288
+
+
+class ItemPriceHistory:
+    """Fixed-size ring buffer of (timestamp, price, stock rank) samples.
+    Rolling min/max/avg and the all-time low are maintained on append, never by scanning."""
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE):
+        self._capacity = max(1, capacity)
+        self._timestamps = array("d", bytes(8 * self._capacity))
+        self._prices = array("d", bytes(8 * self._capacity))
+        self._ranks = array("b", bytes(self._capacity))
+        self._appended = 0
+        self._sum = 0.0
+        # Monotonic queues of absolute sample indices (sliding window min/max)
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+        self._lowest: float | None = None
+
+    def __len__(self) -> int:
+        return min(self._appended, self._capacity)
+
+    def append(self, price: float, rank: int = 0, timestamp: float | None = None):
+        index = self._appended
+        slot = index % self._capacity
+
+        if index >= self._capacity:
+            # Evict the oldest sample, which lives in the slot we are about to reuse
+            evicted = index - self._capacity
+            self._sum -= self._prices[slot]
+
+            if self._min[0] == evicted:
+                self._min.popleft()
+            if self._max[0] == evicted:
+                self._max.popleft()
+
+        self._timestamps[slot] = timestamp if timestamp is not None else time.time()
+        self._prices[slot] = price
+        self._ranks[slot] = rank
+        self._sum += price
+
+        while len(self._min) > 0 and self._price(self._min[-1]) >= price:
+            self._min.pop()
+        self._min.append(index)
+
+        while len(self._max) > 0 and self._price(self._max[-1]) <= price:
+            self._max.pop()
+        self._max.append(index)
+
+        if self._lowest is None or price < self._lowest:
+            self._lowest = price
+
+        self._appended += 1
+
+    def _price(self, index: int) -> float:
+        return self._prices[index % self._capacity]
+
+    def restore_lowest(self, price: float | None):
+        """Carry the all-time low over a restart"""
+        if price is not None and (self._lowest is None or price < self._lowest):
+            self._lowest = price
+
+    @property
+    def summary(self) -> ItemPriceSummaryData:
+        if len(self) == 0:
+            return ItemPriceSummaryData(lowest_price=self._lowest)
+
+        return ItemPriceSummaryData(
+            min_price=self._price(self._min[0]),
+            max_price=self._price(self._max[0]),
+            average_price=round(self._sum / len(self), 2),
+            lowest_price=self._lowest,
+        )
+
+    @property
+    def samples(self) -> list[tuple[float, float, int]]:
+        """Samples, oldest first"""
+        first = self._appended - len(self)
+
+        return [
+            (
+                self._timestamps[i % self._capacity],
+                self._prices[i % self._capacity],
+                self._ranks[i % self._capacity],
+            )
+            for i in range(first, self._appended)
+        ]
@@ -56,13 +56,26 @@ class ItemPriceChangeStatus(Enum):
 
 @dataclass
 class ItemPriceSummaryData:
-    def __init__(self, min_price: float = 0, max_price: float = 0):
+    def __init__(
+        self,
+        min_price: float = 0,
+        max_price: float = 0,
+        average_price: float | None = None,
+        lowest_price: float | None = None,
+    ):
         self.min_price = min_price
         self.max_price = max_price
+        self.average_price = average_price
+        self.lowest_price = lowest_price
 
     @property
     def dict(self):
-        return {"min_price": self.min_price, "max_price": self.max_price}
+        return {
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "average_price": self.average_price,
+            "lowest_price": self.lowest_price,
+        }
 
 
 @dataclass
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.price_tracker.components.coordinator import get_coordinator
+from custom_components.price_tracker.components.history_store import get_history_store
+from custom_components.price_tracker.components.scheduler import refresh_scheduler
+from custom_components.price_tracker.consts.confs import (
+    CONF_PROXY,
+    CONF_SELENIUM,
+    CONF_SELENIUM_PROXY,
+    CONF_TYPE,
+)
+from custom_components.price_tracker.utilities.circuit_breaker import circuit_breaker
+from custom_components.price_tracker.utilities.concurrency import load_limiter
+from custom_components.price_tracker.utilities.proxy import get_proxy_manager
+from custom_components.price_tracker.utilities.rate_limit import rate_limiter
+from custom_components.price_tracker.utilities.response_cache import response_cache
+from custom_components.price_tracker.utilities.retry import default_retry_policy
+from custom_components.price_tracker.utilities.session_pool import session_pool
+from custom_components.price_tracker.utilities.single_flight import single_flight
+from custom_components.price_tracker.utilities.token_cache import token_cache
+
+TO_REDACT = [CONF_PROXY, CONF_SELENIUM, CONF_SELENIUM_PROXY]
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Diagnostics for a config entry."""
+    manager = get_proxy_manager(entry.entry_id)
+    coordinator = get_coordinator(entry.entry_id)
+    history_store = get_history_store()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            # Per-item proxies live in the target list of the options
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "circuit_breaker": circuit_breaker(entry.data.get(CONF_TYPE)).stats,
+        "concurrency": load_limiter().stats,
+        "coordinator": coordinator.stats if coordinator is not None else None,
+        "history_store": history_store.stats if history_store is not None else None,
+        "proxies": manager.stats if manager is not None else [],
+        "rate_limit": rate_limiter().stats.get(entry.data.get(CONF_TYPE)),
+        "response_cache": response_cache().stats,
+        "retry": default_retry_policy().stats,
+        "scheduler": refresh_scheduler().stats,
+        "session_pool": session_pool().stats,
+        "single_flight": single_flight().stats,
+        "token_cache": token_cache().stats,
+    }
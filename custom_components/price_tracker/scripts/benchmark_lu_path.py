@@ -0,0 +1,136 @@
+"""Compare compiled Lu paths with splitting the dotted key on every call.
+
+Usage: python -m custom_components.price_tracker.scripts.benchmark_lu_path [response.json]
+Without a saved Coupang response, a synthetic one of similar shape is used.
+"""
+
+import json
+import sys
+import timeit
+from contextlib import contextmanager
+
+from custom_components.price_tracker.services.coupang.parser import CoupangParser
+from custom_components.price_tracker.utilities.list import Lu, LuPath
+
+
+def _legacy_get(target, key, default_value=None):
+    """Lu.get before path compilation"""
+    if isinstance(key, LuPath):
+        key = key.key
+
+    if isinstance(key, int):
+        return target[key]
+
+    if key in target:
+        return target[key]
+
+    if key.isnumeric():
+        return target[int(key)]
+
+    if key.count(".") > 0:
+        keys = key.split(".")
+
+        for k in keys:
+            if str(k).isnumeric() and isinstance(target, list) and len(target) > int(k):
+                target = target[int(k)]
+                continue
+            elif k in target:
+                target = target[k]
+                continue
+            else:
+                return default_value
+        return target
+
+    return default_value
+
+
+def _legacy_find(target, key, value, defaultValue=None):
+    return next((x for x in target if _legacy_get(x, key) == value), defaultValue)
+
+
+@contextmanager
+def legacy_lu():
+    get, find = Lu.get, Lu.find
+    Lu.get, Lu.find = staticmethod(_legacy_get), staticmethod(_legacy_find)
+
+    try:
+        yield
+    finally:
+        Lu.get, Lu.find = staticmethod(get), staticmethod(find)
+
+
+def _widget(view_type: str, **entity) -> dict:
+    return {"entity": {"viewType": view_type, **entity}}
+
+
+def synthetic_response(filler: int = 150) -> dict:
+    mandatory = {
+        "brandName": "브랜드",
+        "rocketType": "ROCKET",
+        "isOutOfStock": False,
+    }
+    atf = [_widget("FILLER_{}".format(i), text="x" * 50) for i in range(filler)] + [
+        _widget("PRODUCT_DETAIL_ITEM_THUMBNAILS", medias=[{"detail": "img.jpg"}]),
+        _widget("PRODUCT_DETAIL_PRODUCT_INFO", title=[{"text": "상품"}]),
+    ]
+    handlebar = [_widget("FILLER_{}".format(i)) for i in range(filler)] + [
+        _widget("PRODUCT_DETAIL_HANDLEBAR_QUANTITY", deliveryDate=[{"text": "내일"}]),
+        {
+            **_widget(
+                "PRODUCT_DETAIL_BASE_INFO",
+                deliveryInfo={"shippingFee": [{"text": "무료배송"}]},
+            ),
+            "priceInfo": {"finalPrice": [1000], "originalPrice": [1200]},
+        },
+    ]
+
+    return {
+        "rCode": "RET0000",
+        "rData": {
+            "pageList": [
+                {"page": "PAGE_ATF", "widgetList": atf},
+                {"page": "PAGE_HANDLEBAR", "widgetList": handlebar},
+            ],
+            "properties": {
+                "itemDetail": {
+                    "logging": {"bypass": {"exposureSchema": {"mandatory": mandatory}}}
+                }
+            },
+        },
+    }
+
+
+def parse(data: dict):
+    parser = CoupangParser(data)
+
+    return parser.name, parser.price, parser.delivery, parser.inventory, parser.image
+
+
+def main():
+    data = (
+        json.load(open(sys.argv[1], encoding="utf-8"))
+        if len(sys.argv) > 1
+        else synthetic_response()
+    )
+    compiled = parse(data)
+    with legacy_lu():
+        legacy = parse(data)
+    assert compiled == legacy, "Both accessors must read the same values"
+
+    runs = 200
+    results = {"compiled": timeit.timeit(lambda: parse(data), number=runs)}
+    with legacy_lu():
+        results["split per call"] = timeit.timeit(lambda: parse(data), number=runs)
+
+    print("{} runs".format(runs))
+    for name, total in results.items():
+        print("{:>14}: {:8.3f} ms/parse".format(name, total / runs * 1000))
+    print(
+        "{:>14}: {:8.1f}x".format(
+            "speedup", results["split per call"] / results["compiled"]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
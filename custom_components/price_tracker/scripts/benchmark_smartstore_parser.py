@@ -0,0 +1,72 @@
+"""Compare the __PRELOADED_STATE__ fast path with the BeautifulSoup scan.
+
+Usage: python -m custom_components.price_tracker.scripts.benchmark_smartstore_parser [page.html]
+Without a saved page, a synthetic page of similar size is used.
+"""
+
+import json
+import sys
+import timeit
+
+from custom_components.price_tracker.services.smartstore.parser import (
+    SmartstoreParser,
+)
+from custom_components.price_tracker.utilities.parser import parse_assigned_json
+
+
+def synthetic_page() -> str:
+    state = {
+        "product": {
+            "A": {
+                "id": 1,
+                "name": "상품",
+                "options": [{"id": i, "name": "옵션 {}".format(i)} for i in range(500)],
+                "description": {"detailContentText": "설명 " * 2000},
+            }
+        }
+    }
+    filler = "".join(
+        '<div class="item"><span>{}</span><a href="/p/{}">link</a></div>'.format(i, i)
+        for i in range(3000)
+    )
+
+    return (
+        "<html><head><script>var a = 1;</script></head><body>{}"
+        "<script>window.__PRELOADED_STATE__={}</script>"
+        "<script>console.log('tail');</script></body></html>"
+    ).format(filler, json.dumps(state, ensure_ascii=False))
+
+
+def main():
+    page = (
+        open(sys.argv[1], encoding="utf-8").read()
+        if len(sys.argv) > 1
+        else synthetic_page()
+    )
+    fast = parse_assigned_json(page, "window.__PRELOADED_STATE__")
+    slow = SmartstoreParser.parse_state_from_soup(page)
+    assert fast == slow, "Both paths must decode the same state"
+
+    runs = 20
+    results = {
+        "scanner": timeit.timeit(
+            lambda: parse_assigned_json(page, "window.__PRELOADED_STATE__"),
+            number=runs,
+        ),
+        "beautifulsoup": timeit.timeit(
+            lambda: SmartstoreParser.parse_state_from_soup(page), number=runs
+        ),
+    }
+
+    print("page: {:.0f} KB, {} runs".format(len(page.encode("utf-8")) / 1024, runs))
+    for name, total in results.items():
+        print("{:>14}: {:8.2f} ms/parse".format(name, total / runs * 1000))
+    print(
+        "{:>14}: {:8.1f}x".format(
+            "speedup", results["beautifulsoup"] / results["scanner"]
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import logging
 
 from homeassistant import config_entries, core
 
+from .components.coordinator import create_coordinator
 from .components.sensor import PriceTrackerSensor
 from .consts.confs import (
     CONF_ITEM_DEVICE_ID,
@@ -12,9 +13,14 @@ from .consts.confs import (
     CONF_ITEM_UNIT_TYPE,
     CONF_ITEM_UNIT,
     CONF_ITEM_REFRESH_INTERVAL,
+    CONF_ITEM_MAX_STALENESS,
+    CONF_ITEM_REFRESH_ADAPTIVE,
+    CONF_ITEM_REFRESH_INTERVAL_MIN,
+    CONF_ITEM_REFRESH_INTERVAL_MAX,
     CONF_ITEM_MANAGEMENT_CATEGORY,
     CONF_PROXY,
     CONF_PROXY_OPENSOURCE,
+    CONF_PROXY_DIRECT,
     CONF_SELENIUM,
     CONF_SELENIUM_PROXY,
     CONF_DEBUG,
@@ -24,6 +30,7 @@ from .consts.defaults import DOMAIN
 from .datas.unit import ItemUnitType
 from .services.factory import create_service_device_generator, create_service_engine
 from .utilities.list import Lu
+from .utilities.proxy import proxy_manager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,8 +50,18 @@ async def async_setup_entry(
     sensors = []
     proxy = Lu.get_or_default(config, CONF_PROXY, None)
     proxy_opensource = Lu.get_or_default(config, CONF_PROXY_OPENSOURCE, False)
+    proxies = proxy_manager(
+        key=config_entry.entry_id,
+        proxies=proxy,
+        allow_direct=Lu.get_or_default(config, CONF_PROXY_DIRECT, True),
+    )
     selenium = Lu.get_or_default(config, CONF_SELENIUM, None)
     selenium_proxy = Lu.get_or_default(config, CONF_SELENIUM_PROXY, None)
+    coordinator = create_coordinator(
+        entry_id=config_entry.entry_id,
+        service_type=type,
+        debug=Lu.get_or_default(config, CONF_DEBUG, False),
+    )
 
     if CONF_DEVICE in config:
         for device in config[CONF_DEVICE]:
@@ -77,12 +94,13 @@ async def async_setup_entry(
 
             engine = create_service_engine(type)(
                 item_url=target[CONF_ITEM_URL],
-                proxies=proxy,
+                proxies=proxies,
                 device=device,
                 selenium=selenium,
                 selenium_proxy=selenium_proxy,
             )
             sensor = PriceTrackerSensor(
+                coordinator=coordinator,
                 engine=engine,
                 device=device,
                 unit_type=ItemUnitType.of(target[CONF_ITEM_UNIT_TYPE])
@@ -94,6 +112,10 @@ async def async_setup_entry(
                 and target[CONF_ITEM_UNIT_TYPE] != "auto"
                 else 1,
                 refresh_period=Lu.get(target, CONF_ITEM_REFRESH_INTERVAL, 30),
+                max_staleness=Lu.get(target, CONF_ITEM_MAX_STALENESS, 6),
+                adaptive_refresh=Lu.get(target, CONF_ITEM_REFRESH_ADAPTIVE, False),
+                min_refresh_period=Lu.get(target, CONF_ITEM_REFRESH_INTERVAL_MIN, 10),
+                max_refresh_period=Lu.get(target, CONF_ITEM_REFRESH_INTERVAL_MAX, 1440),
                 management_category=Lu.get(target, CONF_ITEM_MANAGEMENT_CATEGORY, None),
                 management_categories=Lu.get(
                     target, CONF_ITEM_MANAGEMENT_CATEGORIES, None
@@ -118,7 +140,8 @@ async def async_setup_entry(
         except Exception as e:
             _LOGGER.exception("Device(sensor) configuration error {}".format(e), e)
 
-    async_add_entities(sensors, update_before_add=True)
+    # Loads are scheduled by the coordinator; adding entities never waits on them
+    async_add_entities(sensors)
 
 
 async def update_listener(
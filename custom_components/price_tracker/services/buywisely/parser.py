@@ -1,10 +1,11 @@
-from bs4 import BeautifulSoup
 import re
 import logging
 import bs4
 
 from nextjs_hydration_parser import NextJSHydrationDataExtractor
 
+from custom_components.price_tracker.utilities.parser import parse_html
+
 _LOGGER = logging.getLogger(__name__)
 
 def find_product_data(data):
@@ -56,7 +57,7 @@ def parse_product(html: str, product_id: str | None = None, recency_days: int =
         _LOGGER.error(f"BuyWisely Parser: Error parsing with nextjs_hydration_parser: {e}")
 
     # Keep the existing logic for price and image as a fallback
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
     if not title:
         title_element = soup.select_one('h2')
         title = title_element.text.strip() if title_element else None
@@ -44,6 +44,7 @@ class CoupangEngine(PriceEngine):
 
     async def load(self) -> ItemData | None:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
@@ -77,7 +78,7 @@ class CoupangEngine(PriceEngine):
             return None
 
         logging_for_response(data, __name__, "coupang")
-        coupang_parser = CoupangParser(text=data)
+        coupang_parser = CoupangParser(text=response.json)
 
         return ItemData(
             id=self.id_str(),
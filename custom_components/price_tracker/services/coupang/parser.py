@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 import re
 
@@ -13,53 +12,80 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_number
+from custom_components.price_tracker.utilities.parser import parse_json, parse_number
 
 _LOGGER = logging.getLogger(__name__)
 
+_PAGE_LIST = Lu.path("rData.pageList")
+_VIEW_TYPE = Lu.path("entity.viewType")
+_MEDIA = Lu.path("entity.medias.0.detail")
+_DELIVERY_DATE = Lu.path("entity.deliveryDate")
+_SHIPPING_FEE = Lu.path("entity.deliveryInfo.shippingFee")
+_FINAL_PRICE = Lu.path("priceInfo.finalPrice.0")
+_ORIGINAL_PRICE = Lu.path("priceInfo.originalPrice.0")
+_TITLE = Lu.path("entity.title.0.text")
+# Logging schemas carrying the item's flags (brand, rocket type, stock, ...)
+_MANDATORY = [
+    Lu.path("rData.properties.pageSession.logging.exposureSchema.mandatory"),
+    Lu.path("rData.properties.pageSession.logging.bypass.exposureSchema.mandatory"),
+    Lu.path("rData.properties.itemDetail.logging.exposureSchema.mandatory"),
+    Lu.path("rData.properties.itemDetail.logging.bypass.exposureSchema.mandatory"),
+    Lu.path(
+        "rData.properties.itemDetail.handleBarLogging.bypass.exposureSchema.mandatory"
+    ),
+]
+
+
+def _index_widgets(widgets: list) -> dict[str, dict]:
+    """viewType -> widget, keeping the first widget of each type like Lu.find"""
+    index = {}
+
+    for widget in widgets:
+        index.setdefault(Lu.get(widget, _VIEW_TYPE), widget)
+
+    return index
+
 
 class CoupangParser:
     _data: dict
     _base: dict
     _page_atf: dict
     _media: dict
+    _atf_widgets: dict[str, dict]
+    _base_widgets: dict[str, dict]
 
-    def __init__(self, text: str):
+    def __init__(self, text: str | dict):
         try:
-            data = json.loads(text)
+            data = parse_json(text)
 
             if "rCode" not in data or data["rCode"] != "RET0000":
                 raise DataParseError(
                     "Coupang Parse Error (rCode) - {}".format(data["rCode"])
                 )
+            pages = Lu.get(data, _PAGE_LIST)
             self._page_atf = Lu.get(
-                Lu.find(Lu.get(data, "rData.pageList"), "page", "PAGE_ATF"),
+                Lu.find(pages, "page", "PAGE_ATF"),
                 "widgetList",
                 [],
             )
             self._base = Lu.get(
                 Lu.find(
-                    Lu.get(data, "rData.pageList"),
+                    pages,
                     "page",
                     "PAGE_HANDLEBAR",
-                    Lu.find(
-                        Lu.get(data, "rData.pageList"),
-                        "page",
-                        "PAGE_FASHION_HANDLEBAR",
-                        {},
-                    ),
+                    Lu.find(pages, "page", "PAGE_FASHION_HANDLEBAR", {}),
                 ),
                 "widgetList",
                 [],
             )
+            # One pass per page; every property reads widgets from these indexes
+            self._atf_widgets = _index_widgets(self._page_atf)
+            self._base_widgets = _index_widgets(self._base)
+            base_info = self._base_widgets.get("PRODUCT_DETAIL_BASE_INFO", {})
+
             self._media = Lu.get(
-                Lu.find(
-                    self._page_atf,
-                    "entity.viewType",
-                    "PRODUCT_DETAIL_ITEM_THUMBNAILS",
-                    {},
-                ),
-                "entity.medias.0.detail",
+                self._atf_widgets.get("PRODUCT_DETAIL_ITEM_THUMBNAILS", {}),
+                _MEDIA,
                 [],
             )
             self._data = {}
@@ -67,12 +93,8 @@ class CoupangParser:
             delivery = "".join(
                 Lu.map(
                     Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_HANDLEBAR_QUANTITY",
-                        ),
-                        "entity.deliveryDate",
+                        self._base_widgets.get("PRODUCT_DETAIL_HANDLEBAR_QUANTITY"),
+                        _DELIVERY_DATE,
                         [],
                     ),
                     lambda x: x["text"],
@@ -80,16 +102,7 @@ class CoupangParser:
             )
             delivery_price = "".join(
                 Lu.map(
-                    Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_BASE_INFO",
-                            {},
-                        ),
-                        "entity.deliveryInfo.shippingFee",
-                        [],
-                    ),
+                    Lu.get(base_info, _SHIPPING_FEE, []),
                     lambda x: x["text"] if x is not None else "",
                 )
             )
@@ -106,57 +119,19 @@ class CoupangParser:
                 **self._data,
                 **{
                     "finalPrice": Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_BASE_INFO",
-                            {},
-                        ),
-                        "priceInfo.finalPrice.0",
-                        Lu.get(self._data, "finalPrice"),
+                        base_info, _FINAL_PRICE, Lu.get(self._data, "finalPrice")
                     )
                 },
                 **{
                     "originalPrice": Lu.get(
-                        Lu.find(
-                            self._base,
-                            "entity.viewType",
-                            "PRODUCT_DETAIL_BASE_INFO",
-                            {},
-                        ),
-                        "priceInfo.originalPrice.0",
+                        base_info,
+                        _ORIGINAL_PRICE,
                         Lu.get(self._data, "originalPrice"),
                     )
                 },
             }
-            self._data = {
-                **self._data,
-                **Lu.get(
-                    data,
-                    "rData.properties.pageSession.logging.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.pageSession.logging.bypass.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.itemDetail.logging.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.itemDetail.logging.bypass.exposureSchema.mandatory",
-                    {},
-                ),
-                **Lu.get(
-                    data,
-                    "rData.properties.itemDetail.handleBarLogging.bypass.exposureSchema.mandatory",
-                    {},
-                ),
-            }
+            for path in _MANDATORY:
+                self._data = {**self._data, **Lu.get(data, path, {})}
 
         except DataParseError as e:
             raise e
@@ -166,8 +141,8 @@ class CoupangParser:
     @property
     def name(self):
         return Lu.get(
-            Lu.find(self._page_atf, "entity.viewType", "PRODUCT_DETAIL_PRODUCT_INFO"),
-            "entity.title.0.text",
+            self._atf_widgets.get("PRODUCT_DETAIL_PRODUCT_INFO"),
+            _TITLE,
             "Unknown (Coupang)",
         )
 
@@ -33,6 +33,7 @@ class DaisoKrEngine(PriceEngine):
 
     async def load(self) -> ItemData | None:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
@@ -54,7 +55,7 @@ class DaisoKrEngine(PriceEngine):
             )
 
         logging_for_response(response, __name__, "daiso_kr")
-        parser = DaisoKrParser(data=response.data)
+        parser = DaisoKrParser(data=response.json)
 
         return ItemData(
             id=self.id_str(),
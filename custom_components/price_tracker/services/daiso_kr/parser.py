@@ -1,5 +1,3 @@
-import json
-
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
@@ -10,19 +8,19 @@ from custom_components.price_tracker.datas.delivery import (
 from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData
-from custom_components.price_tracker.utilities.parser import parse_bool
+from custom_components.price_tracker.utilities.parser import parse_bool, parse_json
 
 
 class DaisoKrParser:
-    def __init__(self, data: str | None):
+    def __init__(self, data: str | dict | None):
         """Initialize the parser."""
         if data is None:
             raise DataParseError("Empty data for daiso kr")
 
         try:
-            parse = json.loads(data)
+            parse = parse_json(data)
             self._data = parse.get("data")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise DataParseError("Failed to parse data for daiso kr") from e
 
     @property
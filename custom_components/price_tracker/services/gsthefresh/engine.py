@@ -52,7 +52,9 @@ class GsTheFreshEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
-            selenium=self._selenium, selenium_proxy=self._selenium_proxy
+            rate_limit_key=self.engine_code(),
+            selenium=self._selenium,
+            selenium_proxy=self._selenium_proxy,
         )
         request.headers({**_REQUEST_HEADERS, **self.device.headers})
         request.auth(self.device.access_token)
@@ -71,7 +73,7 @@ class GsTheFreshEngine(PriceEngine):
             )
 
         logging_for_response(result, __name__, "gsthefresh")
-        gs_parser = GsthefreshParser(text=result)
+        gs_parser = GsthefreshParser(text=http_result.json)
 
         return ItemData(
             id=self.id_str(),
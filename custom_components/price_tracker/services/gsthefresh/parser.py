@@ -1,5 +1,3 @@
-import json
-
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.delivery import (
     DeliveryData,
@@ -10,16 +8,20 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_bool, parse_number
+from custom_components.price_tracker.utilities.parser import (
+    parse_bool,
+    parse_json,
+    parse_number,
+)
 
 
 class GsthefreshParser:
     _data: dict
     _item: dict
 
-    def __init__(self, text: str):
+    def __init__(self, text: str | dict):
         try:
-            parse = json.loads(text)
+            parse = parse_json(text)
 
             if (
                 "data" not in parse
@@ -40,6 +40,7 @@ class HomeplusEngine(PriceEngine):
 
     async def load(self) -> ItemData | None:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
@@ -48,10 +49,14 @@ class HomeplusEngine(PriceEngine):
         request.accept_encoding("gzip, deflate, br")
         request.cookie(key="domainType", value="mobile")
         request.user_agent(user_agent=_UA)
+        request.cache()
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.id)
         )
 
+        if response.parsed is not None:
+            return response.parsed
+
         if response.is_not_found:
             return ItemData(
                 id=self.id_str(),
@@ -62,7 +67,7 @@ class HomeplusEngine(PriceEngine):
         logging_for_response(response, __name__, "homeplus")
         parser = HomeplusParser(html=response.data)
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             brand=parser.brand,
             name=parser.name,
@@ -79,6 +84,8 @@ class HomeplusEngine(PriceEngine):
             inventory=parser.inventory_status,
         )
 
+        return response.remember(item)
+
     def id_str(self) -> str:
         return "{}".format(self.id)
 
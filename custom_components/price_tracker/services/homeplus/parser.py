@@ -1,8 +1,6 @@
 import json
 import logging
 
-from bs4 import BeautifulSoup
-
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
@@ -15,7 +13,11 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_bool, parse_number
+from custom_components.price_tracker.utilities.parser import (
+    parse_bool,
+    parse_number,
+    parse_html,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,7 +28,7 @@ class HomeplusParser:
 
     def __init__(self, html: str):
         self._html = html
-        self._soup = BeautifulSoup(html, "html.parser")
+        self._soup = parse_html(html)
         self._json_raw = self._soup.find("script", {"id": "/item/getItemDetail.json"})
         if self._json_raw:
             try:
@@ -36,6 +36,7 @@ class IdusEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
@@ -45,7 +46,7 @@ class IdusEngine(PriceEngine):
             method=SafeRequestMethod.GET, url=_URL.format(self.product_id)
         )
         data = response.data
-        idus_parser = IdusParser(text=data)
+        idus_parser = IdusParser(text=response.json)
         logging_for_response(data, __name__)
 
         return ItemData(
@@ -1,20 +1,18 @@
-import json
-
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import DeliveryData, DeliveryPayType
 from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData
-from custom_components.price_tracker.utilities.parser import parse_float
+from custom_components.price_tracker.utilities.parser import parse_float, parse_json
 
 
 class IdusParser:
     _data: dict
 
-    def __init__(self, text: str):
+    def __init__(self, text: str | dict):
         try:
-            parse = json.loads(text)
+            parse = parse_json(text)
             self._data = parse["items"]
         except Exception as e:
             raise DataParseError("Idus Parser Error") from e
@@ -10,15 +10,20 @@ from custom_components.price_tracker.datas.item import ItemData, ItemStatus
 from custom_components.price_tracker.services.kurly.const import NAME, CODE
 from custom_components.price_tracker.services.kurly.parser import KurlyParser
 from custom_components.price_tracker.utilities.logs import logging_for_response
+from custom_components.price_tracker.utilities.proxy import ProxyManager
+from custom_components.price_tracker.utilities.retry import SafeRequestRetryPolicy
 from custom_components.price_tracker.utilities.safe_request import (
     SafeRequest,
     SafeRequestMethod,
 )
+from custom_components.price_tracker.utilities.token_cache import token_cache
 
 _LOGGER = logging.getLogger(__name__)
 _AUTH_URL = "https://api.kurly.com/v3/auth/guest"
 _URL = "https://api.kurly.com/showroom/v2/products/{}"
 _ITEM_LINK = "https://www.kurly.com/goods/{}"
+# A rejected token is replaced instead of retried
+_PRODUCT_RETRY_POLICY = SafeRequestRetryPolicy(retry_client_errors=False)
 
 
 class KurlyEngine(PriceEngine):
@@ -38,20 +43,61 @@ class KurlyEngine(PriceEngine):
         self._selenium_proxy = selenium_proxy
 
     async def load(self) -> ItemData | None:
-        request = SafeRequest(
+        return await self._load(await self._access_token())
+
+    @classmethod
+    async def load_many(
+        cls, engines: list["KurlyEngine"]
+    ) -> list[ItemData | None | BaseException]:
+        # One guest token for the whole batch instead of one per item
+        try:
+            access_token = await engines[0]._access_token()
+        except Exception as e:
+            return [e for _ in engines]
+
+        return await cls.gather(engines, lambda engine: engine._load(access_token))
+
+    def _request(self) -> SafeRequest:
+        return SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
         )
-        auth_response = await request.request(
+
+    def _token_key(self) -> tuple:
+        # Guest tokens are shared per proxy setup, not per item
+        proxies = (
+            self._proxies.proxies
+            if isinstance(self._proxies, ProxyManager)
+            else self._proxies or []
+        )
+
+        return CODE, tuple(proxies)
+
+    async def _access_token(self) -> str:
+        return await token_cache().get(self._token_key(), self._auth)
+
+    async def _auth(self) -> tuple[str, Optional[float]]:
+        auth_response = await self._request().request(
             method=SafeRequestMethod.POST, url=_AUTH_URL
         )
-        auth_data = auth_response.json
-        request.auth(auth_data["data"]["access_token"])
+
+        # Expiry comes from the token's own exp claim
+        return auth_response.json["data"]["access_token"], None
+
+    async def _load(self, access_token: str, reauth: bool = True) -> ItemData | None:
+        request = self._request().retry_policy(_PRODUCT_RETRY_POLICY)
+        request.auth(access_token)
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.id)
         )
 
+        if reauth and any(r.status_code == 401 for r in request.retries):
+            token_cache().invalidate(self._token_key(), access_token)
+
+            return await self._load(await self._access_token(), reauth=False)
+
         if response.is_not_found:
             return ItemData(
                 id=self.id_str(),
@@ -63,7 +109,7 @@ class KurlyEngine(PriceEngine):
 
         logging_for_response(data, __name__, "kurly")
 
-        kurly_parser = KurlyParser(text=data)
+        kurly_parser = KurlyParser(text=response.json)
 
         return ItemData(
             id=self.id_str(),
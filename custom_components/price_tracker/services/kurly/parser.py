@@ -1,5 +1,4 @@
 import datetime
-import json
 import re
 
 from custom_components.price_tracker.components.error import DataParseError
@@ -14,15 +13,15 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_float
+from custom_components.price_tracker.utilities.parser import parse_float, parse_json
 
 
 class KurlyParser:
     _data: dict
 
-    def __init__(self, text: str):
+    def __init__(self, text: str | dict):
         try:
-            parse = json.loads(text)
+            parse = parse_json(text)
             self._data = parse["data"]
         except Exception as e:
             raise DataParseError("Failed to parse data") from e
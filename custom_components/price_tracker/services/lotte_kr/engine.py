@@ -36,6 +36,7 @@ class LotteOnEngine(PriceEngine):
 
     async def load(self) -> ItemData | None:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
@@ -56,7 +57,7 @@ class LotteOnEngine(PriceEngine):
 
         logging_for_response(response, __name__, "lotte_on")
 
-        pre_parse = LotteOnParser(data=response.data)
+        pre_parse = LotteOnParser(data=response.json)
 
         discount_response = await request.request(
             method=SafeRequestMethod.POST,
@@ -66,7 +67,7 @@ class LotteOnEngine(PriceEngine):
 
         logging_for_response(response, __name__, "lotte_on")
 
-        parser = LotteOnParser(data=response.data, discount=discount_response.data)
+        parser = LotteOnParser(data=response.json, discount=discount_response.json)
 
         return ItemData(
             id=self.id_str(),
@@ -1,5 +1,4 @@
 import datetime
-import json
 
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.category import ItemCategoryData
@@ -13,12 +12,13 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.parser import parse_json
 
 
 class LotteOnParser:
-    def __init__(self, data: str, discount: str | None = None):
+    def __init__(self, data: str | dict, discount: str | dict | None = None):
         try:
-            parse = json.loads(data)
+            parse = parse_json(data)
             self._data = parse
             self._basic = parse["data"]["basicInfo"]
             self._images = parse["data"]["imgInfo"]
@@ -29,7 +29,7 @@ class LotteOnParser:
             self._category = parse["data"]["dispCategoryInfo"]
 
             if discount:
-                self._discount = json.loads(discount)
+                self._discount = parse_json(discount)
         except Exception as e:
             raise DataParseError("Lotte ON Parser Error") from e
 
@@ -36,6 +36,7 @@ class NcncEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
@@ -59,7 +60,7 @@ class NcncEngine(PriceEngine):
         if not response.has or "error" in response.json:
             return None
 
-        ncnc_parser = NcncParser(text=data)
+        ncnc_parser = NcncParser(text=response.json)
 
         return ItemData(
             id=self.id_str(),
@@ -1,20 +1,19 @@
-import json
-
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import DeliveryData, DeliveryType
 from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData
+from custom_components.price_tracker.utilities.parser import parse_json
 
 
 class NcncParser:
     _data: dict = {}
     _item: dict = {}
 
-    def __init__(self, text: str):
+    def __init__(self, text: str | dict):
         try:
-            parse = json.loads(text)
+            parse = parse_json(text)
             self._data = parse
             self._item = self._data["item"]
         except Exception as e:
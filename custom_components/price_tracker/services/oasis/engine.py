@@ -36,6 +36,7 @@ class OasisEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
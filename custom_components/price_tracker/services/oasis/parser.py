@@ -13,7 +13,7 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_number
+from custom_components.price_tracker.utilities.parser import parse_number, parse_html
 
 
 class OasisParser:
@@ -21,7 +21,7 @@ class OasisParser:
 
     def __init__(self, text: str):
         try:
-            self._data = BeautifulSoup(text, "html.parser")
+            self._data = parse_html(text)
         except Exception as e:
             raise DataParseError("OASIS Failed to parse data") from e
 
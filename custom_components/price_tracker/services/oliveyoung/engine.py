@@ -40,16 +40,21 @@ class OliveyoungEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
         )
         request.user_agent(user_agent=OLIVEYOUNG_USER_AGENT)
+        request.cache()
 
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.goods_number)
         )
 
+        if response.parsed is not None:
+            return response.parsed
+
         if response.is_not_found:
             return ItemData(
                 id=self.id_str(),
@@ -60,7 +65,7 @@ class OliveyoungEngine(PriceEngine):
         logging_for_response(response, __name__, "oliveyoung")
         oliveyoung_parser = OliveyoungParser(text=response.data)
 
-        return ItemData(
+        item = ItemData(
             id=self.id_str(),
             brand=oliveyoung_parser.brand,
             name=oliveyoung_parser.name,
@@ -77,6 +82,8 @@ class OliveyoungEngine(PriceEngine):
             ),
         )
 
+        return response.remember(item)
+
     def id_str(self) -> str:
         return self.goods_number
 
@@ -1,7 +1,5 @@
 import json
 
-from bs4 import BeautifulSoup
-
 from custom_components.price_tracker.components.error import DataParseError
 from custom_components.price_tracker.datas.category import ItemCategoryData
 from custom_components.price_tracker.datas.delivery import (
@@ -14,7 +12,11 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_number, parse_bool
+from custom_components.price_tracker.utilities.parser import (
+    parse_number,
+    parse_bool,
+    parse_html,
+)
 
 
 class OliveyoungParser:
@@ -22,7 +24,7 @@ class OliveyoungParser:
 
     def __init__(self, text: str):
         try:
-            soup = BeautifulSoup(text, "html.parser")
+            soup = parse_html(text)
             data = soup.find("textarea", {"id": "goodsData"}).get_text()
             if data is not None:
                 self._data = json.loads(data)
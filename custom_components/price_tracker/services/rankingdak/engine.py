@@ -40,16 +40,21 @@ class RankingdakEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
         )
         request.accept_text_html()
         request.user_agent(mobile_random=True)
+        request.cache()
         response = await request.request(
             method=SafeRequestMethod.GET, url=_URL.format(self.product_id)
         )
 
+        if response.parsed is not None:
+            return response.parsed
+
         if response.is_not_found or not response.has:
             return ItemData(
                 id=self.id_str(),
@@ -62,7 +67,7 @@ class RankingdakEngine(PriceEngine):
         try:
             parser = RankingdakParser(html=response.data)
 
-            return ItemData(
+            item = ItemData(
                 id=self.id_str(),
                 brand=parser.brand,
                 name=parser.name,
@@ -78,6 +83,8 @@ class RankingdakEngine(PriceEngine):
                 options=parser.options,
                 inventory=parser.inventory_status,
             )
+
+            return response.remember(item)
         except NotFoundError as e:
             return ItemData(
                 id=self.id_str(),
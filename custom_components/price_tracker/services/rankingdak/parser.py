@@ -2,8 +2,6 @@ import logging
 import re
 from datetime import datetime
 
-from bs4 import BeautifulSoup
-
 from custom_components.price_tracker.components.error import (
     DataParseError,
     NotFoundError,
@@ -18,7 +16,11 @@ from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.datas.unit import ItemUnitData, ItemUnitType
 from custom_components.price_tracker.utilities.list import Lu
-from custom_components.price_tracker.utilities.parser import parse_float, parse_number
+from custom_components.price_tracker.utilities.parser import (
+    parse_float,
+    parse_number,
+    parse_html,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ _LOGGER = logging.getLogger(__name__)
 class RankingdakParser:
     def __init__(self, html: str):
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = parse_html(html)
             self._html = soup
 
             if (
@@ -14,6 +14,11 @@ from custom_components.price_tracker.components.error import (
 from custom_components.price_tracker.datas.item import ItemData, ItemStatus
 from custom_components.price_tracker.services.smartstore.const import NAME, CODE
 from custom_components.price_tracker.services.smartstore.parser import SmartstoreParser
+from custom_components.price_tracker.services.smartstore.session import (
+    smartstore_warm_states,
+)
+from custom_components.price_tracker.utilities.proxy import ProxyManager
+from custom_components.price_tracker.utilities.retry import SafeRequestRetryPolicy
 from custom_components.price_tracker.utilities.safe_request import (
     SafeRequest,
     SafeRequestMethod,
@@ -23,6 +28,14 @@ from custom_components.price_tracker.utilities.utils import random_choice, rando
 _LOGGER = logging.getLogger(__name__)
 
 _URL = "https://m.{}.naver.com/{}/{}/{}"
+# NAVER throttles aggressively (429); back off longer and give up sooner
+_RETRY_POLICY = SafeRequestRetryPolicy(
+    max_tries=4,
+    base_delay=1.0,
+    rate_limit_delay=10.0,
+    max_elapsed=60.0,
+)
+_ROTATE_STATUS = [403, 429]
 
 
 class SmartstoreEngine(PriceEngine):
@@ -46,13 +59,85 @@ class SmartstoreEngine(PriceEngine):
         self._selenium_proxy = selenium_proxy
 
     async def load(self) -> ItemData | None:
+        warm_key = self._warm_key()
+        state = await smartstore_warm_states().get(warm_key, self._warmup)
+        request = self._request()
+        request.cookie(item=state.cookies)
+
+        response = await request.request(
+            method=SafeRequestMethod.GET,
+            url=_URL.format(self.store_type, self.store, self.detail_type, self.product_id),
+        )
+
+        # Blocked cookies are rotated; the next load warms up a fresh jar
+        if any(r.status_code in _ROTATE_STATUS for r in request.retries):
+            _LOGGER.debug("Blocked by NAVER (%s)", request.retries[-1].status_code)
+            smartstore_warm_states().rotate(warm_key, state)
+        elif response.has:
+            state.cookies = {**state.cookies, **request.cookies}
+
+        if response.is_not_found:
+            return ItemData(
+                id=self.id_str(),
+                name="Deleted {}".format(self.id_str()),
+                status=ItemStatus.DELETED,
+                http_status=response.status_code,
+            )
+
+        ## stdio out
+        text = response.text
+
+        try:
+            naver_parser = SmartstoreParser(data=text)
+
+            return ItemData(
+                id=self.id_str(),
+                price=naver_parser.price,
+                name=naver_parser.name,
+                description=naver_parser.description,
+                category=naver_parser.category,
+                image=naver_parser.image,
+                url=naver_parser.url,
+                inventory=naver_parser.inventory_status,
+                delivery=naver_parser.delivery,
+                options=naver_parser.options,
+                status=ItemStatus.ACTIVE,
+            )
+        except NotFoundError as e:
+            return ItemData(
+                id=self.id_str(),
+                name="Deleted {}".format(self.id_str()),
+                status=ItemStatus.DELETED,
+                http_status=response.status_code,
+            )
+        except Exception as e:
+            raise e
+
+    def _request(self) -> SafeRequest:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             proxies=self._proxies,
             version=CurlHttpVersion.V2_PRIOR_KNOWLEDGE,
             user_agents=["pc", "mobile"],
+            retry_policy=_RETRY_POLICY,
         )
         request.user_agent(user_agent="NAVER(inapp;navershopping;0;1.0.0)")
 
+        return request
+
+    def _warm_key(self) -> tuple:
+        # Cookies are shared per proxy setup, not per item
+        proxies = (
+            self._proxies.proxies
+            if isinstance(self._proxies, ProxyManager)
+            else self._proxies or []
+        )
+
+        return CODE, tuple(proxies)
+
+    async def _warmup(self) -> dict:
+        request = self._request()
+
         if random_bool():
             request.cookie(
                 key="NNB",
@@ -91,50 +176,7 @@ class SmartstoreEngine(PriceEngine):
                   + random_choice(["A", "B", "C", "D", "E", "F"]),
         )
 
-        response = await request.request(
-            method=SafeRequestMethod.GET,
-            url=_URL.format(self.store_type, self.store, self.detail_type, self.product_id),
-        )
-
-        if response.is_not_found:
-            return ItemData(
-                id=self.id_str(),
-                name="Deleted {}".format(self.id_str()),
-                status=ItemStatus.DELETED,
-                http_status=response.status_code,
-            )
-
-        if response.status_code == 429:
-            _LOGGER.debug("429 Too Many Requests in NAVER")
-
-        ## stdio out
-        text = response.text
-
-        try:
-            naver_parser = SmartstoreParser(data=text)
-
-            return ItemData(
-                id=self.id_str(),
-                price=naver_parser.price,
-                name=naver_parser.name,
-                description=naver_parser.description,
-                category=naver_parser.category,
-                image=naver_parser.image,
-                url=naver_parser.url,
-                inventory=naver_parser.inventory_status,
-                delivery=naver_parser.delivery,
-                options=naver_parser.options,
-                status=ItemStatus.ACTIVE,
-            )
-        except NotFoundError as e:
-            return ItemData(
-                id=self.id_str(),
-                name="Deleted {}".format(self.id_str()),
-                status=ItemStatus.DELETED,
-                http_status=response.status_code,
-            )
-        except Exception as e:
-            raise e
+        return request.cookies
 
     def id_str(self) -> str:
         return "{}_{}".format(self.store, self.product_id)
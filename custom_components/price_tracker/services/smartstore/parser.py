@@ -2,8 +2,6 @@ import datetime
 import json
 import re
 
-from bs4 import BeautifulSoup
-
 from custom_components.price_tracker.components.error import (
     DataParseError,
     NotFoundError,
@@ -18,6 +16,12 @@ from custom_components.price_tracker.datas.inventory import InventoryStatus
 from custom_components.price_tracker.datas.item import ItemOptionData
 from custom_components.price_tracker.datas.price import ItemPriceData
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.parser import (
+    parse_assigned_json,
+    parse_html,
+)
+
+_STATE_NAME = "window.__PRELOADED_STATE__"
 
 
 class SmartstoreParser:
@@ -25,15 +29,10 @@ class SmartstoreParser:
         self._html = data
         self._data = None
         try:
-            soup = BeautifulSoup(self._html, "html.parser")
-            scripts = soup.find_all("script")
-            for script in scripts:
-                if "window.__PRELOADED_STATE__" in script.text:
-                    data = re.search(
-                        r"window.__PRELOADED_STATE__=(?P<json>.*)", script.text
-                    )
-                    self._data = json.loads(data["json"])
-                    break
+            self._data = parse_assigned_json(self._html, _STATE_NAME)
+
+            if self._data is None:
+                self._data = SmartstoreParser.parse_state_from_soup(self._html)
 
             if self._data is None:
                 raise DataParseError(
@@ -55,6 +54,21 @@ class SmartstoreParser:
         except Exception as e:
             raise DataParseError("NAVER Response Parse Error - Unknown") from e
 
+    @staticmethod
+    def parse_state_from_soup(html: str) -> dict | None:
+        """Slow path: scan every script tag of the parsed document"""
+        soup = parse_html(html)
+
+        for script in soup.find_all("script"):
+            if _STATE_NAME in script.text:
+                data = re.search(
+                    r"window.__PRELOADED_STATE__=(?P<json>.*)", script.text
+                )
+
+                return json.loads(data["json"])
+
+        return None
+
     @property
     def brand(self):
         return Lu.get(
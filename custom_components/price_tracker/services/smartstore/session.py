@@ -0,0 +1,93 @@
+import logging
+import time
+from typing import Awaitable, Callable, Hashable, Optional
+
+from custom_components.price_tracker.utilities.single_flight import SingleFlight
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_AGE = 1800.0  # seconds
+_MAX_USES = 300
+
+
+class SmartstoreWarmState:
+    def __init__(self, cookies: dict):
+        self.cookies = cookies
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
+class SmartstoreWarmStates:
+    """Warmed NAVER cookie jars shared by every Smartstore engine, rotated when they age out or get blocked."""
+
+    def __init__(self, max_age: float = _MAX_AGE, max_uses: int = _MAX_USES):
+        self._max_age = max_age
+        self._max_uses = max_uses
+        self._states: dict[Hashable, SmartstoreWarmState] = {}
+        self._single_flight = SingleFlight()
+        self._warmups = 0
+        self._rotations = 0
+
+    def _usable(self, state: Optional[SmartstoreWarmState]) -> bool:
+        return (
+            state is not None
+            and state.age < self._max_age
+            and state.uses < self._max_uses
+        )
+
+    async def get(
+        self, key: Hashable, warmup: Callable[[], Awaitable[dict]]
+    ) -> SmartstoreWarmState:
+        state = self._states.get(key)
+
+        if not self._usable(state):
+            # Engines coming due together wait for a single warmup
+            state = await self._single_flight.do(
+                key, lambda: self._warmup(key, warmup), copier=lambda x: x
+            )
+
+        state.uses += 1
+
+        return state
+
+    async def _warmup(
+        self, key: Hashable, warmup: Callable[[], Awaitable[dict]]
+    ) -> SmartstoreWarmState:
+        self._warmups += 1
+        self._states[key] = SmartstoreWarmState(cookies=await warmup())
+
+        return self._states[key]
+
+    def rotate(self, key: Hashable, state: SmartstoreWarmState):
+        """Drop a blocked state so the next load warms up a fresh one"""
+        if self._states.get(key) is state:
+            _LOGGER.debug("Rotate NAVER warm state %s after %s uses", key, state.uses)
+            self._rotations += 1
+            del self._states[key]
+
+    def clear(self):
+        self._states.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "states": len(self._states),
+            "warmups": self._warmups,
+            "rotations": self._rotations,
+        }
+
+
+_WARM_STATES: Optional[SmartstoreWarmStates] = None
+
+
+def smartstore_warm_states() -> SmartstoreWarmStates:
+    global _WARM_STATES
+
+    if _WARM_STATES is None:
+        _WARM_STATES = SmartstoreWarmStates()
+
+    return _WARM_STATES
@@ -39,6 +39,7 @@ class SsgEngine(PriceEngine):
 
     async def load(self) -> ItemData:
         request = SafeRequest(
+            rate_limit_key=self.engine_code(),
             selenium=self._selenium,
             selenium_proxy=self._selenium_proxy,
             proxies=self._proxy,
@@ -67,7 +68,7 @@ class SsgEngine(PriceEngine):
         logging_for_response(text, __name__, "ssg")
 
         try:
-            ssg_parser = SsgParser(text)
+            ssg_parser = SsgParser(response.json)
 
             return ItemData(
                 id=self.product_id,
@@ -1,4 +1,3 @@
-import json
 import re
 
 from custom_components.price_tracker.components.error import (
@@ -18,6 +17,7 @@ from custom_components.price_tracker.utilities.list import Lu
 from custom_components.price_tracker.utilities.parser import (
     parse_float,
     parse_bool,
+    parse_json,
     parse_number,
 )
 
@@ -26,9 +26,9 @@ class SsgParser:
     _data: dict
     _item: dict
 
-    def __init__(self, response: str):
+    def __init__(self, response: str | dict):
         try:
-            j = json.loads(response)
+            j = parse_json(response)
 
             if Lu.get(j, "data.action.type") == "0001":
                 raise NotFoundError("SSG Parser Item not found")
@@ -1,8 +1,61 @@
-
+import asyncio
 import sys
 import os
 
 # Add the repository root to sys.path for robust import resolution
-repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')) # Adjust path to main project root
+repo_root = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)  # Adjust path to main project root
 if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
+
+import pytest  # noqa: E402
+
+from custom_components.price_tracker.components.engine import PriceEngine  # noqa: E402
+from custom_components.price_tracker.datas.item import ItemData  # noqa: E402
+from custom_components.price_tracker.datas.price import ItemPriceData  # noqa: E402
+
+
+class FakeEngine(PriceEngine):
+    """Engine returning scripted prices (exceptions in the script are raised)"""
+
+    code = "test"
+    batches: list[list[str]] = []
+
+    def __init__(self, prices: list, id: str = "1", delay: float = 0.0):
+        self.id = id
+        self._prices = prices
+        self._delay = delay
+        self.loads = 0
+
+    async def load(self):
+        self.loads += 1
+
+        if self._delay > 0:
+            await asyncio.sleep(self._delay)
+
+        price = self._prices.pop(0)
+
+        if isinstance(price, Exception):
+            raise price
+
+        return ItemData(id=self.id, price=ItemPriceData(price=price))
+
+    @classmethod
+    async def load_many(cls, engines):
+        cls.batches.append([e.id for e in engines])
+
+        return await super().load_many(engines)
+
+    def id_str(self) -> str:
+        return self.id
+
+    @classmethod
+    def engine_code(cls) -> str:
+        return cls.code
+
+
+@pytest.fixture
+def fake_engine(request) -> type[FakeEngine]:
+    """FakeEngine class with its own engine code (circuit breaker) and batch log"""
+    return type("FakeEngine", (FakeEngine,), {"code": request.node.name, "batches": []})
@@ -0,0 +1,52 @@
+import time
+
+from custom_components.price_tracker.utilities.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerState,
+)
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3)
+    changes = []
+    breaker.add_listener(lambda: changes.append(breaker.state))
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow() is True
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert breaker.allow() is False
+    assert changes == [CircuitBreakerState.OPEN]
+
+
+def test_circuit_breaker_half_open_single_probe():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+
+    assert breaker.allow() is True
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    assert breaker.allow() is False
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.allow() is True
+
+
+def test_circuit_breaker_failed_probe_reopens_longer():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+
+    assert breaker.allow() is True
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert breaker.stats["opened"] == 2
+    time.sleep(0.015)
+    assert breaker.allow() is False
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from custom_components.price_tracker.utilities.concurrency import (
+    FairConcurrencyLimiter,
+)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limits():
+    limiter = FairConcurrencyLimiter(limit=3, service_limit=2)
+    peak = {"all": 0, "a": 0}
+    running = {"all": 0, "a": 0}
+
+    async def load(key):
+        async with limiter.slot(key):
+            running["all"] += 1
+            running["a"] += key == "a"
+            peak["all"] = max(peak["all"], running["all"])
+            peak["a"] = max(peak["a"], running["a"])
+            await asyncio.sleep(0.01)
+            running["all"] -= 1
+            running["a"] -= key == "a"
+
+    await asyncio.gather(*[load("a") for _ in range(6)], *[load("b") for _ in range(6)])
+
+    assert peak["all"] == 3
+    assert peak["a"] == 2
+    assert limiter.stats["running"] == 0
+    assert limiter.stats["services"]["a"]["waited"] > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_round_robin_across_services():
+    limiter = FairConcurrencyLimiter(limit=1, service_limit=1)
+    order = []
+
+    async def load(key):
+        async with limiter.slot(key):
+            order.append(key)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        *[load("slow") for _ in range(3)], *[load("fast") for _ in range(3)]
+    )
+
+    # The second service does not wait behind the whole backlog of the first
+    assert order[:4] == ["slow", "fast", "slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cancelled_waiter_releases_nothing():
+    limiter = FairConcurrencyLimiter(limit=1, service_limit=1)
+    gate = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot("a"):
+            await gate.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    gate.set()
+    await holder
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.stats["running"] == 0
+    assert limiter.stats["queued"] == 0
@@ -0,0 +1,150 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from custom_components.price_tracker.components.coordinator import (
+    PriceTrackerCoordinator,
+)
+from custom_components.price_tracker.components.engine import PriceEngine
+from custom_components.price_tracker.utilities.single_flight import single_flight
+
+
+@pytest.mark.asyncio
+async def test_coordinator_notifies_listeners_on_refresh(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    engine = fake_engine([1000, 900], id="1")
+    item = coordinator.add("sensor_a", engine, refresh_period=30)
+    calls = []
+    coordinator.async_add_listener("sensor_a", lambda: calls.append(item.revision))
+
+    await coordinator.async_refresh("sensor_a")
+    assert item.item_data.price.price == 1000
+    assert calls == [1]
+
+    # Within the refresh period nothing is loaded, but views are still notified
+    await coordinator.async_refresh("sensor_a")
+    assert engine.loads == 1
+    assert calls == [1, 1]
+
+    await coordinator.async_refresh("sensor_a", force=True)
+    assert item.price_change.before_price == 1000
+    assert item.price_change.after_price == 900
+    assert calls == [1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_keeps_item_available_on_recent_failure(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    engine = fake_engine([1000, Exception("boom")], id="1")
+    item = coordinator.add("sensor_a", engine, refresh_period=30)
+
+    await coordinator.async_refresh("sensor_a")
+    await coordinator.async_refresh("sensor_a", force=True)
+
+    assert item.engine_status is False
+    assert item.available is True
+    assert item.revision == 1
+    assert item.item_data.price.price == 1000
+    assert coordinator.stats == {
+        "items": 1,
+        "available": 1,
+        "failing": 1,
+        "stale": 1,
+        "batches": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_unknown_item_is_ignored():
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+
+    await coordinator.async_refresh("missing")
+    assert coordinator.item("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_coordinator_batches_items_due_together(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    items = [
+        coordinator.add(f"sensor_{i}", fake_engine([100 * i], id=str(i)), 30)
+        for i in range(1, 4)
+    ]
+
+    await asyncio.gather(
+        *[coordinator.async_refresh(f"sensor_{i}") for i in range(1, 4)]
+    )
+
+    assert fake_engine.batches == [["1", "2", "3"]]
+    assert [i.item_data.price.price for i in items] == [100, 200, 300]
+
+
+@pytest.mark.asyncio
+async def test_engine_gather_keeps_order_and_errors(fake_engine):
+    engines = [fake_engine([100], id="1"), fake_engine([ValueError("x")], id="2")]
+
+    results = await PriceEngine.gather(engines, lambda e: e.load())
+
+    assert results[0].price.price == 100
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_stale_data_until_max_staleness(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    engine = fake_engine([1000, Exception("boom"), Exception("boom")], id="1")
+    item = coordinator.add("sensor_a", engine, refresh_period=30, max_staleness=1)
+
+    await coordinator.async_refresh("sensor_a")
+    assert item.stale is False
+    assert item.age_seconds == 0
+
+    await coordinator.async_refresh("sensor_a", force=True)
+    assert item.stale is True
+    assert item.available is True
+
+    item.fetched_at -= timedelta(hours=2)
+    await coordinator.async_refresh("sensor_a", force=True)
+    assert item.available is False
+    assert item.age_seconds >= 7200
+
+
+@pytest.mark.asyncio
+async def test_coordinator_adapts_interval_to_price_changes(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    engine = fake_engine([1000, 1000, 1000, 1000, 900], id="1")
+    item = coordinator.add(
+        "sensor_a",
+        engine,
+        refresh_period=30,
+        adaptive=True,
+        min_refresh_period=10,
+        max_refresh_period=100,
+    )
+
+    assert await coordinator._async_scheduled_refresh("sensor_a") == 30 * 60
+    assert await coordinator._async_scheduled_refresh("sensor_a") == 60 * 60
+    await coordinator._async_scheduled_refresh("sensor_a")
+    assert await coordinator._async_scheduled_refresh("sensor_a") == 100 * 60
+
+    # A price drop pulls it back below the base interval
+    assert await coordinator._async_scheduled_refresh("sensor_a") == 15 * 60
+    assert item.interval == 15
+
+
+@pytest.mark.asyncio
+async def test_coordinator_shutdown_releases_loads_in_flight(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    coordinator.add("loading", fake_engine([1000], id="1", delay=5), 30)
+    coordinator.add("queued", fake_engine([1000], id="2"), 30)
+
+    loading = asyncio.ensure_future(coordinator.async_refresh("loading"))
+    await asyncio.sleep(0.3)  # past the batch window; the batch is loading
+    queued = asyncio.ensure_future(coordinator.async_refresh("queued"))
+    await asyncio.sleep(0)
+
+    await coordinator.async_shutdown()
+    await asyncio.wait_for(asyncio.gather(loading, queued), timeout=1)
+
+    assert single_flight().stats["in_flight"] == 0
+    assert coordinator.stats["batches"] == 1
@@ -0,0 +1,57 @@
+from custom_components.price_tracker.services.coupang.parser import CoupangParser
+
+
+def _widget(view_type: str, **fields) -> dict:
+    return {"entity": {"viewType": view_type}, **fields}
+
+
+def _response(handlebar_page: str = "PAGE_HANDLEBAR") -> dict:
+    return {
+        "rCode": "RET0000",
+        "rData": {
+            "pageList": [
+                {
+                    "page": "PAGE_ATF",
+                    "widgetList": [
+                        _widget("OTHER"),
+                        {
+                            "entity": {
+                                "viewType": "PRODUCT_DETAIL_PRODUCT_INFO",
+                                "title": [{"text": "상품"}],
+                            }
+                        },
+                    ],
+                },
+                {
+                    "page": handlebar_page,
+                    "widgetList": [
+                        _widget("PRODUCT_DETAIL_HANDLEBAR_QUANTITY"),
+                        _widget(
+                            "PRODUCT_DETAIL_BASE_INFO",
+                            priceInfo={"finalPrice": [1000], "originalPrice": [1200]},
+                        ),
+                        # Only the first widget of a viewType is used
+                        _widget(
+                            "PRODUCT_DETAIL_BASE_INFO",
+                            priceInfo={"finalPrice": [1], "originalPrice": [1]},
+                        ),
+                    ],
+                },
+            ],
+            "properties": {},
+        },
+    }
+
+
+def test_widgets_are_read_by_view_type():
+    parser = CoupangParser(_response())
+
+    assert parser.name == "상품"
+    assert parser.price.price == 1000
+    assert parser.price.original_price == 1200
+
+
+def test_fashion_handlebar_page():
+    parser = CoupangParser(_response(handlebar_page="PAGE_FASHION_HANDLEBAR"))
+
+    assert parser.price.price == 1000
@@ -0,0 +1,30 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.price_tracker.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redacts_item_proxies():
+    entry = MagicMock()
+    entry.entry_id = "diagnostics"
+    entry.data = {"type": "coupang", "proxy": "http://user:pass@a:8080"}
+    entry.options = {
+        "target": [
+            {
+                "item_url": "https://example.com/1",
+                "proxy": "http://user:pass@b:8080",
+                "selenium_proxy": "http://user:pass@c:8080",
+            }
+        ]
+    }
+
+    result = await async_get_config_entry_diagnostics(MagicMock(), entry)
+
+    assert "user:pass" not in repr(result["entry"])
+    assert result["entry"]["options"]["target"][0]["item_url"] == (
+        "https://example.com/1"
+    )
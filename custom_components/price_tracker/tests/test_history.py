@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from custom_components.price_tracker.datas.history import ItemPriceHistory
+
+
+def test_history_summary_of_partial_buffer():
+    history = ItemPriceHistory(capacity=4)
+
+    for price in [300, 100, 200]:
+        history.append(price)
+
+    summary = history.summary
+    assert (summary.min_price, summary.max_price) == (100, 300)
+    assert summary.average_price == 200
+    assert summary.lowest_price == 100
+
+
+def test_history_rolling_window_matches_scan():
+    history = ItemPriceHistory(capacity=8)
+    prices = [random.randint(1, 50) * 100 for _ in range(100)]
+
+    for i, price in enumerate(prices):
+        history.append(price, rank=i % 3, timestamp=i)
+        window = prices[max(0, i - 7) : i + 1]
+        summary = history.summary
+
+        assert summary.min_price == min(window)
+        assert summary.max_price == max(window)
+        assert summary.average_price == pytest.approx(sum(window) / len(window), 0.01)
+        assert summary.lowest_price == min(prices[: i + 1])
+
+    assert len(history) == 8
+    assert [p for _, p, _ in history.samples] == prices[-8:]
+
+
+def test_history_restore_lowest():
+    history = ItemPriceHistory()
+    history.restore_lowest(500)
+    history.append(700)
+
+    assert history.summary.lowest_price == 500
+    assert history.summary.min_price == 700
@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+from custom_components.price_tracker.components.history_store import (
+    PriceHistoryStore,
+    async_close_history_store,
+    async_open_history_store,
+    get_history_store,
+)
+
+
+@pytest.mark.asyncio
+async def test_history_store_batches_and_queries(tmp_path):
+    store = PriceHistoryStore(str(tmp_path / "history.db"), batch_size=1000)
+    await store.async_open()
+
+    for ts, price in enumerate([1000, 900, 950, 800]):
+        store.add("item_a", price=price, original_price=1000, inventory_rank=10, ts=ts)
+    store.add("item_b", price=5, ts=1)
+
+    # Nothing written until a flush
+    assert store.stats == {"pending": 5, "written": 0, "flushes": 0}
+
+    samples = await store.async_range("item_a", start=1, end=2)
+    assert [s["price"] for s in samples] == [900, 950]
+    assert store.stats["flushes"] == 1
+
+    aggregate = await store.async_aggregate("item_a")
+    assert aggregate["min_price"] == 800
+    assert aggregate["max_price"] == 1000
+    assert aggregate["count"] == 4
+    assert aggregate["average_price"] == pytest.approx(912.5)
+
+    assert len(await store.async_range("item_a", limit=2)) == 2
+
+    await store.async_close()
+
+
+@pytest.mark.asyncio
+async def test_history_store_failed_open_is_not_published(tmp_path):
+    with pytest.raises(sqlite3.OperationalError):
+        await async_open_history_store(str(tmp_path / "missing" / "history.db"))
+
+    assert get_history_store() is None
+
+    store = await async_open_history_store(str(tmp_path / "history.db"))
+    assert get_history_store() is store
+
+    await async_close_history_store()
+    assert get_history_store() is None
+
+
+@pytest.mark.asyncio
+async def test_history_store_close_releases_connection_on_flush_error(tmp_path):
+    store = PriceHistoryStore(str(tmp_path / "history.db"))
+    await store.async_open()
+    connection = store._connection
+    store.add("item_a", price=1000)
+
+    def fail(rows):
+        raise OSError("disk full")
+
+    store._write = fail
+
+    with pytest.raises(OSError):
+        await store.async_close()
+
+    assert store._connection is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
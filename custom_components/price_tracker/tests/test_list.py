@@ -10,3 +10,30 @@ def test_array_access():
     result = Lu.find(test, "entity.viewType", "ACCESS_TARGET")
 
     assert result == test[1]
+
+
+def test_path_is_compiled_once():
+    assert Lu.path("a.b.0") is Lu.path("a.b.0")
+    assert Lu.path("a.b.0").parts == (("a", None), ("b", None), ("0", 0))
+
+
+def test_get_with_path():
+    target = {"a": {"b": [{"c": 1}, {"c": 2}]}, "x.y": 3, "0": "zero"}
+
+    for key in ["a.b.1.c", "a.b.5.c", "a.missing", "x.y", "0", "missing"]:
+        assert Lu.get(target, Lu.path(key), "default") == Lu.get(target, key, "default")
+
+    assert Lu.get(target, "a.b.1.c") == 2
+    assert Lu.get(target, "a.b.5.c", "default") == "default"
+    assert Lu.get(target, "x.y") == 3
+    assert Lu.get(["a", "b"], "1") == "b"
+    assert Lu.get(["a", "b"], 0) == "a"
+
+
+def test_has_with_path():
+    target = {"a": {"b": {"c": None}}}
+
+    assert Lu.has(target, "a.b.c") is True
+    assert Lu.has(target, Lu.path("a.b.c")) is True
+    assert Lu.has(target, "a.c") is False
+    assert Lu.has(target, "a") is True
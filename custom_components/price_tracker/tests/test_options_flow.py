@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.price_tracker.config_flow import (
+    PriceTrackerConfigFlow,
+    PriceTrackerOptionsFlowHandler,
+)
+
+_URL = "https://www.coupang.com/vp/products/7733420479?vendorItemId=87856547398"
+
+
+def _flow(monkeypatch) -> PriceTrackerOptionsFlowHandler:
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.data = {"type": "coupang"}
+    entry.options = {"target": []}
+
+    # No devices yet, so adding an item goes straight to the item form
+    monkeypatch.setattr(
+        "custom_components.price_tracker.components.setup.dr.async_get",
+        lambda hass: None,
+    )
+    monkeypatch.setattr(
+        "custom_components.price_tracker.components.setup.dr.async_entries_for_config_entry",
+        lambda registry, entry_id: [],
+    )
+
+    flow = PriceTrackerConfigFlow.async_get_options_flow(entry)
+    flow.hass = MagicMock()
+    flow.hass.config.language = "en"
+
+    return flow
+
+
+def _fields(result) -> set[str]:
+    return {str(key) for key in result["data_schema"].schema}
+
+
+@pytest.mark.asyncio
+async def test_options_flow_performance(monkeypatch):
+    flow = _flow(monkeypatch)
+
+    result = await flow.async_step_init(None)
+    assert result["type"] == "form"
+    assert result["step_id"] == "setup"
+
+    result = await flow.async_step_setup(
+        {"option_setup_select": "option_performance_select"}
+    )
+    assert result["type"] == "form"
+    assert {
+        "request_rate_limit",
+        "request_rate_burst",
+        "request_concurrency",
+    } <= _fields(result)
+
+    await flow.async_step_setup(
+        {
+            "option_setup_select": "option_performance_select",
+            "request_rate_limit": 0.5,
+            "request_rate_burst": 2,
+            "request_concurrency": 3,
+        }
+    )
+    data = flow.hass.config_entries.async_update_entry.call_args.kwargs["data"]
+    assert data["request_rate_limit"] == 0.5
+    assert data["request_rate_burst"] == 2
+    assert data["request_concurrency"] == 3
+
+
+@pytest.mark.asyncio
+async def test_options_flow_add_item(monkeypatch):
+    flow = _flow(monkeypatch)
+
+    result = await flow.async_step_setup({"option_setup_select": "option_add_select"})
+    assert result["type"] == "form"
+    assert {
+        "item_refresh_adaptive",
+        "item_refresh_interval_min",
+        "item_refresh_interval_max",
+        "item_max_staleness",
+    } <= _fields(result)
+
+    result = await flow.async_step_setup(
+        {
+            "option_setup_select": "option_add_select",
+            "item_url": _URL,
+            "item_management_category": "",
+            "item_management_categories": "",
+            "item_unit_type": "auto",
+            "item_unit": 0,
+            "item_refresh_interval": 30,
+            "item_refresh_adaptive": True,
+            "item_refresh_interval_min": 10,
+            "item_refresh_interval_max": 1440,
+            "item_max_staleness": 12,
+            "item_price_change_interval_hour": 24,
+        }
+    )
+    assert result["type"] == "create_entry"
+    item = result["data"]["target"][0]
+    assert item["item_refresh_adaptive"] is True
+    assert item["item_max_staleness"] == 12
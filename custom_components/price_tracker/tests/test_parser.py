@@ -0,0 +1,69 @@
+from custom_components.price_tracker.utilities.parser import (
+    HTML_BACKENDS,
+    html_backend,
+    parse_assigned_json,
+    parse_html,
+    parse_json,
+    set_html_backend,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequestResponseData,
+)
+
+
+def test_parse_assigned_json_slices_balanced_value():
+    page = (
+        '<script>window.__STATE__ = {"a": {"b": "}{"}, "c": [1, 2]};'
+        "var next = {};</script>"
+    )
+
+    assert parse_assigned_json(page, "window.__STATE__") == {
+        "a": {"b": "}{"},
+        "c": [1, 2],
+    }
+    assert parse_assigned_json(page.encode("utf-8"), "window.__STATE__")["c"] == [1, 2]
+
+
+def test_parse_assigned_json_missing_or_broken():
+    assert parse_assigned_json("<html></html>", "window.__STATE__") is None
+    assert parse_assigned_json("window.__STATE__={broken", "window.__STATE__") is None
+
+
+def test_html_backend_selection():
+    set_html_backend("html.parser")
+    assert html_backend() == "html.parser"
+    assert parse_html("<p class='a'>x</p>").select_one("p.a").text == "x"
+
+    # Unknown or missing builders fall back to the fastest installed one
+    set_html_backend("no-such-parser")
+    assert html_backend() in HTML_BACKENDS
+
+    set_html_backend()
+
+
+def test_parse_json():
+    decoded = {"a": [1, "가"]}
+
+    assert parse_json('{"a": [1, "가"]}') == decoded
+    assert parse_json('{"a": [1, "가"]}'.encode("utf-8")) == decoded
+    assert parse_json(decoded) is decoded
+
+    try:
+        parse_json("{broken")
+        assert False
+    except ValueError:
+        pass
+
+
+def test_response_json_is_decoded_once():
+    response = SafeRequestResponseData(data='{"a": 1}', content=b'{"a": 1}')
+
+    assert response.json == {"a": 1}
+    assert response.json is response.json
+
+    # Bytes that are not UTF-8 fall back to the charset-decoded text
+    response = SafeRequestResponseData(data='{"a": "é"}', content=b'{"a": "\xe9"}')
+    assert response.json == {"a": "é"}
+
+    assert SafeRequestResponseData(data="<html>").json is None
+    assert SafeRequestResponseData(data=None).json is None
@@ -0,0 +1,54 @@
+import pytest
+
+from custom_components.price_tracker.utilities.proxy import ProxyManager
+from custom_components.price_tracker.utilities.safe_request import SafeRequest
+
+
+def test_proxy_manager_excludes_direct():
+    manager = ProxyManager(proxies=["http://a:1", "http://b:1"], allow_direct=False)
+
+    assert all(manager.select() is not None for _ in range(50))
+
+
+def test_proxy_manager_without_proxies_is_direct():
+    manager = ProxyManager(proxies=[], allow_direct=False)
+
+    assert manager.select() is None
+
+
+def test_proxy_manager_cooldown_and_preference():
+    manager = ProxyManager(
+        proxies=["http://a:1", "http://b:1", "http://c:1"],
+        allow_direct=False,
+        failure_threshold=1,
+    )
+    manager.report_failure("http://a:1", 403)
+    manager.report_success("http://b:1", 0.1)
+    manager.report_success("http://c:1", 2.0)
+
+    picks = [manager.select() for _ in range(50)]
+
+    assert "http://a:1" not in picks
+    assert picks.count("http://b:1") == 50
+
+
+def test_proxy_manager_ignores_shop_errors_and_masks_credentials():
+    manager = ProxyManager(proxies=["http://user:pass@a:8080"], allow_direct=False)
+    manager.report_failure("http://user:pass@a:8080", 500)
+
+    stats = manager.stats[0]
+
+    assert stats["failures"] == 0
+    assert stats["proxy"] == "http://a:8080"
+
+
+def test_safe_request_keeps_shared_proxy_manager():
+    manager = ProxyManager(proxies=["http://a:8080"], allow_direct=False)
+    request = SafeRequest().proxies(manager)
+
+    assert request._proxy_manager() is manager
+    with pytest.raises(ValueError):
+        request.proxy("http://b:8080")
+    assert request._proxy_manager() is manager
+
+    assert request.proxy(None)._proxy_manager() is None
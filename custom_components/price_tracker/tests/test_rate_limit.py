@@ -0,0 +1,41 @@
+import pytest
+
+from custom_components.price_tracker.utilities.rate_limit import (
+    SafeRequestRateLimiter,
+    TokenBucket,
+)
+
+
+def test_token_bucket_burst_then_wait():
+    bucket = TokenBucket(rate=2.0, burst=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+
+def test_token_bucket_disabled():
+    bucket = TokenBucket(rate=0, burst=1)
+
+    assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+def test_rate_limiter_key():
+    limiter = SafeRequestRateLimiter(rate=1.0, burst=1)
+    limiter.configure("smartstore", rate=10.0, burst=3)
+
+    assert limiter.key("https://m.smartstore.naver.com/a") == "m.smartstore.naver.com"
+    assert limiter.key("https://m.smartstore.naver.com/a", "smartstore") == "smartstore"
+    assert limiter.bucket("smartstore").burst == 3
+    assert limiter.bucket("m.smartstore.naver.com").burst == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire():
+    limiter = SafeRequestRateLimiter(rate=100.0, burst=1)
+
+    await limiter.acquire("https://a.example/")
+    await limiter.acquire("https://a.example/")
+
+    assert limiter.stats["a.example"]["waits"] == 1
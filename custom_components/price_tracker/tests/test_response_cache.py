@@ -0,0 +1,64 @@
+from custom_components.price_tracker.utilities.response_cache import (
+    SafeRequestResponseCache,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequestResponseData,
+)
+
+
+def test_response_cache_key_by_method_url_and_body():
+    key = SafeRequestResponseCache.key
+
+    assert key("get", "https://a.example/") == key("GET", "https://a.example/")
+    assert key("POST", "https://a.example/", {"a": 1, "b": 2}) == key(
+        "POST", "https://a.example/", {"b": 2, "a": 1}
+    )
+    assert key("POST", "https://a.example/", {"a": 1}) != key(
+        "POST", "https://a.example/", {"a": 2}
+    )
+
+
+def test_response_cache_validators():
+    cache = SafeRequestResponseCache()
+    entry = cache.store("k", "body", 200, etag='"abc"', last_modified="Mon")
+
+    assert entry.validators == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon",
+    }
+    assert cache.get("k") is entry
+
+
+def test_response_cache_lru_eviction():
+    cache = SafeRequestResponseCache(max_entries=2)
+    cache.store("a", "1", 200, etag="a")
+    cache.store("b", "2", 200, etag="b")
+    cache.get("a")
+    cache.store("c", "3", 200, etag="c")
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.stats["evictions"] == 1
+
+
+def test_response_cache_bounded_bytes():
+    cache = SafeRequestResponseCache(max_bytes=10)
+    cache.store("a", "x" * 6, 200, etag="a")
+    cache.store("b", "y" * 6, 200, etag="b")
+
+    assert cache.get("a") is None
+    assert cache.stats["bytes"] == 6
+
+
+def test_response_cache_parsed_is_copied_per_caller():
+    entry = SafeRequestResponseCache().store("k", "body", 200, etag="a")
+    item = {"price": 1000}
+    SafeRequestResponseData(cache_entry=entry).remember(item)
+    item["price"] = 1
+
+    first = SafeRequestResponseData(not_modified=True, cache_entry=entry).parsed
+    first["price"] = 2
+    second = SafeRequestResponseData(not_modified=True, cache_entry=entry).parsed
+
+    assert first is not second
+    assert second == {"price": 1000}
@@ -0,0 +1,54 @@
+from custom_components.price_tracker.utilities.retry import (
+    SafeRequestRetryPolicy,
+    SafeRequestRetryReason,
+    parse_retry_after,
+)
+
+
+def test_retry_backoff_is_exponential_and_capped():
+    policy = SafeRequestRetryPolicy(base_delay=1, max_delay=5, jitter=False)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_retry_honours_retry_after():
+    policy = SafeRequestRetryPolicy(max_retry_after=30, jitter=False)
+
+    decision = policy.decide(
+        url="https://example.com",
+        attempt=1,
+        max_tries=3,
+        elapsed=0,
+        status_code=429,
+        retry_after="7",
+    )
+    assert decision.reason == SafeRequestRetryReason.RATE_LIMITED
+    assert decision.retry is True
+    assert decision.delay == 7
+
+    decision = policy.decide(
+        url="https://example.com",
+        attempt=1,
+        max_tries=3,
+        elapsed=0,
+        status_code=429,
+        retry_after="120",
+    )
+    assert decision.retry is False
+    assert policy.stats["retries"] == 1
+    assert policy.stats["give_ups"] == 1
+
+
+def test_retry_client_errors_can_be_disabled():
+    policy = SafeRequestRetryPolicy(retry_client_errors=False)
+
+    decision = policy.decide(
+        url="https://example.com", attempt=1, max_tries=3, elapsed=0, status_code=403
+    )
+    assert decision.reason == SafeRequestRetryReason.CLIENT_ERROR
+    assert decision.retry is False
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after(None) is None
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.price_tracker.components.scheduler import (
+    RefreshJob,
+    RefreshScheduler,
+)
+
+
+async def _noop():
+    return None
+
+
+def test_refresh_job_spreads_phase_across_period():
+    phases = {RefreshJob(f"item_{i}", 1800, _noop).phase for i in range(100)}
+
+    assert len(phases) > 90
+    assert all(0 <= p < 1800 for p in phases)
+
+
+def test_refresh_job_next_slot_keeps_period():
+    job = RefreshJob("item", 60, _noop)
+    now = time.time()
+    slot = job.next_slot(now)
+
+    assert now < slot <= now + 60
+    assert job.next_slot(slot) == pytest.approx(slot + 60)
+
+
+def test_scheduler_recent_item_is_not_due():
+    job = RefreshJob("item", 3600, _noop)
+    last = job.next_slot(time.time()) - 3600 + 10
+
+    # Last refresh landed 10s after the previous slot: next one is a period later
+    assert job.next_slot(last) == pytest.approx(last + 3590)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_dispatches_due_and_reschedules():
+    scheduler = RefreshScheduler(workers=2)
+    calls = []
+
+    async def refresh():
+        calls.append(time.time())
+        return 0.01
+
+    remove = scheduler.schedule("a", period=60, callback=refresh)
+    await asyncio.sleep(0.1)
+    remove()
+    count = len(calls)
+    await asyncio.sleep(0.05)
+
+    # Due immediately (never run), then retried after the returned delay
+    assert count >= 2
+    assert len(calls) - count <= 1
+    assert scheduler.stats["jobs"] == 0
+
+    await scheduler.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_trigger_runs_job_once_now(monkeypatch):
+    scheduler = RefreshScheduler(workers=2)
+    calls = []
+    # Fake clock 10s after the job's phase slot, so its next slot is ~an hour away
+    now = 3600 * 100 + RefreshJob("a", 3600, _noop).phase + 10
+    monkeypatch.setattr(
+        "custom_components.price_tracker.components.scheduler.time",
+        SimpleNamespace(time=lambda: now),
+    )
+
+    async def refresh():
+        calls.append(now)
+
+    scheduler.schedule("a", period=3600, callback=refresh, last_run_ago=5)
+    await asyncio.sleep(0.05)
+    assert calls == []
+    assert scheduler._jobs["a"].due == pytest.approx(now + 3590)
+
+    assert scheduler.trigger("a") is True
+    scheduler.trigger("a")
+    await asyncio.sleep(0.05)
+
+    assert len(calls) == 1
+    assert scheduler.trigger("missing") is False
+
+    await scheduler.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spreads_overdue_jobs_over_jitter():
+    scheduler = RefreshScheduler(workers=2)
+    now = time.time()
+
+    for i in range(50):
+        scheduler.schedule(f"item_{i}", period=60, callback=_noop, jitter=300)
+
+    dues = [job.due - now for job in scheduler._jobs.values()]
+
+    assert all(0 <= d <= 301 for d in dues)
+    assert max(dues) - min(dues) > 100
+
+    await scheduler.async_stop()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spreads_restored_jobs_whose_slot_passed():
+    scheduler = RefreshScheduler(workers=2)
+    now = time.time()
+
+    for i in range(50):
+        job = RefreshJob(f"item_{i}", 600, _noop)
+        # Last run just before the previous slot, so that slot is already overdue
+        last_run_ago = now - (job.next_slot(now) - 600) + 60
+        scheduler.schedule(
+            job.key, period=600, callback=_noop, last_run_ago=last_run_ago, jitter=300
+        )
+
+    dues = [job.due - now for job in scheduler._jobs.values()]
+
+    assert all(0 <= d <= 301 for d in dues)
+    assert max(dues) - min(dues) > 100
+
+    await scheduler.async_stop()
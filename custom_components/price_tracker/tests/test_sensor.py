@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import State
+from homeassistant.helpers.restore_state import RestoredExtraData, RestoreEntity
+
+from custom_components.price_tracker.components.coordinator import (
+    PriceTrackerCoordinator,
+)
+from custom_components.price_tracker.components.sensor import PriceTrackerSensor
+
+
+@pytest.mark.asyncio
+async def test_sensor_fingerprint_ignores_refresh_bookkeeping(fake_engine):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    sensor = PriceTrackerSensor(
+        coordinator=coordinator, engine=fake_engine([1000, 1000, 1000, 900])
+    )
+    sensor._item = coordinator.add(sensor.unique_id, sensor._engine, 30)
+
+    await coordinator.async_refresh(sensor.unique_id)
+    await coordinator.async_refresh(sensor.unique_id, force=True)
+    sensor._render()
+    first = sensor._state_fingerprint()
+
+    # Same price again: only updated_at / age_seconds move
+    await coordinator.async_refresh(sensor.unique_id, force=True)
+    sensor._render()
+    assert sensor._state_fingerprint() == first
+
+    await coordinator.async_refresh(sensor.unique_id, force=True)
+    sensor._render()
+    assert sensor._state_fingerprint() != first
+    assert sensor.extra_state_attributes["price"] == 900
+
+
+@pytest.mark.asyncio
+async def test_sensor_steady_price_stops_writing(fake_engine, monkeypatch):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    sensor = PriceTrackerSensor(
+        coordinator=coordinator, engine=fake_engine([1000, 900, 900, 900, 900, 900])
+    )
+    sensor._item = coordinator.add(sensor.unique_id, sensor._engine, 30)
+    sensor.hass = MagicMock()
+    writes = MagicMock()
+    monkeypatch.setattr(sensor, "async_write_ha_state", writes)
+
+    # First price, the drop, and the change status settling on NO_CHANGE
+    for _ in range(3):
+        await coordinator.async_refresh(sensor.unique_id, force=True)
+        sensor._handle_coordinator_update()
+    assert writes.call_count == 3
+
+    # The rolling average keeps moving (925, 920, 916.67), the state does not
+    for _ in range(3):
+        await coordinator.async_refresh(sensor.unique_id, force=True)
+        sensor._handle_coordinator_update()
+    assert writes.call_count == 3
+    assert sensor.extra_state_attributes["min_price"] == 900
+    assert sensor.extra_state_attributes["average_price"] == 950
+
+
+@pytest.mark.asyncio
+async def test_sensor_restores_last_fetch_of_unchanged_price(fake_engine, monkeypatch):
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    sensor = PriceTrackerSensor(
+        coordinator=coordinator, engine=fake_engine([1000, 1000])
+    )
+    sensor._item = coordinator.add(sensor.unique_id, sensor._engine, 30)
+    await coordinator.async_refresh(sensor.unique_id)
+    sensor._render()
+
+    await coordinator.async_refresh(sensor.unique_id, force=True)
+    # Same price, so the stored state still carries the first write's updated_at
+    attributes = {
+        **sensor.extra_state_attributes,
+        "updated_at": (datetime.now() - timedelta(hours=5)).isoformat(),
+        "entity_picture": None,
+        "unit_of_measurement": "KRW",
+    }
+    state = State(sensor.entity_id, "1000", attributes)
+    extra = RestoredExtraData(sensor.extra_restore_state_data.as_dict())
+
+    # Restart: a new coordinator and sensor restore from the stored data
+    coordinator = PriceTrackerCoordinator(entry_id="entry", service_type="test")
+    restored = PriceTrackerSensor(coordinator=coordinator, engine=fake_engine([]))
+    restored.hass = MagicMock()
+    monkeypatch.setattr(RestoreEntity, "async_added_to_hass", AsyncMock())
+    monkeypatch.setattr(restored, "async_get_last_state", AsyncMock(return_value=state))
+    monkeypatch.setattr(
+        restored, "async_get_last_extra_data", AsyncMock(return_value=extra)
+    )
+    monkeypatch.setattr(coordinator, "start", lambda key: lambda: None)
+
+    await restored.async_added_to_hass()
+
+    assert restored._item.item_data.price.price == 1000
+    assert restored._item.age_seconds < 60
+    assert restored._item.stale is False
+    assert restored.extra_state_attributes["stale"] is False
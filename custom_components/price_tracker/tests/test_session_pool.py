@@ -0,0 +1,116 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from custom_components.price_tracker.utilities.safe_request import CustomAsyncSession
+from custom_components.price_tracker.utilities.session_pool import (
+    SafeRequestSessionPool,
+)
+
+
+class _Session:
+    def __init__(self, **kwargs):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class _CookieKeepingSession(_Session):
+    def __init__(self, impersonate, http_version):
+        super().__init__()
+
+
+@pytest.mark.asyncio
+async def test_session_pool_reuse_by_host():
+    pool = SafeRequestSessionPool()
+
+    async with pool.session("https://a.example/1", "chrome", None, _Session) as s1:
+        pass
+    async with pool.session("https://a.example/2", "chrome", None, _Session) as s2:
+        pass
+    async with pool.session("https://b.example/1", "chrome", None, _Session) as s3:
+        pass
+
+    assert s1 is s2
+    assert s1 is not s3
+    assert pool.stats["handshakes"] == 2
+    assert pool.stats["reuses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_session_pool_evicts_over_capacity():
+    pool = SafeRequestSessionPool(max_size=1)
+
+    async with pool.session("https://a.example/", "chrome", None, _Session) as s1:
+        pass
+    async with pool.session("https://b.example/", "chrome", None, _Session):
+        pass
+
+    assert s1.closed is True
+    assert pool.stats["sessions"] == 1
+    assert pool.stats["evictions"] == 1
+
+    await pool.async_close()
+    assert pool.stats["sessions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_session_pool_without_discard_cookies_does_not_pool():
+    pool = SafeRequestSessionPool()
+
+    async with pool.session(
+        "https://a.example/", "chrome", None, _CookieKeepingSession
+    ) as s1:
+        pass
+    async with pool.session(
+        "https://a.example/", "chrome", None, _CookieKeepingSession
+    ) as s2:
+        pass
+
+    assert s1 is not s2
+    assert s1.closed is True
+    assert s2.closed is True
+    assert pool.stats["sessions"] == 0
+    assert pool.stats["pooling"] is False
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "").encode("utf-8")
+        self.send_response(200)
+
+        if self.path == "/set":
+            self.send_header("Set-Cookie", "sid=leak; Path=/")
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_session_pool_does_not_share_cookies():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{}".format(server.server_port)
+    pool = SafeRequestSessionPool()
+
+    try:
+        async with pool.session(url, "chrome", None, CustomAsyncSession) as s1:
+            response = await s1.get(url + "/set")
+            assert response.cookies.get("sid") == "leak"
+        pooled = pool.stats["pooling"]
+
+        async with pool.session(url, "chrome", None, CustomAsyncSession) as s2:
+            response = await s2.get(url + "/echo")
+
+        # Older curl-cffi cannot discard cookies, so its sessions are not shared
+        assert (s1 is s2) is pooled
+        assert "sid" not in response.text
+    finally:
+        await pool.async_close()
+        server.shutdown()
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from custom_components.price_tracker.utilities.retry import (
+    SafeRequestRetryDecision,
+    SafeRequestRetryReason,
+)
+from custom_components.price_tracker.utilities.safe_request import (
+    SafeRequest,
+    SafeRequestResponseData,
+)
+from custom_components.price_tracker.utilities.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"price": 100}
+
+    results = await asyncio.gather(*[flight.do("k", load) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(r == {"price": 100} for r in results)
+    # Every caller owns its copy
+    assert len({id(r) for r in results}) == 5
+    assert flight.stats["shared"] == 4
+    assert flight.stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("k", load), flight.do("k", load), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.stats["executions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_distinct_keys():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0)
+        return 1
+
+    await asyncio.gather(flight.do("a", load), flight.do("b", load))
+
+    assert flight.stats["executions"] == 2
+
+
+def _fake_request(calls: list):
+    async def _request(self, url, **kwargs):
+        calls.append(url)
+        self._retries = [
+            SafeRequestRetryDecision(
+                url=url,
+                attempt=1,
+                reason=SafeRequestRetryReason.CLIENT_ERROR,
+                retry=False,
+                status_code=401,
+            )
+        ]
+        await asyncio.sleep(0.01)
+
+        return SafeRequestResponseData(data="ok", status_code=200)
+
+    return _request
+
+
+@pytest.mark.asyncio
+async def test_safe_request_followers_see_leader_retries(monkeypatch):
+    calls = []
+    monkeypatch.setattr(SafeRequest, "_request", _fake_request(calls))
+    leader, follower = SafeRequest(), SafeRequest()
+
+    await asyncio.gather(
+        leader.request(url="https://a.example/sf"),
+        follower.request(url="https://a.example/sf"),
+    )
+
+    assert len(calls) == 1
+    assert [r.status_code for r in follower.retries] == [401]
+    assert [r.status_code for r in leader.retries] == [401]
+
+
+@pytest.mark.asyncio
+async def test_safe_request_coalesces_only_same_cookies_and_proxies(monkeypatch):
+    calls = []
+    monkeypatch.setattr(SafeRequest, "_request", _fake_request(calls))
+    plain = SafeRequest()
+    with_cookie = SafeRequest()
+    with_cookie.cookie(key="sid", value="1")
+    with_proxy = SafeRequest(proxies=["http://127.0.0.1:1"])
+
+    await asyncio.gather(
+        plain.request(url="https://a.example/sf2"),
+        with_cookie.request(url="https://a.example/sf2"),
+        with_proxy.request(url="https://a.example/sf2"),
+    )
+
+    assert len(calls) == 3
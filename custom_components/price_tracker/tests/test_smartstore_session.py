@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from custom_components.price_tracker.services.smartstore.session import (
+    SmartstoreWarmStates,
+)
+
+
+@pytest.mark.asyncio
+async def test_warm_state_is_built_once_and_shared():
+    states = SmartstoreWarmStates()
+    calls = []
+
+    async def warmup():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+
+        return {"NNB": "PPYXCWKWXCAAA"}
+
+    results = await asyncio.gather(*[states.get("naver", warmup) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert results[0].uses == 5
+    assert results[0].cookies == {"NNB": "PPYXCWKWXCAAA"}
+
+
+@pytest.mark.asyncio
+async def test_warm_state_rotates_when_blocked_or_used_up():
+    states = SmartstoreWarmStates(max_uses=2)
+    calls = []
+
+    async def warmup():
+        calls.append(1)
+
+        return {"NNB": str(len(calls))}
+
+    first = await states.get("naver", warmup)
+    states.rotate("naver", first)
+    second = await states.get("naver", warmup)
+
+    assert second.cookies == {"NNB": "2"}
+
+    # A stale state reported late must not rotate the new one
+    states.rotate("naver", first)
+    await states.get("naver", warmup)
+    third = await states.get("naver", warmup)
+
+    assert third.cookies == {"NNB": "3"}
+    assert states.stats == {"states": 1, "warmups": 3, "rotations": 1}
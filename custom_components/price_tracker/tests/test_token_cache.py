@@ -0,0 +1,89 @@
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+
+from custom_components.price_tracker.utilities.token_cache import (
+    TokenCache,
+    jwt_expires_in,
+)
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=")
+
+    return "header.{}.signature".format(payload.decode())
+
+
+def test_jwt_expires_in():
+    assert jwt_expires_in(_jwt(time.time() + 600)) == pytest.approx(600, abs=2)
+    assert jwt_expires_in("not-a-jwt") is None
+
+
+@pytest.mark.asyncio
+async def test_token_cache_coalesces_concurrent_fetches():
+    cache = TokenCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+
+        return "token_{}".format(len(calls)), 3600
+
+    tokens = await asyncio.gather(*[cache.get("kurly", fetch) for _ in range(5)])
+
+    assert tokens == ["token_1"] * 5
+    assert len(calls) == 1
+    assert await cache.get("kurly", fetch) == "token_1"
+    assert cache.stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_token_cache_refreshes_before_expiry():
+    cache = TokenCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+
+        # Inside the refresh margin right away
+        return "token_{}".format(len(calls)), 30
+
+    assert await cache.get("kurly", fetch) == "token_1"
+    assert await cache.get("kurly", fetch) == "token_2"
+
+
+@pytest.mark.asyncio
+async def test_token_cache_keeps_valid_token_when_refresh_fails():
+    cache = TokenCache()
+
+    async def fetch():
+        return "token", 30
+
+    async def broken():
+        raise ValueError("auth down")
+
+    await cache.get("kurly", fetch)
+
+    assert await cache.get("kurly", broken) == "token"
+
+
+@pytest.mark.asyncio
+async def test_token_cache_invalidate_only_matching_token():
+    cache = TokenCache()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+
+        return "token_{}".format(len(calls)), 3600
+
+    await cache.get("kurly", fetch)
+    cache.invalidate("kurly", "token_0")
+    assert await cache.get("kurly", fetch) == "token_1"
+
+    cache.invalidate("kurly", "token_1")
+    assert await cache.get("kurly", fetch) == "token_2"
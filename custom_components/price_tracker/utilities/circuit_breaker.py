@@ -0,0 +1,144 @@
+import logging
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_FAILURE_THRESHOLD = 10
+_DEFAULT_RECOVERY_TIMEOUT = 300.0  # seconds
+_DEFAULT_MAX_RECOVERY_TIMEOUT = 3600.0
+
+
+class CircuitBreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by every sensor of a service."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = _DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = _DEFAULT_RECOVERY_TIMEOUT,
+        max_recovery_timeout: float = _DEFAULT_MAX_RECOVERY_TIMEOUT,
+    ):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._max_recovery_timeout = max_recovery_timeout
+        self._state = CircuitBreakerState.CLOSED
+        self._failures = 0
+        self._opened = 0
+        self._timeout = recovery_timeout
+        self._open_until = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self._state != CircuitBreakerState.CLOSED
+
+    def allow(self) -> bool:
+        """Whether a load may run now; half-open lets a single probe through"""
+        if self._state == CircuitBreakerState.CLOSED:
+            return True
+
+        now = time.monotonic()
+
+        if self._state == CircuitBreakerState.OPEN:
+            if now < self._open_until:
+                return False
+
+            self._set_state(CircuitBreakerState.HALF_OPEN)
+
+        # A probe that never reported back (e.g. cancelled) must not block forever
+        if (
+            self._probe_started_at is not None
+            and now - self._probe_started_at < self._timeout
+        ):
+            return False
+
+        self._probe_started_at = now
+
+        return True
+
+    def record_success(self):
+        self._failures = 0
+        self._probe_started_at = None
+        self._timeout = self._recovery_timeout
+
+        if self._state != CircuitBreakerState.CLOSED:
+            _LOGGER.info("Circuit breaker %s closed", self.name)
+            self._set_state(CircuitBreakerState.CLOSED)
+
+    def record_failure(self):
+        self._failures += 1
+
+        if self._state == CircuitBreakerState.HALF_OPEN:
+            # Probe failed; stay open for longer
+            self._timeout = min(self._max_recovery_timeout, self._timeout * 2)
+            self._open()
+        elif (
+            self._state == CircuitBreakerState.CLOSED
+            and self._failures >= self._failure_threshold
+        ):
+            self._open()
+
+    def _open(self):
+        self._opened += 1
+        self._probe_started_at = None
+        self._open_until = time.monotonic() + self._timeout
+
+        _LOGGER.warning(
+            "Circuit breaker %s opened after %s failures, retry in %ss",
+            self.name,
+            self._failures,
+            self._timeout,
+        )
+        self._set_state(CircuitBreakerState.OPEN)
+
+    def _set_state(self, state: CircuitBreakerState):
+        changed = self._state != state
+        self._state = state
+
+        if changed:
+            for listener in list(self._listeners):
+                listener()
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def remove():
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "state": self._state.value,
+            "failures": self._failures,
+            "opened": self._opened,
+            "retry_in": round(max(0.0, self._open_until - time.monotonic()), 1)
+            if self._state == CircuitBreakerState.OPEN
+            else 0.0,
+        }
+
+
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def circuit_breaker(key: str) -> CircuitBreaker:
+    if key not in _CIRCUIT_BREAKERS:
+        _CIRCUIT_BREAKERS[key] = CircuitBreaker(name=key)
+
+    return _CIRCUIT_BREAKERS[key]
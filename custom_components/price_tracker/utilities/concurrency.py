@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 6
+DEFAULT_SERVICE_CONCURRENCY = 2
+
+
+class _ServiceQueue:
+    def __init__(self, key: str, limit: int):
+        self.key = key
+        self.limit = limit
+        self.running = 0
+        self.waiters: deque[tuple[asyncio.Future, float]] = deque()
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queued = 0
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for w, _ in self.waiters if not w.done())
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "average_wait": round(self.total_wait / self.waited, 3)
+            if self.waited > 0
+            else 0.0,
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+class FairConcurrencyLimiter:
+    """Global + per-service concurrency limit, served round-robin across services."""
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_CONCURRENCY,
+        service_limit: int = DEFAULT_SERVICE_CONCURRENCY,
+    ):
+        self._limit = max(1, limit)
+        self._service_limit = max(1, service_limit)
+        self._running = 0
+        self._services: dict[str, _ServiceQueue] = {}
+        self._order: deque[str] = deque()
+
+    def configure(self, limit: int):
+        self._limit = max(1, limit)
+        self._dispatch()
+
+    def configure_service(self, key: str, limit: int):
+        self._service(key).limit = max(1, limit)
+        self._dispatch()
+
+    def _service(self, key: str) -> _ServiceQueue:
+        if key not in self._services:
+            self._services[key] = _ServiceQueue(key=key, limit=self._service_limit)
+            # Never served yet, so it is first in line
+            self._order.appendleft(key)
+
+        return self._services[key]
+
+    def _grant(self, service: _ServiceQueue, wait: float):
+        service.running += 1
+        service.acquired += 1
+        self._running += 1
+        # The service just served goes to the back of the round-robin
+        self._order.remove(service.key)
+        self._order.append(service.key)
+
+        if wait > 0:
+            service.waited += 1
+            service.total_wait += wait
+            service.max_wait = max(service.max_wait, wait)
+
+    def _release(self, service: _ServiceQueue):
+        service.running -= 1
+        self._running -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._running < self._limit:
+            picked: Optional[_ServiceQueue] = None
+
+            # Round-robin so that one slow service cannot starve the others
+            for key in self._order:
+                service = self._services[key]
+
+                while len(service.waiters) > 0 and service.waiters[0][0].done():
+                    service.waiters.popleft()
+
+                if len(service.waiters) > 0 and service.running < service.limit:
+                    picked = service
+                    break
+
+            if picked is None:
+                return
+
+            waiter, queued_at = picked.waiters.popleft()
+            self._grant(picked, time.monotonic() - queued_at)
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, key: str):
+        service = self._service(key)
+
+        if (
+            self._running < self._limit
+            and service.running < service.limit
+            and service.queued == 0
+        ):
+            self._grant(service, 0.0)
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            service.waiters.append((waiter, time.monotonic()))
+            service.max_queued = max(service.max_queued, service.queued)
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted right before the cancellation; hand the slot back
+                    self._release(service)
+                else:
+                    waiter.cancel()
+                raise
+
+        try:
+            yield
+        finally:
+            self._release(service)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "limit": self._limit,
+            "running": self._running,
+            "queued": sum(s.queued for s in self._services.values()),
+            "services": {k: s.stats for k, s in self._services.items()},
+        }
+
+
+_LOAD_LIMITER: Optional[FairConcurrencyLimiter] = None
+
+
+def load_limiter() -> FairConcurrencyLimiter:
+    global _LOAD_LIMITER
+
+    if _LOAD_LIMITER is None:
+        _LOAD_LIMITER = FairConcurrencyLimiter()
+
+    return _LOAD_LIMITER
@@ -1,4 +1,62 @@
 from copy import deepcopy
+from functools import lru_cache
+
+
+class LuPath:
+    """A dotted key split once (numeric parts pre-converted), for Lu.get / Lu.has."""
+
+    __slots__ = ("key", "index", "parts")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.index = int(key) if key.isnumeric() else None
+        self.parts: tuple[tuple[str, int | None], ...] = (
+            tuple((k, int(k) if k.isnumeric() else None) for k in key.split("."))
+            if "." in key
+            else ()
+        )
+
+    def get(self, target: [any], default_value: any = None):
+        key = self.key
+
+        if key in target:
+            return target[key]
+
+        if self.index is not None:
+            return target[self.index]
+
+        if len(self.parts) == 0:
+            return default_value
+
+        for k, index in self.parts:
+            if index is not None and isinstance(target, list) and len(target) > index:
+                target = target[index]
+            elif k in target:
+                target = target[k]
+            else:
+                return default_value
+
+        return target
+
+    def has(self, target: [any]) -> bool:
+        if len(self.parts) == 0:
+            return self.key in target
+
+        for k, _ in self.parts:
+            if k in target:
+                target = target[k]
+            else:
+                return False
+
+        return True
+
+    def __repr__(self):
+        return "LuPath({!r})".format(self.key)
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(key: str) -> LuPath:
+    return LuPath(key)
 
 
 class Lu:
@@ -7,7 +65,10 @@ class Lu:
         return target[0] if len(target) > 0 else defValue
 
     @staticmethod
-    def find(target: [any], key: str, value: any, defaultValue: any = None):
+    def find(target: [any], key: str | LuPath, value: any, defaultValue: any = None):
+        if not isinstance(key, (int, LuPath)):
+            key = _compile_path(key)
+
         return next((x for x in target if Lu.get(x, key) == value), defaultValue)
 
     @staticmethod
@@ -15,35 +76,19 @@ class Lu:
         return next((x for x in target if func(x[key]) is True), None)
 
     @staticmethod
-    def get(target: [any], key: str | int, default_value: any = None):
-        if isinstance(key, int):
-            return target[key]
+    def path(key: str) -> LuPath:
+        """Compiled form of a dotted key, shared by every caller of the same key"""
+        return _compile_path(key)
 
-        if key in target:
+    @staticmethod
+    def get(target: [any], key: str | int | LuPath, default_value: any = None):
+        if isinstance(key, int):
             return target[key]
 
-        if key.isnumeric():
-            return target[int(key)]
-
-        if key.count(".") > 0:
-            keys = key.split(".")
-
-            for k in keys:
-                if (
-                    str(k).isnumeric()
-                    and isinstance(target, list)
-                    and len(target) > int(k)
-                ):
-                    target = target[int(k)]
-                    continue
-                elif k in target:
-                    target = target[k]
-                    continue
-                else:
-                    return default_value
-            return target
+        if not isinstance(key, LuPath):
+            key = _compile_path(key)
 
-        return default_value
+        return key.get(target, default_value)
 
     @staticmethod
     def update(target: [any], key: str, value: any):
@@ -52,19 +97,11 @@ class Lu:
         return target
 
     @staticmethod
-    def has(target: [any], key: str):
-        if key.count(".") > 0:
-            keys = key.split(".")
-
-            for k in keys:
-                if k in target:
-                    target = target[k]
-                else:
-                    return False
-
-            return True
+    def has(target: [any], key: str | LuPath):
+        if not isinstance(key, LuPath):
+            key = _compile_path(key)
 
-        return key in target
+        return key.has(target)
 
     @staticmethod
     def get_or_default(target: [any], key: str, default_value: any = None):
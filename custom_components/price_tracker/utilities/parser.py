@@ -1,4 +1,23 @@
+import json
+import logging
+import re
+from typing import Optional
+
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+HTML_BACKEND_AUTO = "auto"
+# BeautifulSoup tree builders, fastest first; all keep the bs4 selector API
+HTML_BACKENDS = ["lxml", "html.parser"]
+
+_HTML_BACKEND: Optional[str] = None
 
 
 def parse_bool(value: any) -> bool:
@@ -67,8 +86,64 @@ def parse_number(value: any) -> int:
         return 0
 
 
-def parse_html(text: str):
-    return BeautifulSoup(text, "html.parser")
+def html_backend() -> str:
+    """Tree builder used by parse_html (the fastest installed one by default)"""
+    global _HTML_BACKEND
+
+    if _HTML_BACKEND is None:
+        _HTML_BACKEND = next(
+            b for b in HTML_BACKENDS if builder_registry.lookup(b) is not None
+        )
+
+    return _HTML_BACKEND
+
+
+def set_html_backend(backend: str = HTML_BACKEND_AUTO):
+    global _HTML_BACKEND
+
+    if backend == HTML_BACKEND_AUTO:
+        _HTML_BACKEND = None
+    elif builder_registry.lookup(backend) is None:
+        _LOGGER.warning("HTML backend %s is not installed, using the default", backend)
+        _HTML_BACKEND = None
+    else:
+        _HTML_BACKEND = backend
+
+
+def parse_html(text: str | bytes) -> BeautifulSoup:
+    return BeautifulSoup(text, html_backend())
+
+
+def parse_json(value: str | bytes | dict | list) -> any:
+    """Decode JSON with orjson when installed (bytes are decoded without a str round trip).
+    Already decoded values are returned as they are. Raises ValueError on bad input."""
+    if isinstance(value, (dict, list)):
+        return value
+
+    if orjson is not None:
+        return orjson.loads(value)
+
+    return json.loads(value)
+
+
+def parse_assigned_json(text: str | bytes, name: str) -> any:
+    """Decode the JSON value assigned to `name` (e.g. window.__STATE__={...}) straight
+    from the page text, without building a document tree. None if it is not there."""
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+
+    marker = re.search(re.escape(name) + r"\s*=\s*", text)
+
+    if marker is None:
+        return None
+
+    try:
+        # raw_decode stops at the end of the (balanced) value
+        value, _ = json.JSONDecoder().raw_decode(text, marker.end())
+    except ValueError:
+        return None
+
+    return value
 
 
 def parse_engine_id(item: any) -> str:
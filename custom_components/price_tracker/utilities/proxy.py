@@ -0,0 +1,190 @@
+import logging
+import random
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+_LOGGER = logging.getLogger(__name__)
+
+_DIRECT = "direct"
+_DEFAULT_LATENCY = 1.0  # seconds, optimistic guess for proxies without samples
+_LATENCY_ALPHA = 0.3
+# Status codes that mean the proxy (or our IP behind it) is blocked or broken
+_PROXY_FAILURE_STATUS_CODES = [403, 407, 429]
+
+
+class ProxyStats:
+    def __init__(self, proxy: Optional[str]):
+        self.proxy = proxy
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency: Optional[float] = None
+        self.last_failure_at: Optional[float] = None
+        self.last_status_code: Optional[int] = None
+        self.cooldown_until = 0.0
+
+    @property
+    def label(self) -> str:
+        if self.proxy is None:
+            return _DIRECT
+
+        u = urlparse(self.proxy)
+
+        # Never expose proxy credentials
+        return (
+            "{}://{}".format(u.scheme, u.hostname + (f":{u.port}" if u.port else ""))
+            if u.hostname
+            else self.proxy
+        )
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace smoothing so new proxies start at 0.5 instead of 0 or 1
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+    @property
+    def score(self) -> float:
+        """Expected cost of a request through this proxy (lower is better)"""
+        latency = self.latency if self.latency is not None else _DEFAULT_LATENCY
+
+        return latency / self.success_rate
+
+    def cooling(self, now: float) -> bool:
+        return self.cooldown_until > now
+
+    def dict(self, now: float) -> dict:
+        return {
+            "proxy": self.label,
+            "successes": self.successes,
+            "failures": self.failures,
+            "success_rate": round(self.success_rate, 3),
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+            "score": round(self.score, 3),
+            "last_status_code": self.last_status_code,
+            "last_failure_ago": round(now - self.last_failure_at, 1)
+            if self.last_failure_at is not None
+            else None,
+            "cooldown": round(max(0.0, self.cooldown_until - now), 1),
+        }
+
+
+class ProxyManager:
+    """Health-scored proxy selection (power of two choices with cooldown)."""
+
+    def __init__(
+        self,
+        proxies: Optional[list[str]] = None,
+        allow_direct: bool = True,
+        cooldown: float = 60.0,
+        max_cooldown: float = 900.0,
+        failure_threshold: int = 2,
+    ):
+        self._allow_direct = allow_direct
+        self._cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._failure_threshold = failure_threshold
+        self._stats: dict[Optional[str], ProxyStats] = {}
+        self.update(proxies, allow_direct)
+
+    @property
+    def proxies(self) -> list[str]:
+        return [p for p in self._stats if p is not None]
+
+    def update(self, proxies: Optional[list[str]], allow_direct: bool = True):
+        """Replace the proxy list, keeping the statistics of known proxies."""
+        candidates: list[Optional[str]] = list(dict.fromkeys(proxies or []))
+
+        # Without proxies a direct connection is the only option
+        self._allow_direct = allow_direct or len(candidates) == 0
+        if self._allow_direct:
+            candidates.append(None)
+
+        self._stats = {
+            proxy: self._stats.get(proxy, ProxyStats(proxy)) for proxy in candidates
+        }
+
+    def select(self) -> Optional[str]:
+        now = time.monotonic()
+        stats = list(self._stats.values())
+        available = [s for s in stats if not s.cooling(now)]
+
+        if len(available) == 0:
+            # Everything is cooling down; use whichever recovers first
+            return min(stats, key=lambda s: s.cooldown_until).proxy
+
+        if len(available) == 1:
+            return available[0].proxy
+
+        a, b = random.sample(available, 2)
+
+        return (a if a.score <= b.score else b).proxy
+
+    def report_success(self, proxy: Optional[str], latency: float):
+        stats = self._stats.get(proxy)
+        if stats is None:
+            return
+
+        stats.successes += 1
+        stats.consecutive_failures = 0
+        stats.cooldown_until = 0.0
+        stats.last_status_code = None
+        stats.latency = (
+            latency
+            if stats.latency is None
+            else _LATENCY_ALPHA * latency + (1 - _LATENCY_ALPHA) * stats.latency
+        )
+
+    def report_failure(self, proxy: Optional[str], status_code: Optional[int] = None):
+        """Record a failed request; shop side errors (404, 5xx) do not count."""
+        stats = self._stats.get(proxy)
+        if stats is None:
+            return
+
+        if status_code is not None and status_code not in _PROXY_FAILURE_STATUS_CODES:
+            return
+
+        now = time.monotonic()
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.last_failure_at = now
+        stats.last_status_code = status_code
+
+        if stats.consecutive_failures >= self._failure_threshold:
+            cooldown = min(
+                self._max_cooldown,
+                self._cooldown
+                * 2 ** (stats.consecutive_failures - self._failure_threshold),
+            )
+            stats.cooldown_until = now + cooldown
+
+            _LOGGER.debug("Proxy %s cooling down for %ss", stats.label, cooldown)
+
+    @property
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+
+        return [s.dict(now) for s in self._stats.values()]
+
+
+_PROXY_MANAGERS: dict[str, ProxyManager] = {}
+
+
+def proxy_manager(
+    key: str, proxies: Optional[list[str]] = None, allow_direct: bool = True
+) -> ProxyManager:
+    """Proxy manager shared by every sensor of a config entry"""
+    if key not in _PROXY_MANAGERS:
+        _PROXY_MANAGERS[key] = ProxyManager(proxies=proxies, allow_direct=allow_direct)
+    else:
+        _PROXY_MANAGERS[key].update(proxies, allow_direct)
+
+    return _PROXY_MANAGERS[key]
+
+
+def get_proxy_manager(key: str) -> Optional[ProxyManager]:
+    return _PROXY_MANAGERS.get(key)
+
+
+def remove_proxy_manager(key: str):
+    _PROXY_MANAGERS.pop(key, None)
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RATE = 2.0  # requests per second
+DEFAULT_BURST = 5
+
+
+class TokenBucket:
+    """Token bucket; waiters are served in the order they reserved a token."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+        self._waits = 0
+        self._total_wait = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    def configure(self, rate: float, burst: int):
+        self._refill()
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = min(self._tokens, float(self._burst))
+
+    def _refill(self):
+        now = time.monotonic()
+
+        if self._rate > 0:
+            self._tokens = min(
+                float(self._burst), self._tokens + (now - self._updated_at) * self._rate
+            )
+
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller has to wait for it."""
+        if self._rate <= 0:
+            return 0.0
+
+        self._refill()
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self._rate
+
+    def cancel(self):
+        self._tokens = min(float(self._burst), self._tokens + 1)
+
+    async def acquire(self):
+        wait = self.reserve()
+
+        if wait <= 0:
+            return
+
+        self._waits += 1
+        self._total_wait += wait
+
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+
+    @property
+    def stats(self) -> dict:
+        self._refill()
+
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 3),
+            "waits": self._waits,
+            "total_wait": round(self._total_wait, 3),
+        }
+
+
+class SafeRequestRateLimiter:
+    """Integration-wide rate limiter keyed by engine code (or host)."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self._rate = rate
+        self._burst = burst
+        self._limits: dict[str, tuple[float, int]] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def key(url: str, key: Optional[str] = None) -> str:
+        if key is not None:
+            return key
+
+        return urlparse(url).netloc
+
+    def configure(self, key: str, rate: float, burst: int):
+        self._limits[key] = (rate, burst)
+
+        if key in self._buckets:
+            self._buckets[key].configure(rate, burst)
+
+        _LOGGER.debug("Rate limit configured %s: %s/s (burst %s)", key, rate, burst)
+
+    def bucket(self, key: str) -> TokenBucket:
+        if key not in self._buckets:
+            rate, burst = self._limits.get(key, (self._rate, self._burst))
+            self._buckets[key] = TokenBucket(rate=rate, burst=burst)
+
+        return self._buckets[key]
+
+    async def acquire(self, url: str, key: Optional[str] = None):
+        await self.bucket(self.key(url, key)).acquire()
+
+    @property
+    def stats(self) -> dict:
+        return {key: bucket.stats for key, bucket in self._buckets.items()}
+
+
+_RATE_LIMITER: Optional[SafeRequestRateLimiter] = None
+
+
+def rate_limiter() -> SafeRequestRateLimiter:
+    global _RATE_LIMITER
+
+    if _RATE_LIMITER is None:
+        _RATE_LIMITER = SafeRequestRateLimiter()
+
+    return _RATE_LIMITER
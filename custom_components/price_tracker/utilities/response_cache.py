@@ -0,0 +1,143 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_MAX_ENTRIES = 512
+_DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class SafeRequestCacheEntry:
+    def __init__(
+        self,
+        key: str,
+        data: str,
+        status_code: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.key = key
+        self.data = data
+        self.status_code = status_code
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = len(data.encode("utf-8", "ignore")) if data is not None else 0
+        self.stored_at = time.monotonic()
+        # Result parsed by the engine from `data`, reused while the body is unchanged
+        self.parsed: any = None
+
+    @property
+    def validators(self) -> dict:
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class SafeRequestResponseCache:
+    """LRU cache of response bodies and their validators (ETag / Last-Modified)."""
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, SafeRequestCacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._stores = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(method: str, url: str, data: any = None) -> str:
+        body = json.dumps(data, sort_keys=True, default=str) if data is not None else ""
+
+        return "{} {} {}".format(
+            method.upper(), url, hashlib.sha1(body.encode("utf-8")).hexdigest()
+        )
+
+    def get(self, key: str) -> Optional[SafeRequestCacheEntry]:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def hit(self, entry: SafeRequestCacheEntry):
+        self._hits += 1
+        entry.stored_at = time.monotonic()
+
+    def store(
+        self,
+        key: str,
+        data: str,
+        status_code: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> SafeRequestCacheEntry:
+        self._stores += 1
+        self.remove(key)
+
+        entry = SafeRequestCacheEntry(
+            key=key,
+            data=data,
+            status_code=status_code,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._evict()
+
+        return entry
+
+    def remove(self, key: str):
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self):
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self._hits,
+            "stores": self._stores,
+            "evictions": self._evictions,
+        }
+
+
+_RESPONSE_CACHE: Optional[SafeRequestResponseCache] = None
+
+
+def response_cache() -> SafeRequestResponseCache:
+    global _RESPONSE_CACHE
+
+    if _RESPONSE_CACHE is None:
+        _RESPONSE_CACHE = SafeRequestResponseCache()
+
+    return _RESPONSE_CACHE
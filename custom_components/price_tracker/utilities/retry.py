@@ -0,0 +1,197 @@
+import dataclasses
+import logging
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SafeRequestRetryReason(Enum):
+    RATE_LIMITED = "rate_limited"
+    SERVER_ERROR = "server_error"
+    CLIENT_ERROR = "client_error"
+    NETWORK_ERROR = "network_error"
+
+
+@dataclasses.dataclass
+class SafeRequestRetryDecision:
+    url: str
+    attempt: int
+    reason: SafeRequestRetryReason
+    retry: bool
+    delay: float = 0.0
+    status_code: Optional[int] = None
+    retry_after: Optional[float] = None
+    error: Optional[str] = None
+    created_at: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def dict(self):
+        return {
+            "url": self.url,
+            "attempt": self.attempt,
+            "reason": self.reason.value,
+            "retry": self.retry,
+            "delay": self.delay,
+            "status_code": self.status_code,
+            "retry_after": self.retry_after,
+            "error": self.error,
+        }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if value is None or str(value).strip() == "":
+        return None
+
+    value = str(value).strip()
+
+    if value.isnumeric():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class SafeRequestRetryPolicy:
+    """Exponential backoff (full jitter) retry policy for SafeRequest."""
+
+    def __init__(
+        self,
+        max_tries: int = 8,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        rate_limit_delay: float = 5.0,
+        max_retry_after: float = 60.0,
+        max_elapsed: float = 90.0,
+        retry_client_errors: bool = True,
+        history_size: int = 100,
+    ):
+        self.max_tries = max_tries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._multiplier = multiplier
+        self._jitter = jitter
+        self._rate_limit_delay = rate_limit_delay
+        self._max_retry_after = max_retry_after
+        self._max_elapsed = max_elapsed
+        self._retry_client_errors = retry_client_errors
+        self._history: deque[SafeRequestRetryDecision] = deque(maxlen=history_size)
+        self._retries = 0
+        self._give_ups = 0
+        self._total_delay = 0.0
+
+    @staticmethod
+    def classify(status_code: Optional[int]) -> SafeRequestRetryReason:
+        if status_code is None:
+            return SafeRequestRetryReason.NETWORK_ERROR
+        if status_code == 429:
+            return SafeRequestRetryReason.RATE_LIMITED
+        if status_code >= 500:
+            return SafeRequestRetryReason.SERVER_ERROR
+
+        return SafeRequestRetryReason.CLIENT_ERROR
+
+    def backoff(self, attempt: int, base: Optional[float] = None) -> float:
+        base = self._base_delay if base is None else base
+        delay = min(self._max_delay, base * (self._multiplier ** max(0, attempt - 1)))
+
+        return random.uniform(0, delay) if self._jitter else delay
+
+    def decide(
+        self,
+        url: str,
+        attempt: int,
+        max_tries: int,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        error: Optional[Exception] = None,
+    ) -> SafeRequestRetryDecision:
+        reason = self.classify(status_code)
+        retry_after_seconds = parse_retry_after(retry_after)
+        retry = attempt < max_tries
+        delay = 0.0
+
+        if (
+            reason == SafeRequestRetryReason.CLIENT_ERROR
+            and not self._retry_client_errors
+        ):
+            retry = False
+        elif reason == SafeRequestRetryReason.RATE_LIMITED:
+            if retry_after_seconds is not None:
+                # Waiting longer than the caller can afford only adds load; give up
+                retry = retry and retry_after_seconds <= self._max_retry_after
+                delay = retry_after_seconds
+            else:
+                delay = self.backoff(attempt, base=self._rate_limit_delay)
+        elif reason == SafeRequestRetryReason.SERVER_ERROR and retry_after_seconds:
+            delay = min(retry_after_seconds, self._max_retry_after)
+        else:
+            delay = self.backoff(attempt)
+
+        if retry and elapsed + delay > self._max_elapsed:
+            retry = False
+
+        decision = SafeRequestRetryDecision(
+            url=url,
+            attempt=attempt,
+            reason=reason,
+            retry=retry,
+            delay=delay if retry else 0.0,
+            status_code=status_code,
+            retry_after=retry_after_seconds,
+            error=repr(error) if error is not None else None,
+        )
+        self._record(decision)
+
+        return decision
+
+    def _record(self, decision: SafeRequestRetryDecision):
+        self._history.append(decision)
+
+        if decision.retry:
+            self._retries += 1
+            self._total_delay += decision.delay
+        else:
+            self._give_ups += 1
+
+        _LOGGER.debug("Safe request retry decision %s", decision.dict)
+
+    @property
+    def history(self) -> list[SafeRequestRetryDecision]:
+        return list(self._history)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "retries": self._retries,
+            "give_ups": self._give_ups,
+            "total_delay": round(self._total_delay, 3),
+        }
+
+
+_DEFAULT_RETRY_POLICY: Optional[SafeRequestRetryPolicy] = None
+
+
+def default_retry_policy() -> SafeRequestRetryPolicy:
+    global _DEFAULT_RETRY_POLICY
+
+    if _DEFAULT_RETRY_POLICY is None:
+        _DEFAULT_RETRY_POLICY = SafeRequestRetryPolicy()
+
+    return _DEFAULT_RETRY_POLICY
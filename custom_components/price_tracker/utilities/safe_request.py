@@ -1,23 +1,55 @@
 import asyncio
+import copy
 import dataclasses
+import hashlib
 import json
 import logging
 import random
+import time
 from enum import Enum
 from typing import Optional, Callable, Self, Awaitable
 
-import fake_useragent
 from curl_cffi import requests, CurlHttpVersion, CurlSslVersion
 from curl_cffi.requests import Cookies
 from voluptuous import default_factory
 
 from custom_components.price_tracker.utilities.list import Lu
+from custom_components.price_tracker.utilities.parser import parse_json
+from custom_components.price_tracker.utilities.proxy import ProxyManager
+from custom_components.price_tracker.utilities.rate_limit import (
+    SafeRequestRateLimiter,
+    rate_limiter,
+)
+from custom_components.price_tracker.utilities.response_cache import (
+    SafeRequestCacheEntry,
+    SafeRequestResponseCache,
+    response_cache,
+)
+from custom_components.price_tracker.utilities.retry import (
+    SafeRequestRetryDecision,
+    SafeRequestRetryPolicy,
+    default_retry_policy,
+)
+from custom_components.price_tracker.utilities.session_pool import (
+    SafeRequestSessionPool,
+    session_pool,
+)
+from custom_components.price_tracker.utilities.single_flight import single_flight
+from custom_components.price_tracker.utilities.user_agent import user_agent_pool
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class SafeRequestError(Exception):
-    pass
+    def __init__(
+        self,
+        message: str = "",
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class CustomSessionCookie(Cookies):
@@ -36,6 +68,9 @@ class CustomAsyncSession(requests.AsyncSession):
         }
 
 
+_NOT_DECODED = object()
+
+
 @dataclasses.dataclass
 class SafeRequestResponseData:
     data: Optional[str] = default_factory("")
@@ -49,6 +84,11 @@ class SafeRequestResponseData:
         status_code: int = None,
         cookies=None,
         access_token: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        not_modified: bool = False,
+        cache_entry: Optional[SafeRequestCacheEntry] = None,
+        content: Optional[bytes] = None,
     ):
         if cookies is None:
             cookies = {}
@@ -56,6 +96,15 @@ class SafeRequestResponseData:
         self.status_code = status_code
         self.cookies = cookies
         self.access_token = access_token
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = not_modified
+        self.cache_entry = cache_entry
+        # Raw body, decoded straight to JSON without going through `data`
+        self.content = content
+        self._json = _NOT_DECODED
+        # Retry decisions of the request that produced this response
+        self.retries: list[SafeRequestRetryDecision] = []
 
     @property
     def text(self):
@@ -74,14 +123,59 @@ class SafeRequestResponseData:
             and self.data != ""
         )
 
+    @property
+    def parsed(self):
+        """Result remembered for an unchanged (304) body, if any"""
+        if (
+            self.not_modified
+            and self.cache_entry is not None
+            and self.cache_entry.parsed is not None
+        ):
+            # Every caller gets its own copy; parsed results are mutable
+            return copy.deepcopy(self.cache_entry.parsed)
+
+        return None
+
+    def remember(self, parsed):
+        """Keep the parsed result so a later 304 can skip parsing"""
+        if self.cache_entry is not None:
+            self.cache_entry.parsed = copy.deepcopy(parsed)
+
+        return parsed
+
     @property
     def json(self):
+        """Body decoded as JSON (None if it is not JSON); decoded once per response"""
+        if self._json is _NOT_DECODED:
+            self._json = self._decode_json()
+
+        return self._json
+
+    def _decode_json(self):
+        if self.content:
+            try:
+                return parse_json(self.content)
+            except ValueError:
+                # e.g. not UTF-8; the text below is decoded with the response charset
+                pass
+
         try:
-            return json.loads(self.data)
-        except json.JSONDecodeError:
+            return parse_json(self.data)
+        except (TypeError, ValueError):
             return None
 
 
+def _copy_response(response: SafeRequestResponseData) -> SafeRequestResponseData:
+    # Shallow on purpose: the cache entry is shared so remember() still works
+    copied = copy.copy(response)
+    copied.cookies = dict(response.cookies) if response.cookies is not None else {}
+    copied.retries = list(response.retries)
+    # Decoded JSON is mutable; every caller decodes its own
+    copied._json = _NOT_DECODED
+
+    return copied
+
+
 class SafeRequestMethod(Enum):
     POST = "post"
     GET = "get"
@@ -150,7 +244,9 @@ class SafeRequestEngineCurlCffi(SafeRequestEngine):
 
         if response.status_code > 399 and response.status_code != 404:
             raise SafeRequestError(
-                f"Failed to request (curl-cffi) {url} with status code {response.status_code}"
+                f"Failed to request (curl-cffi) {url} with status code {response.status_code}",
+                status_code=response.status_code,
+                retry_after=response.headers.get("Retry-After"),
             )
 
         return SafeRequestResponseData(
@@ -158,6 +254,9 @@ class SafeRequestEngineCurlCffi(SafeRequestEngine):
             status_code=response.status_code,
             cookies=cookies,
             access_token=access_token,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content=response.content,
         )
 
 
@@ -165,7 +264,7 @@ class SafeRequest:
     def __init__(
         self,
         chains: list[SafeRequestEngine] = None,
-        proxies: list[str] = None,
+        proxies: list[str] | ProxyManager = None,
         cookies: dict = None,
         headers: dict = None,
         selenium: Optional[str] = None,
@@ -173,6 +272,11 @@ class SafeRequest:
         impersonate: str = "chrome124",
         version: Optional[CurlHttpVersion] = CurlHttpVersion.V2TLS,
         user_agents: list[str] = None,
+        pool: Optional[SafeRequestSessionPool] = None,
+        retry_policy: Optional[SafeRequestRetryPolicy] = None,
+        rate_limit_key: Optional[str] = None,
+        limiter: Optional[SafeRequestRateLimiter] = None,
+        cache: Optional[SafeRequestResponseCache] = None,
     ):
         if headers is not None:
             self._headers = headers
@@ -191,13 +295,22 @@ class SafeRequest:
             user_agents if user_agents is not None else ["pc", "mobile"]
         )
         self._timeout = 25
-        self._proxies: list[str] = proxies if proxies is not None else []
+        self._proxies: list[str] | ProxyManager = proxies if proxies is not None else []
         self._cookies: dict = cookies if cookies is not None else {}
         self._selenium = selenium
         self._selenium_proxy = selenium_proxy
         self._chains: list[SafeRequestEngine] = []
         self._impersonate = impersonate
         self._version = version
+        self._pool = pool
+        self._retry_policy = (
+            retry_policy if retry_policy is not None else default_retry_policy()
+        )
+        self._retries: list[SafeRequestRetryDecision] = []
+        self._rate_limit_key = rate_limit_key
+        self._limiter = limiter
+        self._cache = cache
+        self._single_flight = True
 
         self._chains = self._chains + (
             [
@@ -291,6 +404,40 @@ class SafeRequest:
 
         return self
 
+    def retry_policy(self, retry_policy: SafeRequestRetryPolicy):
+        """"""
+        self._retry_policy = retry_policy
+
+        return self
+
+    def rate_limit_key(self, key: Optional[str]):
+        """Share a rate limit bucket by key (engine code) instead of host"""
+        self._rate_limit_key = key
+
+        return self
+
+    def cache(self, cache: Optional[SafeRequestResponseCache] = None):
+        """Send conditional requests (ETag / Last-Modified) and reuse cached bodies"""
+        self._cache = cache if cache is not None else response_cache()
+
+        return self
+
+    def single_flight(self, enabled: bool = True):
+        """Share one round trip between concurrent identical requests"""
+        self._single_flight = enabled
+
+        return self
+
+    @property
+    def retries(self) -> list[SafeRequestRetryDecision]:
+        """Retry decisions taken by the last request"""
+        return self._retries
+
+    @property
+    def cookies(self) -> dict:
+        """Cookies sent with (and collected by) this request"""
+        return dict(self._cookies)
+
     def chains(self, chains: list[SafeRequestEngine]):
         """"""
         self._chains = chains
@@ -468,14 +615,17 @@ class SafeRequest:
         """"""
         if proxy is None:
             self._proxies = []
+        elif isinstance(self._proxies, ProxyManager):
+            # Copying the shared manager into a list would drop its health scores
+            raise ValueError("Cannot add a proxy to a shared ProxyManager")
         else:
             self._proxies.append(proxy)
 
         return self
 
-    def proxies(self, proxies: list[str] | str | None):
+    def proxies(self, proxies: list[str] | str | ProxyManager | None):
         """"""
-        if isinstance(proxies, list):
+        if isinstance(proxies, (list, ProxyManager)):
             self._proxies = proxies
         elif isinstance(proxies, str):
             self._proxies = Lu.map([proxies.split(",")], lambda x: x.strip())
@@ -503,6 +653,70 @@ class SafeRequest:
 
         return self
 
+    def _proxy_manager(self) -> Optional[ProxyManager]:
+        if isinstance(self._proxies, ProxyManager):
+            return self._proxies
+
+        if len(self._proxies) > 0:
+            # Plain proxy lists get a throwaway manager (direct connection included)
+            return ProxyManager(proxies=self._proxies)
+
+        return None
+
+    def _resolve_cache(
+        self,
+        key: str,
+        entry: Optional[SafeRequestCacheEntry],
+        response: SafeRequestResponseData,
+    ) -> SafeRequestResponseData:
+        if response.status_code == 304 and entry is not None:
+            self._cache.hit(entry)
+
+            return SafeRequestResponseData(
+                data=entry.data,
+                status_code=entry.status_code,
+                cookies=response.cookies,
+                access_token=response.access_token,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                not_modified=True,
+                cache_entry=entry,
+            )
+
+        if response.has and (
+            response.etag is not None or response.last_modified is not None
+        ):
+            response.cache_entry = self._cache.store(
+                key=key,
+                data=response.data,
+                status_code=response.status_code,
+                etag=response.etag,
+                last_modified=response.last_modified,
+            )
+        elif entry is not None:
+            self._cache.remove(key)
+
+        return response
+
+    def _single_flight_key(self, url: str, method: SafeRequestMethod, data: any):
+        body = json.dumps(data, sort_keys=True, default=str) if data is not None else ""
+        # Requests sent with other cookies or through other proxies are not identical
+        proxies = (
+            self._proxies.proxies
+            if isinstance(self._proxies, ProxyManager)
+            else self._proxies
+        )
+
+        return (
+            "request",
+            method.name,
+            url,
+            hashlib.sha1(body.encode("utf-8")).hexdigest(),
+            self._headers.get("Authorization"),
+            tuple(sorted((str(k), str(v)) for k, v in self._cookies.items())),
+            tuple(proxies),
+        )
+
     async def request(
         self,
         url: str,
@@ -510,72 +724,164 @@ class SafeRequest:
         data: any = None,
         timeout: int = 25,
         raise_errors: bool = False,
-        max_tries: int = 8,
+        max_tries: Optional[int] = None,
         post_try_callables: list[Callable[[Self], Awaitable[None]]] = None,
         retain_cookie=True,
+    ) -> SafeRequestResponseData:
+        async def _request():
+            response = await self._request(
+                url=url,
+                method=method,
+                data=data,
+                timeout=timeout,
+                raise_errors=raise_errors,
+                max_tries=max_tries,
+                post_try_callables=post_try_callables,
+                retain_cookie=retain_cookie,
+            )
+            response.retries = list(self._retries)
+
+            return response
+
+        if not self._single_flight or method not in [
+            SafeRequestMethod.GET,
+            SafeRequestMethod.POST,
+        ]:
+            return await _request()
+
+        response = await single_flight().do(
+            self._single_flight_key(url, method, data),
+            _request,
+            copier=_copy_response,
+        )
+        # Followers see the leader's retries (Kurly re-auth, Smartstore rotation)
+        self._retries = list(response.retries)
+
+        if response.status_code is not None and (
+            response.status_code <= 399 or retain_cookie
+        ):
+            self.cookie(item=response.cookies)
+
+        return response
+
+    async def _request(
+        self,
+        url: str,
+        method: SafeRequestMethod,
+        data: any,
+        timeout: int,
+        raise_errors: bool,
+        max_tries: Optional[int],
+        post_try_callables: Optional[list[Callable[[Self], Awaitable[None]]]],
+        retain_cookie: bool,
     ) -> SafeRequestResponseData:
         errors = []
         return_data = SafeRequestResponseData()
+        policy = self._retry_policy
+        max_tries = max_tries if max_tries is not None else policy.max_tries
+        started_at = time.monotonic()
+        self._retries = []
+
+        pool = self._pool if self._pool is not None else session_pool()
+        limiter = self._limiter if self._limiter is not None else rate_limiter()
+        proxy_manager = self._proxy_manager()
+        cache_key = (
+            self._cache.key(method.name, url, data) if self._cache is not None else None
+        )
+        cache_entry = self._cache.get(cache_key) if self._cache is not None else None
 
-        async with CustomAsyncSession(
-            impersonate=self._impersonate, http_version=self._version
+        async with pool.session(
+            url=url,
+            impersonate=self._impersonate,
+            version=self._version,
+            factory=CustomAsyncSession,
         ) as session:
-            for tries in range(max_tries):
-                if tries >= max_tries:
-                    return return_data
+            for attempt in range(1, max_tries + 1):
+                # Engines rotate through the chains, one chain per attempt
+                chain = self._chains[(attempt - 1) % len(self._chains)]
+
+                if attempt > len(self._chains) and post_try_callables is not None:
+                    for callable_ in post_try_callables:
+                        await callable_(self)
+
+                proxy = proxy_manager.select() if proxy_manager is not None else None
+
+                if bool(self._headers):
+                    if len(self._ua_platforms) > 0:
+                        user_agent = await user_agent_pool().random(self._ua_platforms)
+
+                        if user_agent is not None:
+                            self._headers["User-Agent"] = user_agent
+
+                await limiter.acquire(url=url, key=self._rate_limit_key)
+                requested_at = time.monotonic()
+
+                headers = self._headers if bool(self._headers) else None
+                if cache_entry is not None:
+                    headers = {**(headers or {}), **cache_entry.validators}
+
+                try:
+                    return_data = await chain.request(
+                        headers=headers,
+                        method=method,
+                        url=url,
+                        data=data,
+                        proxy=proxy,
+                        timeout=timeout,
+                        session=session,
+                        cookies=self._cookies,
+                    )
 
-                for chain in self._chains:
-                    if tries >= max_tries:
-                        return return_data
+                    if proxy_manager is not None:
+                        proxy_manager.report_success(
+                            proxy, time.monotonic() - requested_at
+                        )
 
-                    if tries > 0 and post_try_callables is not None:
-                        for callable_ in post_try_callables:
-                            await callable_(self)
+                    if self._cache is not None:
+                        return_data = self._resolve_cache(
+                            cache_key, cache_entry, return_data
+                        )
 
-                    proxy = (
-                        random.choice(self._proxies + [None])
-                        if len(self._proxies) > 0
-                        else None
+                    if return_data.status_code <= 399 or retain_cookie:
+                        self.cookie(item=return_data.cookies)
+
+                    _LOGGER.debug(
+                        "Safe request success with %s [%s] (%s) [Proxy: %s] <%s>",
+                        chain.__class__.__name__,
+                        method.name,
+                        url,
+                        proxy,
+                        self._cookies,
                     )
 
-                    if bool(self._headers):
-                        if len(self._ua_platforms) > 0:
-                            ua_engine = await asyncio.to_thread(
-                                fake_useragent.UserAgent, platforms=self._ua_platforms
-                            )
-
-                            self._headers["User-Agent"] = ua_engine.random
-
-                    try:
-                        return_data = await chain.request(
-                            headers=self._headers if bool(self._headers) else None,
-                            method=method,
-                            url=url,
-                            data=data,
-                            proxy=proxy,
-                            timeout=timeout,
-                            session=session,
-                            cookies=self._cookies,
-                        )
+                    return return_data
+                except Exception as e:
+                    errors.append(e)
+                    status_code = (
+                        e.status_code if isinstance(e, SafeRequestError) else None
+                    )
 
-                        if return_data.status_code <= 399 or retain_cookie:
-                            self.cookie(item=return_data.cookies)
+                    if proxy_manager is not None:
+                        proxy_manager.report_failure(proxy, status_code)
+
+                    decision = policy.decide(
+                        url=url,
+                        attempt=attempt,
+                        max_tries=max_tries,
+                        elapsed=time.monotonic() - started_at,
+                        status_code=status_code,
+                        retry_after=e.retry_after
+                        if isinstance(e, SafeRequestError)
+                        else None,
+                        error=e,
+                    )
+                    self._retries.append(decision)
 
-                        _LOGGER.debug(
-                            "Safe request success with %s [%s] (%s) [Proxy: %s] <%s>",
-                            chain.__class__.__name__,
-                            method.name,
-                            url,
-                            proxy,
-                            self._cookies,
-                        )
+                    if not decision.retry:
+                        break
 
-                        return return_data
-                    except Exception as e:
-                        errors.append(e)
-                        pass
-                    finally:
-                        tries += 1
+                    if decision.delay > 0:
+                        await asyncio.sleep(decision.delay)
 
         if len(errors) > 0 and raise_errors:
             _LOGGER.error(f"Failed to request {url}, {set(Lu.map(errors, lambda x: repr(x)))}")
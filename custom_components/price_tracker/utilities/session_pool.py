@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from curl_cffi import requests
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_MAX_SIZE = 32
+_DEFAULT_IDLE_TIMEOUT = 300  # seconds
+
+
+class SafeRequestSessionPoolEntry:
+    def __init__(self, session: requests.AsyncSession, loop: asyncio.AbstractEventLoop):
+        self.session = session
+        self.loop = loop
+        self.in_use = 0
+        self.last_used_at = time.monotonic()
+
+
+class SafeRequestSessionPool:
+    """Long-lived curl-cffi sessions keyed by host, impersonation and HTTP version."""
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        idle_timeout: float = _DEFAULT_IDLE_TIMEOUT,
+    ):
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._entries: OrderedDict[tuple, SafeRequestSessionPoolEntry] = OrderedDict()
+        self._handshakes = 0
+        self._reuses = 0
+        self._evictions = 0
+        # Unknown until the first session is created
+        self._discard_cookies: Optional[bool] = None
+
+    @staticmethod
+    def key(url: str, impersonate: str, version: any) -> tuple:
+        u = urlparse(url)
+
+        return u.scheme, u.netloc, impersonate, version
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self._entries),
+            "in_use": sum(e.in_use for e in self._entries.values()),
+            "handshakes": self._handshakes,
+            "reuses": self._reuses,
+            "evictions": self._evictions,
+            "pooling": self._discard_cookies is not False,
+        }
+
+    def _create(
+        self,
+        factory: Callable[..., requests.AsyncSession],
+        impersonate: str,
+        version: any,
+    ) -> tuple[requests.AsyncSession, bool]:
+        """Create a session and tell whether it may be shared between requests."""
+        kwargs = {"impersonate": impersonate, "http_version": version}
+
+        if self._discard_cookies is not False:
+            try:
+                # Pooled sessions are shared, so their cookie jar must stay empty
+                session = factory(**kwargs, discard_cookies=True)
+                self._discard_cookies = True
+
+                return session, True
+            except TypeError:
+                self._discard_cookies = False
+                _LOGGER.warning(
+                    "curl-cffi does not support discard_cookies, session pooling is disabled"
+                )
+
+        return factory(**kwargs), False
+
+    @asynccontextmanager
+    async def session(
+        self,
+        url: str,
+        impersonate: str,
+        version: any,
+        factory: Callable[..., requests.AsyncSession],
+    ):
+        loop = asyncio.get_running_loop()
+        # Sessions are bound to the event loop they were first used on
+        key = (*self.key(url, impersonate, version), id(loop))
+        entry = self._entries.get(key)
+
+        if entry is None:
+            session, shared = self._create(factory, impersonate, version)
+            self._handshakes += 1
+
+            if not shared:
+                # The session keeps its cookie jar, so it lives for one request only
+                try:
+                    yield session
+                finally:
+                    await self._close_session(session)
+                return
+
+            entry = SafeRequestSessionPoolEntry(session=session, loop=loop)
+            self._entries[key] = entry
+        else:
+            self._entries.move_to_end(key)
+            self._reuses += 1
+
+        entry.in_use += 1
+        try:
+            yield entry.session
+        finally:
+            entry.in_use -= 1
+            entry.last_used_at = time.monotonic()
+            await self._evict()
+
+    async def _evict(self):
+        now = time.monotonic()
+        targets = []
+
+        for key, entry in self._entries.items():
+            if entry.in_use > 0:
+                continue
+
+            if (
+                entry.loop.is_closed()
+                or now - entry.last_used_at > self._idle_timeout
+                or len(self._entries) - len(targets) > self._max_size
+            ):
+                targets.append(key)
+
+        for key in targets:
+            await self._close_entry(self._entries.pop(key))
+            self._evictions += 1
+
+    @staticmethod
+    async def _close_entry(entry: SafeRequestSessionPoolEntry):
+        if entry.loop.is_closed():
+            return
+
+        await SafeRequestSessionPool._close_session(entry.session)
+
+    @staticmethod
+    async def _close_session(session: requests.AsyncSession):
+        try:
+            await session.close()
+        except Exception as e:
+            _LOGGER.debug("Failed to close pooled session %s", e)
+
+    async def async_close(self):
+        """Close every pooled session (config entry unload)."""
+        _LOGGER.debug("Closing safe request session pool %s", self.stats)
+
+        entries = list(self._entries.values())
+        self._entries.clear()
+
+        for entry in entries:
+            await self._close_entry(entry)
+
+
+_SESSION_POOL: Optional[SafeRequestSessionPool] = None
+
+
+def session_pool() -> SafeRequestSessionPool:
+    global _SESSION_POOL
+
+    if _SESSION_POOL is None:
+        _SESSION_POOL = SafeRequestSessionPool()
+
+    return _SESSION_POOL
+
+
+async def async_close_session_pool():
+    global _SESSION_POOL
+
+    if _SESSION_POOL is not None:
+        pool = _SESSION_POOL
+        _SESSION_POOL = None
+        await pool.async_close()
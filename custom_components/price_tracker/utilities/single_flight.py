@@ -0,0 +1,82 @@
+import asyncio
+import copy
+import logging
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self._executions = 0
+        self._shared = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        copier: Callable[[T], T] = copy.deepcopy,
+    ) -> T:
+        """Run fn once per key; concurrent callers get their own copy of the result"""
+        future = self._calls.get(key)
+
+        if future is not None and not future.get_loop().is_closed():
+            self._shared += 1
+            _LOGGER.debug("Single flight shared %s", key)
+
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # The leader was cancelled, not us; run it ourselves
+                    return await self.do(key, fn, copier)
+                raise
+
+            return copier(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._executions += 1
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark as retrieved; there may be no one else waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+
+            return copier(result)
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._calls),
+            "executions": self._executions,
+            "shared": self._shared,
+        }
+
+
+_SINGLE_FLIGHT: Optional[SingleFlight] = None
+
+
+def single_flight() -> SingleFlight:
+    global _SINGLE_FLIGHT
+
+    if _SINGLE_FLIGHT is None:
+        _SINGLE_FLIGHT = SingleFlight()
+
+    return _SINGLE_FLIGHT
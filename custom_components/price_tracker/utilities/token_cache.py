@@ -0,0 +1,123 @@
+import base64
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Hashable, Optional
+
+from custom_components.price_tracker.utilities.single_flight import SingleFlight
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_TTL = 3600.0  # seconds, when the token does not tell its expiry
+_MIN_REFRESH_MARGIN = 60.0
+_REFRESH_MARGIN_RATIO = 0.1
+
+TokenFetcher = Callable[[], Awaitable[tuple[str, Optional[float]]]]
+
+
+def jwt_expires_in(token: str) -> Optional[float]:
+    """Seconds until the `exp` claim of a JWT, or None if it is not a JWT"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+
+        return float(exp) - time.time()
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class CachedToken:
+    def __init__(self, token: str, ttl: float):
+        self.token = token
+        self.ttl = max(0.0, ttl)
+        self.expires_at = time.monotonic() + self.ttl
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    @property
+    def stale(self) -> bool:
+        """Close enough to expiry to be refreshed before use"""
+        margin = max(_MIN_REFRESH_MARGIN, self.ttl * _REFRESH_MARGIN_RATIO)
+
+        return time.monotonic() >= self.expires_at - margin
+
+
+class TokenCache:
+    """Access tokens shared by every engine of a service, refreshed before expiry."""
+
+    def __init__(self, default_ttl: float = DEFAULT_TOKEN_TTL):
+        self._default_ttl = default_ttl
+        self._tokens: dict[Hashable, CachedToken] = {}
+        self._single_flight = SingleFlight()
+        self._fetches = 0
+        self._hits = 0
+        self._invalidations = 0
+
+    async def get(self, key: Hashable, fetch: TokenFetcher) -> str:
+        """Cached token for key; fetch returns (token, ttl seconds or None)"""
+        cached = self._tokens.get(key)
+
+        if cached is not None and not cached.stale:
+            self._hits += 1
+
+            return cached.token
+
+        try:
+            # Concurrent refreshes of the same key share one auth request
+            return await self._single_flight.do(
+                key, lambda: self._fetch(key, fetch), copier=lambda x: x
+            )
+        except Exception as e:
+            if cached is not None and not cached.expired:
+                _LOGGER.debug("Token refresh of %s failed, keep current %s", key, e)
+
+                return cached.token
+            raise
+
+    async def _fetch(self, key: Hashable, fetch: TokenFetcher) -> str:
+        self._fetches += 1
+        token, ttl = await fetch()
+
+        if ttl is None:
+            ttl = jwt_expires_in(token)
+
+        self._tokens[key] = CachedToken(
+            token=token, ttl=ttl if ttl is not None else self._default_ttl
+        )
+
+        return token
+
+    def invalidate(self, key: Hashable, token: Optional[str] = None):
+        """Drop the token of key (only if it is still `token`, when given)"""
+        cached = self._tokens.get(key)
+
+        if cached is not None and (token is None or cached.token == token):
+            self._invalidations += 1
+            del self._tokens[key]
+
+    def clear(self):
+        self._tokens.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "tokens": len(self._tokens),
+            "hits": self._hits,
+            "fetches": self._fetches,
+            "invalidations": self._invalidations,
+        }
+
+
+_TOKEN_CACHE: Optional[TokenCache] = None
+
+
+def token_cache() -> TokenCache:
+    global _TOKEN_CACHE
+
+    if _TOKEN_CACHE is None:
+        _TOKEN_CACHE = TokenCache()
+
+    return _TOKEN_CACHE
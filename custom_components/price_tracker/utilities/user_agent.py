@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import random
+import threading
+from typing import Optional
+
+import fake_useragent
+
+_LOGGER = logging.getLogger(__name__)
+
+_PLATFORMS = ["pc", "mobile", "tablet"]
+
+
+class UserAgentPool:
+    """Process-wide user agent pool, bucketed by platform and loaded once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Optional[dict[str, list[str]]] = None
+        self._selections: dict[frozenset, tuple[str, ...]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._buckets is not None
+
+    def load(self):
+        """Load the fake-useragent database (blocking, call from an executor)"""
+        with self._lock:
+            if self._buckets is not None:
+                return
+
+            buckets = {platform: [] for platform in _PLATFORMS}
+
+            try:
+                ua = fake_useragent.UserAgent(platforms=_PLATFORMS)
+
+                for item in ua._filter_useragents():
+                    buckets.setdefault(item["type"], []).append(item["useragent"])
+            except Exception as e:
+                # Keep the default User-Agent header rather than retrying per request
+                _LOGGER.warning("Failed to load user agent database %s", e)
+
+            self._buckets = buckets
+
+    async def async_load(self):
+        if self._buckets is None:
+            await asyncio.to_thread(self.load)
+
+    def selection(self, platforms: list[str]) -> tuple[str, ...]:
+        key = frozenset(platforms)
+
+        if key not in self._selections:
+            self._selections[key] = tuple(
+                ua
+                for platform in sorted(key)
+                for ua in (self._buckets or {}).get(platform, [])
+            )
+
+        return self._selections[key]
+
+    async def random(self, platforms: list[str]) -> Optional[str]:
+        await self.async_load()
+        candidates = self.selection(platforms)
+
+        if len(candidates) == 0:
+            return None
+
+        return random.choice(candidates)
+
+
+_USER_AGENT_POOL: Optional[UserAgentPool] = None
+
+
+def user_agent_pool() -> UserAgentPool:
+    global _USER_AGENT_POOL
+
+    if _USER_AGENT_POOL is None:
+        _USER_AGENT_POOL = UserAgentPool()
+
+    return _USER_AGENT_POOL